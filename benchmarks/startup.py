@@ -0,0 +1,89 @@
+"""
+Check that the commands run on every keystroke of the fzf preview, or just to print something, start fast.
+`camb -v` and `camb l` must not import the dictionaries, or the libraries for fetching, parsing and printing them.
+Prints the median time of each command next to that of importing `sqlite3` alone, and exits 1 if a check fails.
+
+Usage: python benchmarks/startup.py [RUNS]
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+HEAVY = [
+    "lxml",
+    "requests",
+    "fake_user_agent",
+    "rich",
+    "cambridge.dicts.cambridge",
+    "cambridge.dicts.webster",
+    "cambridge.dicts.dict",
+]
+
+# Run `camb` in a fresh interpreter, dumping the imported modules on exit
+CAMB = """
+import atexit, json, sys
+atexit.register(lambda: print(json.dumps(sorted(sys.modules)), file=sys.stderr))
+sys.argv = ["camb"] + {argv!r}
+from cambridge.main import main
+main()
+"""
+
+BASELINE = "import sqlite3"
+
+
+def run(code, home):
+    env = dict(os.environ, HOME=home, PYTHONPATH=str(ROOT))
+    start = time.perf_counter()
+    p = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True)
+    elapsed = time.perf_counter() - start
+    return elapsed, p.stderr
+
+
+def imported(stderr):
+    for line in reversed(stderr.splitlines()):
+        if line.startswith("["):
+            return json.loads(line)
+    return []
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    failed = False
+
+    with tempfile.TemporaryDirectory() as home:
+        baseline = statistics.median(run(BASELINE, home)[0] for _ in range(runs))
+        print(f"{'import sqlite3':<16} {baseline * 1000:7.1f} ms")
+
+        for argv in (["-v"], ["l"]):
+            code = CAMB.format(argv=argv)
+            times = []
+            for _ in range(runs):
+                elapsed, stderr = run(code, home)
+                times.append(elapsed)
+
+            modules = imported(stderr)
+            heavy = [m for m in HEAVY if m in modules]
+            median = statistics.median(times)
+            name = "camb " + " ".join(argv)
+            print(f"{name:<16} {median * 1000:7.1f} ms  (+{(median - baseline) * 1000:.1f} ms)")
+
+            if not modules:
+                print(f"  FAILED: {name} didn't run:\n{stderr}")
+                failed = True
+            elif heavy:
+                print(f"  FAILED: {name} imports {', '.join(heavy)}")
+                failed = True
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
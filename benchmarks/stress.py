@@ -0,0 +1,113 @@
+"""
+Check that the pages recorded in benchmarks/fixtures parse the same when parsed concurrently, as a threaded batch
+or the daemon would, as they do one after another: each page is parsed and rendered once serially,
+then many times over across threads in a shuffled order, and every result must match the serial one.
+Exits 1 on any mismatch or error, e.g. if parsing a page leaks state into the parse of another.
+
+Usage: python benchmarks/stress.py [-j THREADS] [-n ROUNDS] [--seed SEED]
+"""
+
+import argparse
+import io
+import json
+import random
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from rich.console import Console  # noqa: E402
+
+from cambridge.dicts import dict, cambridge, webster  # noqa: E402
+from cambridge.entry import dumps  # noqa: E402
+from cambridge.render import render  # noqa: E402
+
+from suite import FIXTURES, load_fixtures, pad  # noqa: E402
+
+
+def make_cases(pages):
+    """Return a list of (name, run), each run parsing a page into what can be compared, e.g. an entry rendered."""
+
+    cases = []
+    statuses = {record["url"]: record["status"] for record in json.loads((FIXTURES / "index.json").read_text())}
+
+    for url, (res_url, text) in pages.items():
+        # The pages of the words found, i.e. neither a 404 of Webster nor redirected to the home page of Cambridge
+        is_webster = url.startswith(webster.WEBSTER_DICT_BASE_URL)
+        is_cambridge = url.startswith(cambridge.CAMBRIDGE_URL + "/dictionary/")
+        if not (is_webster or is_cambridge) or statuses[url] != 200:
+            continue
+        if res_url in (cambridge.CAMBRIDGE_DICT_BASE_URL, cambridge.CAMBRIDGE_DICT_BASE_URL_CN):
+            continue
+
+        for kib in (0, 100):
+            if kib:
+                text = pad(text, kib)
+
+            def run(res_url=res_url, text=text, is_webster=is_webster):
+                # As a batch parses a page, then rendered on a console of its own, not to mix the output of the threads
+                result = dict.parse_page("", res_url, text, is_webster)
+                if result is None:
+                    return None
+                response_word, cached_text, entry = result
+                console = Console(file=io.StringIO(), color_system="truecolor", width=100, highlight=False)
+                console.print(render(entry))
+                return response_word, cached_text, dumps(entry), console.file.getvalue()
+
+            cases.append((f"{url} +{kib} KiB", run))
+
+    res_url, text = pages[webster.WEBSTER_DICT_BASE_URL + "runn"]
+    cases.append((
+        "webster spellcheck",
+        lambda res_url=res_url, text=text: webster.parse_suggestions(webster.parse_dict(text, False, res_url, True).nodes, res_url),
+    ))
+
+    return cases
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check that the recorded pages parse the same concurrently as serially.")
+    parser.add_argument("-j", "--threads", type=int, default=8, help="the number of threads, 8 by default")
+    parser.add_argument("-n", "--rounds", type=int, default=20, help="how many times each page is parsed concurrently")
+    parser.add_argument("--seed", type=int, default=None, help="the seed of the shuffled order, random by default")
+    args = parser.parse_args()
+
+    # Let the threads switch far more often than every 5 ms, so that any state shared between parses is interleaved
+    sys.setswitchinterval(1e-6)
+
+    cases = make_cases(load_fixtures())
+    expected = {name: run() for name, run in cases}
+
+    jobs = [(name, run) for name, run in cases for _ in range(args.rounds)]
+    random.Random(args.seed).shuffle(jobs)
+
+    def check(job):
+        name, run = job
+        try:
+            return name, run() == expected[name]
+        except (SystemExit, Exception) as error:
+            return name, f"{type(error).__name__}: {error}"
+
+    failures = {}
+    with ThreadPoolExecutor(max_workers=args.threads) as pool:
+        for name, ok in pool.map(check, jobs):
+            if ok is not True:
+                failures.setdefault(name, []).append(ok)
+
+    print(f"{len(jobs)} parses of {len(cases)} pages on {args.threads} threads")
+    for name, _ in cases:
+        errors = failures.get(name, [])
+        status = "ok" if not errors else f"{len(errors)}/{args.rounds} MISMATCHED" + next(
+            (f" ({e})" for e in errors if isinstance(e, str)), ""
+        )
+        print(f"  {name:<72} {status}")
+
+    if failures:
+        print("FAILED: the concurrent results differ from the serial ones")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,243 @@
+"""
+Benchmark parsing, printing and caching the pages recorded in benchmarks/fixtures, offline.
+Each case is timed separately and reported as p50/p95 along with the peak memory it allocates,
+then compared with benchmarks/baseline.json. Exits 1 if the p50 of a case is slower than
+the baseline by more than the threshold. Timings differ from machine to machine, so the baseline
+isn't kept in the repo: the first run of each case on a machine saves its baseline, to compare the later runs with.
+Save it again with --save before changing the code, e.g. after pulling others' changes.
+
+Usage: python benchmarks/suite.py [-n RUNS] [-t THRESHOLD] [-k NAME] [--save]
+"""
+
+import argparse
+import contextlib
+import gc
+import io
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+FIXTURES = ROOT / "benchmarks" / "fixtures"
+BASELINE = ROOT / "benchmarks" / "baseline.json"
+
+# Print as on a terminal, so that the cost of styling is measured as well
+os.environ.setdefault("FORCE_COLOR", "1")
+os.environ.setdefault("COLUMNS", "100")
+sys.path.insert(0, str(ROOT))
+
+from cambridge.cache import migrate, delete_word  # noqa: E402
+from cambridge.dicts import dict, cambridge, webster  # noqa: E402
+from cambridge.entry import loads  # noqa: E402
+from cambridge.utils import make_a_tree  # noqa: E402
+
+
+def load_fixtures():
+    """Return the recorded pages as {request url: (final url, text)}."""
+
+    pages = {}
+    for record in json.loads((FIXTURES / "index.json").read_text()):
+        text = (FIXTURES / record["body"]).read_text(encoding="utf-8")
+        pages[record["url"]] = (record["final_url"], text)
+    return pages
+
+
+def pad(text, kib):
+    """
+    Return the page padded to about `kib` KiB with scripts and menus before and after the entry,
+    as real pages are, rather than the fixtures cut down to what the parsers read.
+    """
+
+    menu = '<nav class="hdn"><ul>' + "".join(f'<li class="lp-5"><a href="/{i}"><span class="hw">item {i}</span></a></li>' for i in range(40)) + "</ul></nav>"
+    script = "<script>" + 'var data = {"a": [1, 2, 3]};\n' * 1000 + "</script>"
+    filler = script + menu * 20
+    count = max(1, kib * 1024 // len(filler) // 2)
+    body = text.index(">", text.index("<body")) + 1
+    end = text.index("</body>")
+    return text[:body] + filler * count + text[body:end] + filler * count + text[end:]
+
+
+def make_cases(pages, con, cur):
+    """Return a list of (name, run) to benchmark, each run being one iteration of the case."""
+
+    cases = []
+
+    for name, dict_url, word, kib in (
+        ("cambridge", cambridge.CAMBRIDGE_DICT_BASE_URL, "run", 0),
+        ("cambridge-cn", cambridge.CAMBRIDGE_DICT_BASE_URL_CN, "run", 0),
+        ("cambridge-idiom", cambridge.CAMBRIDGE_DICT_BASE_URL, "break-the-ice", 0),
+        ("cambridge-large", cambridge.CAMBRIDGE_DICT_BASE_URL, "run", 400),
+    ):
+        res_url, text = pages[dict_url + word]
+        if kib:
+            text = pad(text, kib)
+        tree = make_a_tree(text)
+        first_dict = cambridge.parse_first_dict(res_url, tree)
+        response_word = cambridge.parse_response_word(tree)
+        entry = cambridge.parse_entry(first_dict, res_url, response_word)
+        cached_text = cambridge.dump_first_dict(first_dict)
+
+        def parse_page(res_url=res_url, text=text):
+            # As fresh_run does, apart from fetching, printing and caching
+            tree = cambridge.make_an_entry_tree(text)
+            response_word = cambridge.parse_response_word(tree)
+            first_dict = cambridge.parse_first_dict(res_url, tree)
+            cambridge.parse_entry(first_dict, res_url, response_word)
+            cambridge.dump_first_dict(first_dict)
+
+        def parse_cached(res_url=res_url, response_word=response_word, cached_text=cached_text):
+            # As cache_run does for an entry cached in an older shape
+            cambridge.parse_entry(make_a_tree(cached_text), res_url, response_word)
+
+        def parse_and_print(first_dict=first_dict, res_url=res_url, response_word=response_word):
+            entry = cambridge.parse_entry(first_dict, res_url, response_word)
+            cambridge.print_entry(entry, res_url)
+
+        def round_trip(dict_url=dict_url, res_url=res_url, response_word=response_word, text=cached_text, entry=entry):
+            dict.save(con, cur, response_word, response_word, res_url, text, entry, dict_url)
+            data = dict.find_cache(con, cur, response_word, dict_url)
+            loads(data[2])
+            delete_word(con, cur, response_word)
+
+        cases += [
+            (f"{name} make_a_tree", lambda text=text: make_a_tree(text)),
+            (f"{name} make_an_entry_tree", lambda text=text: cambridge.make_an_entry_tree(text)),
+            (f"{name} parse_first_dict", lambda res_url=res_url, text=text: cambridge.parse_first_dict(res_url, make_a_tree(text))),
+            (f"{name} parse_page", parse_page),
+            (f"{name} parse_cached", parse_cached),
+            (f"{name} parse_and_print", parse_and_print),
+            (f"{name} print_entry", lambda entry=entry, res_url=res_url: cambridge.print_entry(entry, res_url)),
+            (f"{name} cache round-trip", round_trip),
+        ]
+
+    res_url, text = pages[cambridge.CAMBRIDGE_SPELLCHECK_URL + "runn"]
+    cases.append(("cambridge spellcheck", lambda res_url=res_url, text=text: cambridge.parse_spellcheck(res_url, text)))
+
+    res_url, web_text = pages[webster.WEBSTER_DICT_BASE_URL + "run"]
+    parsed = webster.parse_dict(web_text, True, res_url, True)
+    nodes, response_word, sub_text = parsed.nodes, parsed.response_word, parsed.sub_text
+    web_entry = webster.parse_entry(nodes, res_url, response_word)
+
+    def web_parse_and_print():
+        entry = webster.parse_entry(nodes, res_url, response_word)
+        webster.print_entry(entry, res_url)
+
+    def web_round_trip():
+        dict.save(con, cur, response_word, response_word, res_url, sub_text, web_entry, webster.WEBSTER_DICT_BASE_URL)
+        data = dict.find_cache(con, cur, response_word, webster.WEBSTER_DICT_BASE_URL)
+        loads(data[2])
+        delete_word(con, cur, response_word)
+
+    cases += [
+        ("webster parse_dict", lambda: webster.parse_dict(web_text, True, res_url, True)),
+        ("webster parse_and_print", web_parse_and_print),
+        ("webster print_entry", lambda: webster.print_entry(web_entry, res_url)),
+        ("webster cache round-trip", web_round_trip),
+    ]
+
+    res_url, text = pages[webster.WEBSTER_DICT_BASE_URL + "runn"]
+    cases.append((
+        "webster spellcheck",
+        lambda res_url=res_url, text=text: webster.parse_suggestions(webster.parse_dict(text, False, res_url, True).nodes, res_url),
+    ))
+
+    res_url, text = pages[webster.WEBSTER_WORD_OF_THE_DAY_URL]
+    cases.append(("webster wod", lambda res_url=res_url, text=text: webster.parse_and_print_wod(res_url, text)))
+
+    return cases
+
+
+def percentile(times, p):
+    times = sorted(times)
+    return times[min(len(times) - 1, round(p / 100 * (len(times) - 1)))]
+
+
+def measure(run, runs):
+    """Return (p50, p95, peak) of the case, in seconds and bytes."""
+
+    run()  # Warm up, e.g. the imports and caches inside
+
+    # Keep the garbage collector, which kicks in at random, out of the timings as timeit does
+    gc.collect()
+    gc.disable()
+    times = []
+    try:
+        for _ in range(runs):
+            start = time.perf_counter()
+            run()
+            times.append(time.perf_counter() - start)
+    finally:
+        gc.enable()
+
+    # Traced apart from the timed runs, which tracemalloc would slow down
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return percentile(times, 50), percentile(times, 95), peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark parsing, printing and caching the recorded pages.")
+    parser.add_argument("-n", "--runs", type=int, default=200, help="the number of timed runs of each case")
+    parser.add_argument(
+        "-t", "--threshold", type=float, default=0.3,
+        help="the ratio of a p50 slower than its baseline to fail on, 0.3 by default",
+    )
+    parser.add_argument("-k", "--keyword", default="", help="only run the cases whose names contain the keyword")
+    parser.add_argument("--save", action="store_true", help="save the results as the new baseline")
+    args = parser.parse_args()
+
+    baseline = json.loads(BASELINE.read_text()) if BASELINE.exists() else {}
+    results = {}
+    failed = False
+
+    with tempfile.TemporaryDirectory() as tmp:
+        con = sqlite3.connect(os.path.join(tmp, "cambridge.db"), detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES)
+        cur = con.cursor()
+        migrate(con)
+
+        cases = [(n, r) for n, r in make_cases(load_fixtures(), con, cur) if args.keyword in n]
+        print(f"{'case':<36} {'p50':>9} {'p95':>9} {'peak':>10}  {'vs baseline':>11}")
+
+        for name, run in cases:
+            # Discard what is printed, though still rendered for the terminal
+            with contextlib.redirect_stdout(io.StringIO()):
+                p50, p95, peak = measure(run, args.runs)
+            results[name] = {"p50_ms": round(p50 * 1000, 4), "p95_ms": round(p95 * 1000, 4), "peak_kib": round(peak / 1024, 1)}
+
+            change = ""
+            if name in baseline:
+                ratio = p50 * 1000 / baseline[name]["p50_ms"] - 1
+                change = f"{ratio:+.0%}"
+                if ratio > args.threshold:
+                    change += "  REGRESSED"
+                    failed = True
+            print(f"{name:<36} {p50 * 1000:6.2f} ms {p95 * 1000:6.2f} ms {peak / 1024:7.1f} KiB  {change:>11}")
+
+        con.close()
+
+    # The cases without a baseline yet, e.g. all of them on the first run on a machine, set their own
+    new = {name: result for name, result in results.items() if name not in baseline}
+    if args.save:
+        baseline.update(results)
+        BASELINE.write_text(json.dumps(baseline, indent=2) + "\n")
+        print(f"Saved the baseline to {BASELINE.relative_to(ROOT)}")
+    elif new:
+        baseline.update(new)
+        BASELINE.write_text(json.dumps(baseline, indent=2) + "\n")
+        print(f"Saved the baseline of {len(new)} new cases to {BASELINE.relative_to(ROOT)}")
+
+    if failed and not args.save:
+        print(f"FAILED: slower than the baseline by more than {args.threshold:.0%}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
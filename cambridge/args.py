@@ -1,19 +1,26 @@
-"""Set, parse, and dispatch terminal arguments."""
+"""
+Set, parse, and dispatch terminal arguments.
+Each sub-command imports the dictionaries, rich, etc. only when it runs, to keep `camb l` and `camb -v` fast.
+"""
 
-import sqlite3
 import logging
 import argparse
 import sys
 
 from .cache import (
     get_response_words,
+    get_words_by_time,
+    get_table_widths,
     get_random_words,
     delete_word,
+    recompress,
+    insert_spell_words,
+    CODEC,
 )
 from .log import logger
+from .errors import FetchError
 from .settings import OP, DICTS, VERSION
-from .dicts import webster, cambridge
-from .console import console, table
+from . import timings, transport
 
 def parse_args():
     parser = argparse.ArgumentParser(
@@ -65,6 +72,22 @@ def parse_args():
         help="randomly list 20 words/phrases you've found before",
     )
 
+    # Add an optional argument for l command
+    parser_lw.add_argument(
+        "-c",
+        "--compress",
+        action="store_true",
+        help="compress the web pages cached before to shrink the cache",
+    )
+
+    # Add an optional argument for l command
+    parser_lw.add_argument(
+        "-w",
+        "--wordlist",
+        metavar="FILE",
+        help="add the words listed in a file, one per line, to the offline spelling suggestions, e.g. /usr/share/dict/words",
+    )
+
 #############
 
     # Add sub-command s
@@ -120,6 +143,32 @@ def parse_args():
         help="look up a word/phrase without showing spelling suggestions if not found",
     )
 
+    # Add an optional argument for s command
+    parser_sw.add_argument(
+        "--timings",
+        nargs="?",
+        const="-",
+        metavar="=FILE",
+        help="print how long each phase of the lookup takes; or with --timings=FILE, append them to FILE as JSON lines (only with '=', as the words after the option are looked up)",
+    )
+
+    # Add mutually exclusive optional arguments for s command
+    transport_sw = parser_sw.add_mutually_exclusive_group()
+    transport_sw.add_argument(
+        "--record",
+        dest="transport",
+        action="store_const",
+        const="record",
+        help="save the fetched web pages into the fixture store, $CAMB_FIXTURES or ~/.cache/cambridge/fixtures",
+    )
+    transport_sw.add_argument(
+        "--replay",
+        dest="transport",
+        action="store_const",
+        const="replay",
+        help="serve the web pages from the fixture store instead of the web",
+    )
+
 #############
 
     # Add sub-command wod
@@ -139,6 +188,76 @@ def parse_args():
         help="list all words of the day",
     )
 
+#############
+
+    # Add sub-command batch
+    parser_bt = sub_parsers.add_parser(
+        "batch",
+        help="look up words/phrases listed in a file, one per line, and cache them",
+    )
+
+    # Make sub-command batch run default funtion of "batch"
+    parser_bt.set_defaults(func=batch)
+
+    # Add positional arguments for batch command
+    parser_bt.add_argument(
+        "file",
+        help='the file listing words/phrases, or "-" to read them from stdin',
+    )
+
+    # Add an optional argument for batch command
+    parser_bt.add_argument(
+        "-w",
+        "--webster",
+        action="store_true",
+        help="look up the words/phrases in Merriam-Webster Dictionary",
+    )
+
+    # Add an optional argument for batch command
+    parser_bt.add_argument(
+        "-c",
+        "--chinese",
+        action="store_true",
+        help="look up the words/phrases in Cambridge Dictionary with Chinese translation",
+    )
+
+    # Add an optional argument for batch command
+    parser_bt.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=8,
+        help="the number of words/phrases fetched at the same time, 8 by default",
+    )
+
+    # Add mutually exclusive optional arguments for batch command
+    transport_bt = parser_bt.add_mutually_exclusive_group()
+    transport_bt.add_argument(
+        "--record",
+        dest="transport",
+        action="store_const",
+        const="record",
+        help="save the fetched web pages into the fixture store, $CAMB_FIXTURES or ~/.cache/cambridge/fixtures",
+    )
+    transport_bt.add_argument(
+        "--replay",
+        dest="transport",
+        action="store_const",
+        const="replay",
+        help="serve the web pages from the fixture store instead of the web",
+    )
+
+#############
+
+    # Add sub-command daemon
+    parser_dm = sub_parsers.add_parser(
+        "daemon",
+        help="keep running in the background to serve lookups faster",
+    )
+
+    # Make sub-command daemon run default funtion of "daemon"
+    parser_dm.set_defaults(func=daemon)
+
 #############
 
     if len(sys.argv) == 1:
@@ -151,7 +270,7 @@ def parse_args():
     elif sys.argv[1] == "-h" or sys.argv[1] == "--help":
             print_help(parser, parser_lw, parser_sw)
 
-    elif sys.argv[1] != "l" and sys.argv[1] != "wod" and len(sys.argv) > 1:
+    elif sys.argv[1] not in ("l", "wod", "batch", "daemon") and len(sys.argv) > 1:
         to_parse = []
         word = []
         for i in sys.argv[1:]:
@@ -160,7 +279,8 @@ def parse_args():
             else:
                 word.append(i)
         to_search = " ".join(word)
-        to_parse.append(to_search)
+        # Put the word first, not to be taken as the value of an option, e.g. "--timings"
+        to_parse.insert(0, to_search)
         args = parser_sw.parse_args(to_parse)
         return args
     else:
@@ -169,6 +289,8 @@ def parse_args():
 
 
 def print_help(parser, parser_lw, parser_sw):
+    from .console import console
+
     parser.print_help()
     console.print("[blue]\nCommand l")
     parser_lw.print_help()
@@ -225,41 +347,78 @@ def list_words(args, con, cur):
             for word in words:
                 delete(word, con, cur)
 
-    elif args.random:
+    elif args.compress:
+        count = recompress(con, cur)
+        print(f"{OP.UPDATED.name} {count} cached web pages by compressing them with {CODEC}")
+
+    elif args.wordlist:
         try:
-            # data is something like [('hello',), ('good',), ('world',)]
-            data = get_random_words(cur)
-        except sqlite3.OperationalError:
+            with open(args.wordlist, encoding="utf-8") as f:
+                words = [line.strip() for line in f if line.strip()]
+        except OSError as error:
+            logger.error(error)
+            sys.exit(1)
+
+        insert_spell_words(con, cur, words, cached=False)
+        print(f"{OP.UPDATED.name} the offline spelling suggestions with {len(words)} words from {args.wordlist}")
+
+    elif args.random:
+        # data is something like [('hello',), ('good',), ('world',)]
+        data = get_random_words(cur)
+        if not data:
             logger.error("You may haven't searched any word yet")
         else:
             print_table(data)
 
-    else:
-        try:
-            # data is something like [('hello',), ('good',), ('world',)]
-            data = get_response_words(cur)
-        except sqlite3.OperationalError:
+    elif args.time:
+        count, widths = get_table_widths(cur)
+        if not count:
             logger.error("You may haven't searched any word yet")
         else:
-            if args.time:
-                data.sort(reverse=False, key=lambda tup: tup[3])
-                print_table(data)
-            else:
-                data.sort()
-                # Not using print_table() is for fzf preview
-                for entry in data:
-                    print(entry[1])
+            print_table(get_words_by_time(cur), widths)
+
+    else:
+        # Not using print_table() is for fzf preview
+        if not print_words(get_response_words(cur)):
+            logger.error("You may haven't searched any word yet")
+
+
+def print_words(rows):
+    """Stream the words to stdout through a large buffer as they come from the query. Return how many are printed."""
+
+    sys.stdout.flush()
+    count = 0
+    try:
+        with open(sys.stdout.fileno(), "w", buffering=1 << 16, encoding=sys.stdout.encoding, closefd=False) as out:
+            for row in rows:
+                out.write(row[0] + "\n")
+                count += 1
+    except BrokenPipeError:
+        # e.g. fzf has quit; stop listing quietly
+        pass
+    return count
+
+
+def print_table(rows, widths=None):
+    """Print the table of words page by page, so that a long table is never built as a whole in memory."""
+
+    from rich.text import Text
+    from .console import console, make_table
 
+    page_size = 100
+    table = make_table(widths)
+    for index, entry in enumerate(rows):
+        if index and index % page_size == 0:
+            console.print(table)
+            table = make_table(widths)
 
-def print_table(data):
-    for index, entry in enumerate(data):
         num = str(index + 1)
         input_word, response_word = entry[0], entry[1]
         if "cambridge" in entry[2]:
             dict_name = DICTS.CAMBRIDGE.name
         else:
             dict_name = DICTS.MERRIAM_WEBSTER.name
-        table.add_row(num, input_word, response_word, dict_name)
+        table.add_row(num, Text(input_word), Text(response_word), dict_name)
     console.print(table)
 
 
@@ -290,10 +449,28 @@ def search_word(args, con, cur):
         print("Webster Dictionary doesn't support English to other language. Try again without -c(--chinese) option")
         sys.exit()
 
-    if is_webster:
-        webster.search_webster(con, cur, input_word, is_fresh, no_suggestions)
-    else:
-        cambridge.search_cambridge(con, cur, input_word, is_fresh, is_ch, no_suggestions)
+    use_transport(args.transport)
+
+    if args.timings:
+        timings.start()
+
+    try:
+        if is_webster:
+            from .dicts import webster
+            webster.search_webster(con, cur, input_word, is_fresh, no_suggestions)
+        else:
+            from .dicts import cambridge
+            cambridge.search_cambridge(con, cur, input_word, is_fresh, is_ch, no_suggestions)
+    except FetchError as error:
+        print(error)
+        sys.exit(1)
+    finally:
+        if args.timings:
+            timings.stop()
+            if args.timings == "-":
+                timings.report()
+            else:
+                timings.dump(args.timings)
 
 
 def wod(args, con, cur):
@@ -302,4 +479,54 @@ def wod(args, con, cur):
 
     # no args supplied
     else:
-        webster.get_wod()
+        from .dicts import webster
+        use_transport()
+        try:
+            webster.get_wod()
+        except FetchError as error:
+            print(error)
+            sys.exit(1)
+
+
+def batch(args, con, cur):
+    if args.webster and args.chinese:
+        print("Webster Dictionary doesn't support English to other language. Try again without -c(--chinese) option")
+        sys.exit()
+
+    if args.file == "-":
+        lines = sys.stdin.read().splitlines()
+    else:
+        try:
+            with open(args.file, encoding="utf-8") as f:
+                lines = f.read().splitlines()
+        except OSError as error:
+            logger.error(error)
+            sys.exit(1)
+
+    # Dedupe the words/phrases, keeping them in order
+    words = {}
+    for line in lines:
+        word = line.strip().strip(".").strip(",").strip()
+        if word and word.lower() not in words:
+            words[word.lower()] = word
+
+    if not words:
+        print("You didn't input any word or phrase.")
+        sys.exit()
+
+    from .dicts import dict
+    use_transport(args.transport)
+    dict.batch_run(con, cur, list(words.values()), args.webster, args.chinese, max(args.jobs, 1))
+
+
+def use_transport(mode=None):
+    try:
+        transport.use(mode)
+    except ValueError as error:
+        logger.error(error)
+        sys.exit(1)
+
+
+def daemon(args, con, cur):
+    from .daemon import serve
+    serve(con, cur)
@@ -1,61 +1,531 @@
 from pathlib import Path
 import datetime
+import hashlib
+import json
 import sqlite3
+import zlib
+
+from . import settings
+from .log import logger
+from .settings import DICTS
+from .spell import deletes
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
 
 dir = Path.home() / ".cache" / "cambridge"
-dir.mkdir(parents=True, exist_ok=True)
 DB = str(dir / "cambridge.db")
 
-current_datetime = datetime.datetime.now()
 
+# ----------Compression----------
+# The fetched html is stored as a compressed BLOB tagged with the codec in the "codec" column.
+# Rows cached before compression have no codec and keep their plain text.
 
-def create_table(con, cur):
-    cur.execute(
-        """CREATE TABLE words (
+CODEC = "zstd" if zstandard is not None else "zlib"
+
+
+def compress(text):
+    data = text.encode("utf-8")
+    if CODEC == "zstd":
+        return zstandard.ZstdCompressor(level=9).compress(data), CODEC
+    return zlib.compress(data, 6), CODEC
+
+
+def decompress(data, codec):
+    if codec is None:
+        return data
+    if codec == "zlib":
+        return zlib.decompress(data).decode("utf-8")
+    if codec == "zstd":
+        if zstandard is None:
+            raise ValueError('Install "zstandard" to read the pages compressed with it')
+        return zstandard.ZstdDecompressor().decompress(data).decode("utf-8")
+    raise ValueError(f'Unknown codec "{codec}"')
+
+
+def readable(codec):
+    """Whether the data compressed with the codec can be read here, e.g. not "zstd" cached on another machine without "zstandard"."""
+
+    return codec is None or codec == "zlib" or (codec == "zstd" and zstandard is not None)
+
+
+def unreadable(url, codec):
+    """Log the page cached with a codec that can't be read here, which then counts as not cached, to be fetched again."""
+
+    logger.debug(f'Skipped the cache of {url}, compressed with "{codec}" which can\'t be read here')
+
+
+def content_hash(text):
+    """Hash the text cached for a page, to tell whether a page fetched again has changed."""
+
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def connect():
+    """Connect to the cache db, creating its directory on first use."""
+
+    dir.mkdir(parents=True, exist_ok=True)
+    return sqlite3.connect(DB, detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES)
+
+
+# ----------Migrations----------
+# Each migration brings the cache db from the version of its index in MIGRATIONS
+# to the next one, which is recorded in the db with "PRAGMA user_version".
+# Append new migrations to the list; never change the ones released.
+
+WORDS_COLUMNS = """
         "input_word" TEXT NOT NULL,
         "response_word" TEXT NOT NULL,
         "created_at" TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
         "response_url" TEXT UNIQUE NOT NULL,
-        "response_text" TEXT NOT NULL,
-        UNIQUE(response_url))"""
+        "response_text" TEXT NOT NULL"""
+
+
+def get_columns(cur, table):
+    cur.execute(f"PRAGMA table_info({table})")
+    return [row[1] for row in cur.fetchall()]
+
+
+def create_table(cur):
+    cur.execute(f"CREATE TABLE IF NOT EXISTS words ({WORDS_COLUMNS})")
+
+
+def add_entry_columns(cur):
+    """Add the columns of parsed entries, unless added by the release that introduced them."""
+
+    columns = get_columns(cur, "words")
+    if "entry" not in columns:
+        cur.execute('ALTER TABLE words ADD COLUMN "entry" TEXT')
+    if "entry_version" not in columns:
+        cur.execute('ALTER TABLE words ADD COLUMN "entry_version" INTEGER')
+
+
+def drop_unique_response_word(cur):
+    """Rebuild the table of v3.6.3 and prior, whose `response_word` column is UNIQUE."""
+
+    cur.execute("PRAGMA index_list(words)")
+    unique_indexes = [row[1] for row in cur.fetchall() if row[2]]
+
+    for index in unique_indexes:
+        cur.execute(f'PRAGMA index_info("{index}")')
+        if [row[2] for row in cur.fetchall()] == ["response_word"]:
+            break
+    else:
+        return
+
+    columns = ", ".join(f'"{c}"' for c in get_columns(cur, "words"))
+    cur.execute(f'CREATE TABLE words_new ({WORDS_COLUMNS}, "entry" TEXT, "entry_version" INTEGER)')
+    cur.execute(f"INSERT INTO words_new ({columns}) SELECT {columns} FROM words")
+    cur.execute("DROP TABLE words")
+    cur.execute("ALTER TABLE words_new RENAME TO words")
+
+
+def create_indexes(cur):
+    """Index the columns looked up by `get_cache` and `delete_word`, and ordered by for `l -t`."""
+
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_words_input_word ON words (input_word)")
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_words_response_word ON words (response_word)")
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_words_created_at ON words (created_at)")
+
+
+def add_codec_column(cur):
+    cur.execute('ALTER TABLE words ADD COLUMN "codec" TEXT')
+
+
+def create_aliases(cur):
+    """
+    Map the words known to lead to a cached page, i.e. input words, response words
+    and the inflections on the page, to its url, per dictionary url.
+    Rows cached before are mapped by their input and response words.
+    """
+
+    cur.execute("""CREATE TABLE IF NOT EXISTS aliases (
+        "alias" TEXT NOT NULL,
+        "dict_url" TEXT NOT NULL,
+        "response_url" TEXT NOT NULL,
+        PRIMARY KEY ("alias", "dict_url"))""")
+
+    cur.execute("SELECT input_word, response_word, response_url FROM words")
+    for input_word, response_word, response_url in cur.fetchall():
+        dict_url = response_url[: response_url.rindex("/") + 1]
+        for word in (input_word, response_word):
+            cur.execute(
+                "INSERT OR IGNORE INTO aliases (alias, dict_url, response_url) VALUES (?, ?, ?)",
+                (word.lower(), dict_url, response_url),
+            )
+
+
+def create_spell_index(cur):
+    """Index the spellings of the words cached before for offline suggestions, see spell.py."""
+
+    cur.execute("""CREATE TABLE IF NOT EXISTS spell_words (
+        "word" TEXT PRIMARY KEY,
+        "cached" INTEGER NOT NULL DEFAULT 0)""")
+    cur.execute("""CREATE TABLE IF NOT EXISTS spell_deletes (
+        "del" TEXT NOT NULL,
+        "word" TEXT NOT NULL,
+        PRIMARY KEY ("del", "word")) WITHOUT ROWID""")
+
+    cur.execute("SELECT DISTINCT response_word FROM words")
+    insert_spell_words(None, cur, [row[0] for row in cur.fetchall()], commit=False)
+
+
+def add_fetched_at_column(cur):
+    """Add when each page was last fetched or revalidated, for how long to serve it from cache, see `dict.cache_run`."""
+
+    cur.execute('ALTER TABLE words ADD COLUMN "fetched_at" TIMESTAMP')
+    cur.execute("UPDATE words SET fetched_at = created_at")
+
+
+def add_validator_columns(cur):
+    """
+    Add the validators of the cached pages to revalidate them with conditional requests, see `dict.fetch`.
+    Rows cached before have none and are fetched in full once more.
+    """
+
+    cur.execute('ALTER TABLE words ADD COLUMN "etag" TEXT')
+    cur.execute('ALTER TABLE words ADD COLUMN "last_modified" TEXT')
+    cur.execute('ALTER TABLE words ADD COLUMN "content_hash" TEXT')
+
+
+def create_misses(cur):
+    """Cache the words not found in each dictionary, with the spelling suggestions fetched for them if any."""
+
+    cur.execute("""CREATE TABLE IF NOT EXISTS misses (
+        "input_word" TEXT NOT NULL,
+        "dict_url" TEXT NOT NULL,
+        "suggestions" TEXT,
+        "created_at" TIMESTAMP NOT NULL,
+        PRIMARY KEY ("input_word", "dict_url"))""")
+
+
+def create_renders(cur):
+    """Cache the output of the pages printed, the latest one for each page along with its color scheme and terminal width, see `dict.cache_run`."""
+
+    cur.execute("""CREATE TABLE IF NOT EXISTS renders (
+        "response_url" TEXT NOT NULL,
+        "theme" TEXT NOT NULL,
+        "width" INTEGER NOT NULL,
+        "output" BLOB NOT NULL,
+        "codec" TEXT,
+        PRIMARY KEY ("response_url", "theme", "width"))""")
+
+
+MIGRATIONS = [
+    create_table,
+    add_entry_columns,
+    drop_unique_response_word,
+    create_indexes,
+    add_codec_column,
+    create_aliases,
+    create_spell_index,
+    add_validator_columns,
+    add_fetched_at_column,
+    create_misses,
+    create_renders,
+]
+
+
+def migrate(con):
+    """Bring the cache db of any older version up to date in one transaction."""
+
+    cur = con.cursor()
+    version = cur.execute("PRAGMA user_version").fetchone()[0]
+    if version >= len(MIGRATIONS):
+        cur.close()
+        return
+
+    try:
+        # Take the write lock before reading the version again, as another process may be migrating the db meanwhile
+        cur.execute("BEGIN IMMEDIATE")
+        version = cur.execute("PRAGMA user_version").fetchone()[0]
+        for migration in MIGRATIONS[version:]:
+            migration(cur)
+        cur.execute(f"PRAGMA user_version = {len(MIGRATIONS)}")
+    except sqlite3.Error:
+        con.rollback()
+        raise
+    else:
+        con.commit()
+    finally:
+        cur.close()
+
+
+def insert_into_table(con, cur, input_word, response_word, url, text, entry, entry_version, etag=None, last_modified=None, commit=True):
+    """Cache the page, or replace the one cached at the url, keeping the word it was first looked up by and when."""
+
+    response_word = response_word.lower()
+    digest = content_hash(text)
+    text, codec = compress(text)
+    current_datetime = datetime.datetime.now()
+    cur.execute(
+        """INSERT INTO words (input_word, response_word, created_at, response_url, response_text, entry, entry_version, codec, etag, last_modified, content_hash, fetched_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT (response_url) DO UPDATE SET
+            response_word = excluded.response_word, response_text = excluded.response_text,
+            entry = excluded.entry, entry_version = excluded.entry_version, codec = excluded.codec,
+            etag = excluded.etag, last_modified = excluded.last_modified, content_hash = excluded.content_hash,
+            fetched_at = excluded.fetched_at""",
+        (input_word, response_word, current_datetime, url, text, entry, entry_version, codec, etag, last_modified, digest, current_datetime),
+    )
+    delete_renders(cur, url)
+    if commit:
+        con.commit()
+
+
+def update_validators(con, cur, url, etag, last_modified, commit=True):
+    """Update the validators of the page revalidated, which counts as fetched now."""
+
+    cur.execute(
+        "UPDATE words SET etag = ?, last_modified = ?, fetched_at = ? WHERE response_url = ?",
+        (etag, last_modified, datetime.datetime.now(), url),
+    )
+    if commit:
+        con.commit()
+
+
+def update_entry(con, cur, url, entry, entry_version):
+    cur.execute(
+        "UPDATE words SET entry = ?, entry_version = ? WHERE response_url = ?",
+        (entry, entry_version, url),
     )
+    delete_renders(cur, url)
     con.commit()
 
 
-# def check_table(cur):
-#     """Check a table exists or not"""
-#
-#     cur.execute("SELECT name FROM sqlite_schema WHERE type='table'")
+def insert_aliases(con, cur, dict_url, response_url, words, forms=(), commit=True):
+    """
+    Map `words` the page is looked up or found by to its url, taking them over from any other page,
+    and `forms` listed on the page, unless they already lead to another page.
+    """
 
+    cur.executemany(
+        "INSERT OR REPLACE INTO aliases (alias, dict_url, response_url) VALUES (?, ?, ?)",
+        [(word.lower(), dict_url, response_url) for word in set(words) if word],
+    )
+    cur.executemany(
+        "INSERT OR IGNORE INTO aliases (alias, dict_url, response_url) VALUES (?, ?, ?)",
+        [(form.lower(), dict_url, response_url) for form in set(forms) if form],
+    )
+    if commit:
+        con.commit()
 
-def insert_into_table(con, cur, input_word, response_word, url, text):
-    response_word = response_word.lower()
+
+def insert_spell_words(con, cur, words, cached=True, commit=True):
+    """Add the words to the index of offline spelling suggestions; `cached` tells they have been looked up."""
+
+    words = {word.lower() for word in words if word}
+    cur.executemany(
+        "INSERT INTO spell_words (word, cached) VALUES (?, ?) ON CONFLICT (word) DO UPDATE SET cached = MAX(cached, excluded.cached)",
+        [(word, int(cached)) for word in words],
+    )
+    cur.executemany(
+        "INSERT OR IGNORE INTO spell_deletes (del, word) VALUES (?, ?)",
+        [(d, word) for word in words for d in deletes(word)],
+    )
+    if commit:
+        con.commit()
+
+
+def get_spell_candidates(cur, word):
+    """Get the words sharing any delete with the word, as tuples (word, cached)."""
+
+    dels = list(deletes(word))
+    cur.execute(
+        f"SELECT DISTINCT w.word, w.cached FROM spell_deletes d JOIN spell_words w ON w.word = d.word WHERE d.del IN ({', '.join('?' * len(dels))})",
+        dels,
+    )
+    return cur.fetchall()
+
+
+def get_cache(con, cur, words, dict_url):
+    """
+    Get the cached page any of `words` leads to in the dictionary, preferring the former words, without its html,
+    which is read by `get_response_text` only if the entry has to be parsed again.
+    """
+
+    words = [word.lower() for word in words]
+    cur.execute(
+        f"SELECT a.alias, w.response_url, w.response_word, w.entry, w.entry_version, w.fetched_at, w.codec FROM aliases a JOIN words w ON w.response_url = a.response_url WHERE a.dict_url = ? AND a.alias IN ({', '.join('?' * len(words))})",
+        (dict_url, *words),
+    )
+    rows = cur.fetchall()
+    if not rows:
+        return None
+
+    _, *data, codec = min(rows, key=lambda row: words.index(row[0]))
+    if not readable(codec):
+        unreadable(data[0], codec)
+        return None
+    return tuple(data)
+
+
+def get_response_text(cur, url):
+    """Get the html cached for the page."""
+
+    cur.execute("SELECT response_text, codec FROM words WHERE response_url = ?", (url,))
+    return decompress(*cur.fetchone())
+
+
+def get_validators(cur, words, dict_url):
+    """
+    Get the validators of the cached page any of `words` leads to in the dictionary, preferring the former words,
+    as a tuple (response_url, etag, last_modified, content_hash) if any, and readable here, not to revalidate a page that can't be read.
+    """
+
+    words = [word.lower() for word in words]
+    cur.execute(
+        f"SELECT a.alias, w.response_url, w.etag, w.last_modified, w.content_hash, w.codec FROM aliases a JOIN words w ON w.response_url = a.response_url WHERE a.dict_url = ? AND a.alias IN ({', '.join('?' * len(words))})",
+        (dict_url, *words),
+    )
+    rows = cur.fetchall()
+    if not rows:
+        return None
+
+    _, *data, codec = min(rows, key=lambda row: words.index(row[0]))
+    if not readable(codec):
+        return None
+    return tuple(data)
+
+
+def insert_miss(con, cur, input_word, dict_url, suggestions=None, commit=True):
+    """Cache the word as not found in the dictionary, with its suggestions from the dictionary if fetched, i.e. not None."""
+
+    now = datetime.datetime.now()
+    # Drop the misses expired by now along the way, not to keep them forever
+    cur.execute("DELETE FROM misses WHERE created_at < ?", (now - datetime.timedelta(days=settings.MISS_TTL),))
+    cur.execute(
+        "INSERT OR REPLACE INTO misses (input_word, dict_url, suggestions, created_at) VALUES (?, ?, ?, ?)",
+        (input_word.lower(), dict_url, None if suggestions is None else json.dumps(suggestions), now),
+    )
+    if commit:
+        con.commit()
+
+
+def get_miss(cur, input_word, dict_url):
+    """
+    Get the word cached as not found in the dictionary within MISS_TTL, as a tuple (suggestions,) if any,
+    where suggestions are None if not fetched yet.
+    """
+
+    cur.execute(
+        "SELECT suggestions FROM misses WHERE input_word = ? AND dict_url = ? AND created_at >= ?",
+        (input_word.lower(), dict_url, datetime.datetime.now() - datetime.timedelta(days=settings.MISS_TTL)),
+    )
+    row = cur.fetchone()
+    if row is None:
+        return None
+    return (None if row[0] is None else json.loads(row[0]),)
+
+
+def delete_misses(con, cur, words, dict_url, commit=True):
+    """Forget the words were not found in the dictionary, once found."""
+
+    cur.executemany(
+        "DELETE FROM misses WHERE input_word = ? AND dict_url = ?",
+        [(word.lower(), dict_url) for word in set(words) if word],
+    )
+    if commit:
+        con.commit()
+
+
+def insert_render(con, cur, url, theme, width, output):
+    """Cache the output of the page, in place of any other cached for it, so that one is kept per page however many widths it's printed at."""
+
+    delete_renders(cur, url)
     cur.execute(
-        "INSERT INTO words (input_word, response_word, created_at, response_url, response_text) VALUES (?, ?, ?, ?, ?)",
-        (input_word, response_word, current_datetime, url, text),
+        "INSERT INTO renders (response_url, theme, width, output, codec) VALUES (?, ?, ?, ?, ?)",
+        (url, theme, width, *compress(output)),
     )
     con.commit()
 
 
-def get_cache(con, cur, word, request_url):
+def get_render(cur, url, theme, width):
+    """Get the output of the page printed before with the color scheme and the terminal width if any."""
+
+    cur.execute(
+        "SELECT output, codec FROM renders WHERE response_url = ? AND theme = ? AND width = ?",
+        (url, theme, width),
+    )
+    row = cur.fetchone()
+    if row is None:
+        return None
+    if not readable(row[1]):
+        unreadable(url, row[1])
+        return None
+    return decompress(*row)
+
+
+def delete_renders(cur, url):
+    """Forget the output of the page, once the page or its entry changes."""
+
+    cur.execute("DELETE FROM renders WHERE response_url = ?", (url,))
+
+
+def get_content_hash(cur, url):
+    """Get the content hash of the page cached, unless it can't be read here, so that `dict.save` writes it anew."""
+
+    cur.execute("SELECT content_hash, codec FROM words WHERE response_url = ?", (url,))
+    row = cur.fetchone()
+    return row[0] if row and readable(row[1]) else None
+
+
+def recompress(con, cur):
+    """
+    Compress the pages cached before, or by another codec, with the current codec. Return how many are done.
+    Those compressed with a codec that can't be read here are left as they are.
+    """
+
+    cur.execute("SELECT rowid, codec FROM words WHERE codec IS NULL OR codec != ?", (CODEC,))
+    rowids = [rowid for rowid, codec in cur.fetchall() if readable(codec)]
+
     try:
-        cur.execute(
-            "SELECT response_url, response_word, response_text FROM words WHERE (response_url = ?) AND (response_word = ? OR input_word = ?)",
-            (request_url, word, word),
-        )
-    except sqlite3.OperationalError:
-        create_table(con, cur)
+        cur.execute("BEGIN")
+        for rowid in rowids:
+            cur.execute("SELECT response_text, codec FROM words WHERE rowid = ?", (rowid,))
+            text = decompress(*cur.fetchone())
+            cur.execute(
+                "UPDATE words SET response_text = ?, codec = ? WHERE rowid = ?",
+                (*compress(text), rowid),
+            )
+    except (sqlite3.Error, ValueError, zlib.error):
+        con.rollback()
+        raise
     else:
-        data = cur.fetchone()
-        return data
+        con.commit()
+
+    # Give the space freed back to the file system
+    if rowids:
+        cur.execute("VACUUM")
+    return len(rowids)
 
 
 def get_response_words(cur):
-    """Get all response words for l command on terminal"""
+    """Get all response words in alphabetical order for l command on terminal, row by row off the index"""
 
-    cur.execute("SELECT input_word, response_word, response_url, created_at FROM words")
-    data = cur.fetchall()
-    return data
+    return cur.execute("SELECT response_word FROM words ORDER BY response_word")
+
+
+def get_words_by_time(cur):
+    """Get all words in chronological order for l -t command on terminal, row by row off the index"""
+
+    return cur.execute("SELECT input_word, response_word, response_url FROM words ORDER BY created_at")
+
+
+def get_table_widths(cur):
+    """Get how many words there are, and how wide each column of l -t or l -r table is to fit them all"""
+
+    cur.execute(
+        "SELECT COUNT(*), MAX(LENGTH(input_word)), MAX(LENGTH(response_word)), MAX(response_url NOT LIKE '%cambridge%') FROM words"
+    )
+    count, input_width, response_width, has_webster = cur.fetchone()
+    if not count:
+        return 0, None
+
+    dict_width = len(DICTS.MERRIAM_WEBSTER.name if has_webster else DICTS.CAMBRIDGE.name)
+    return count, (len(str(count)), input_width, response_width, dict_width)
 
 
 def get_random_words(cur):
@@ -76,6 +546,14 @@ def delete_word(con, cur, word):
     if data == []:
         return (False, None)
     else:
+        cur.execute(
+            "DELETE FROM aliases WHERE response_url IN (SELECT response_url FROM words WHERE input_word = ? OR response_word = ?)",
+            (word, word),
+        )
+        cur.execute(
+            "DELETE FROM renders WHERE response_url IN (SELECT response_url FROM words WHERE input_word = ? OR response_word = ?)",
+            (word, word),
+        )
         cur.execute(
             "DELETE FROM words WHERE input_word = ? OR response_word = ?", (word, word)
         )
@@ -3,13 +3,66 @@ Rich is a Python library for rich text and beautiful formatting in the terminal.
 This script constructs rich console object.
 """
 
+import os
+
 from rich.console import Console
 from rich.table import Table
 
-console = Console(color_system="truecolor", highlight=False)
 
-table = Table()
-table.add_column("No.", style = "white")
-table.add_column("Input Word", style = "yellow")
-table.add_column("Found Word", style = "blue")
-table.add_column("Dictionary", style = "green")
+class CambConsole(Console):
+    def on_broken_pipe(self):
+        # As rich does once the program reading the output has quit, e.g. `head`,
+        # but without leaving /dev/null open for each command run by the daemon
+        self.quiet = True
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, 1)
+        os.close(devnull)
+        raise SystemExit(1)
+
+
+console = CambConsole(color_system="truecolor", highlight=False)
+
+
+def reset():
+    """
+    Set up the console afresh from the environment for each command run by the daemon,
+    i.e. what rich reads of it only once the console is made, e.g. its width by COLUMNS.
+    """
+
+    columns = os.environ.get("COLUMNS", "")
+    lines = os.environ.get("LINES", "")
+    console._width = int(columns) if columns.isdigit() else None
+    console._height = int(lines) if lines.isdigit() else None
+    console.no_color = os.environ.get("NO_COLOR", "") != ""
+
+    interactive = os.environ.get("TTY_INTERACTIVE")
+    if interactive in ("0", "1"):
+        console.is_interactive = interactive == "1"
+    else:
+        console.is_interactive = console.is_terminal and not console.is_dumb_terminal
+
+    # Quiet since a former command's output was cut short, see `on_broken_pipe`
+    console.quiet = False
+
+
+def make_table(widths=None):
+    """
+    Make the table of words. With the `widths` of columns to fit all words, the pages of
+    a long table line up, and rich needn't measure every cell of them.
+    """
+
+    table = Table()
+    headers = (("No.", "white"), ("Input Word", "yellow"), ("Found Word", "blue"), ("Dictionary", "green"))
+    for i, (header, style) in enumerate(headers):
+        width = max(len(header), widths[i]) if widths else None
+        table.add_column(header, style = style, width = width, no_wrap = widths is not None)
+    return table
+
+
+def make_batch_table():
+    table = Table()
+    table.add_column("No.", style = "white")
+    table.add_column("Input Word", style = "yellow")
+    table.add_column("Found Word", style = "blue")
+    table.add_column("Status", style = "green")
+    return table
@@ -0,0 +1,249 @@
+"""
+This script runs `camb` as a daemon listening on a Unix domain socket,
+so that lookups skip the interpreter startup, the imports, opening the cache and connecting to the web.
+`camb <word>` forwards its arguments, working directory and environment along with its stdin, stdout and stderr
+to the daemon if it's running, and the daemon runs the command right on the terminal of the client, as if run there.
+"""
+
+import array
+import json
+import os
+import signal
+import socket
+import sys
+import threading
+from pathlib import Path
+
+SOCKET = str(Path.home() / ".cache" / "cambridge" / "camb.sock")
+
+# The event of the command being run, set by its watcher once its client hangs up meanwhile
+hangup = None
+
+
+class Hangup(KeyboardInterrupt):
+    """Raised in the command run by the daemon once its client hangs up, e.g. stopped by Ctrl-C, as Ctrl-C would."""
+
+
+def connect():
+    """Return a socket connected to the daemon, or None if it isn't running."""
+
+    if not hasattr(socket, "AF_UNIX") or not os.path.exists(SOCKET):
+        return None
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(SOCKET)
+    except OSError:
+        sock.close()
+        return None
+    return sock
+
+
+def forward(argv):
+    """Run the command by the daemon. Return its exit code, or None if the daemon isn't running."""
+
+    sock = connect()
+    if sock is None:
+        return None
+
+    request = {"argv": argv, "cwd": os.getcwd(), "env": dict(os.environ)}
+
+    with sock:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        fds = array.array("i", [0, 1, 2])
+        try:
+            sock.sendmsg([(json.dumps(request) + "\n").encode("utf-8")], [(socket.SOL_SOCKET, socket.SCM_RIGHTS, fds)])
+            reply = sock.makefile("rb").readline()
+        except KeyboardInterrupt:
+            # Closing the connection stops the command in the daemon as well
+            print("\nStopped by user")
+            return 1
+
+    # The daemon stopped halfway
+    if not reply:
+        return 1
+    return json.loads(reply)["code"]
+
+
+def serve(con, cur):
+    """Serve the commands forwarded one after another until stopped."""
+
+    from .log import logger
+
+    sock = connect()
+    if sock is not None:
+        sock.close()
+        logger.error("The daemon is already running")
+        sys.exit(1)
+
+    Path(SOCKET).parent.mkdir(parents=True, exist_ok=True)
+    if os.path.exists(SOCKET):
+        os.unlink(SOCKET)
+
+    # Only the user may connect, from the moment the socket is created
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    umask = os.umask(0o177)
+    try:
+        server.bind(SOCKET)
+    finally:
+        os.umask(umask)
+    server.listen()
+    logger.info(f"Listening on {SOCKET}")
+
+    # Clean up the socket when killed as well
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit())
+    signal.signal(signal.SIGUSR1, on_hangup)
+
+    try:
+        while True:
+            conn, _ = server.accept()
+            with conn:
+                handle(conn, con, cur)
+    finally:
+        server.close()
+        os.unlink(SOCKET)
+
+
+def on_hangup(signum, frame):
+    global hangup
+
+    # A signal of an earlier command's watcher, or pending after its command is done, is ignored
+    if hangup is not None and hangup.is_set():
+        # Raised once for a command
+        hangup = None
+        raise Hangup()
+
+
+def watch(conn, event, main_thread):
+    """Wait for the client to hang up, and if it does before its command is done, stop the command."""
+
+    try:
+        conn.recv(1)
+    except OSError:
+        pass
+    if hangup is event:
+        event.set()
+        signal.pthread_kill(main_thread, signal.SIGUSR1)
+
+
+def handle(conn, con, cur):
+    global hangup
+
+    fds = array.array("i")
+    msg, ancdata, _, _ = conn.recvmsg(65536, socket.CMSG_SPACE(3 * fds.itemsize))
+    for level, type, data in ancdata:
+        if level == socket.SOL_SOCKET and type == socket.SCM_RIGHTS:
+            fds.frombytes(data[: len(data) - (len(data) % fds.itemsize)])
+
+    # The rest of a request longer than the first read, e.g. with a large environment
+    while msg and not msg.endswith(b"\n"):
+        chunk = conn.recv(65536)
+        if not chunk:
+            break
+        msg += chunk
+
+    if len(fds) != 3 or not msg.endswith(b"\n"):
+        for fd in fds:
+            os.close(fd)
+        return
+
+    # Take over the terminal of the client, i.e. its stdin, stdout and stderr, for the command
+    sys.stdout.flush()
+    sys.stderr.flush()
+    saved = [os.dup(i) for i in range(3)]
+    saved_cwd, saved_env = os.getcwd(), dict(os.environ)
+    for i, fd in enumerate(fds):
+        os.dup2(fd, i)
+        os.close(fd)
+
+    event = threading.Event()
+    watcher = threading.Thread(target=watch, args=(conn, event, threading.get_ident()), name="watch", daemon=True)
+    code = 1
+    try:
+        request = json.loads(msg)
+        try:
+            try:
+                hangup = event
+                watcher.start()
+                code = run(request["argv"], con, cur, request["cwd"], request["env"])
+            finally:
+                # Disarmed before giving back the terminal, so that no hangup can stop the restore halfway
+                hangup = None
+        except Hangup:
+            # The client hung up just as its command was done
+            pass
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        for i, fd in enumerate(saved):
+            os.dup2(fd, i)
+            os.close(fd)
+        use_environ(saved_cwd, saved_env)
+
+    try:
+        conn.sendall((json.dumps({"code": code}) + "\n").encode("utf-8"))
+        # Wake up the watcher, not to leave it behind waiting on the connection
+        conn.shutdown(socket.SHUT_RDWR)
+    except OSError:
+        pass
+    if watcher.is_alive():
+        watcher.join()
+
+
+def run(argv, con, cur, cwd, env):
+    """Run a command as `main.main` does, in the working directory and environment of the client. Return its exit code."""
+
+    import logging
+    import traceback
+
+    from .args import parse_args
+
+    logger = logging.getLogger(__package__)
+    level = logger.level
+    sys.argv = ["camb"] + argv
+
+    try:
+        use_environ(cwd, env)
+
+        args = parse_args()
+        if args is not None:
+            args.func(args, con, cur)
+        code = 0
+    except SystemExit as e:
+        if e.code is None or isinstance(e.code, int):
+            code = e.code or 0
+        else:
+            print(e.code, file=sys.stderr)
+            code = 1
+    except Hangup:
+        # Nobody is left to tell
+        code = 1
+    except KeyboardInterrupt:
+        print("\nStopped by user")
+        code = 1
+    except Exception:
+        traceback.print_exc()
+        code = 1
+    finally:
+        # Wait for the printing threads to finish before giving back the terminal,
+        # but not for the daemon threads, e.g. the pages refreshed in the background, which print nothing
+        for thread in threading.enumerate():
+            if thread is not threading.current_thread() and not thread.daemon:
+                thread.join()
+        logger.setLevel(level)
+
+    return code
+
+
+def use_environ(cwd, env):
+    """Change to the working directory and environment, and read again the settings and the console set by the environment."""
+
+    from . import settings
+    from .console import reset
+
+    os.environ.clear()
+    os.environ.update(env)
+    settings.load()
+    reset()
+    os.chdir(cwd)
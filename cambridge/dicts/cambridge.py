@@ -1,20 +1,40 @@
 """Parse and print cambridge dictionary."""
 
-import requests
 import threading
 import sys
+from lxml import etree
+from rich.console import Group
+from rich.text import Text
 from ..console import console
-from ..errors import ParsedNoneError, NoResultError, call_on_error
+from ..errors import ParsedNoneError, NoResultError, FetchError
 from ..settings import OP, DICTS
 from ..log import logger
+from ..entry import (
+    CambridgeEntry,
+    Block,
+    Head,
+    Sense,
+    Definition,
+    Phrase,
+    Example,
+    Idiom,
+    Xref,
+    SeeAlso,
+    Compare,
+    CompareItem,
+)
 from ..utils import (
-    make_a_soup,
+    make_a_tree,
+    make_a_subtree,
+    SubtreeParser,
     get_request_url,
     get_request_url_spellcheck,
     parse_response_url,
     replace_all,
 )
 from ..dicts import dict
+from ..render import render, render_cambridge_blocks, render_dict_head, render_sense, render_block_tail, render_dict_name
+from ..timings import timed, span
 
 CAMBRIDGE_URL = "https://dictionary.cambridge.org"
 CAMBRIDGE_DICT_BASE_URL = CAMBRIDGE_URL + "/dictionary/english/"
@@ -26,142 +46,424 @@ CAMBRIDGE_SPELLCHECK_URL_CN = CAMBRIDGE_URL + "/spellcheck/english-chinese-simpl
 # CAMBRIDGE_SPELLCHECK_URL_CN_TRADITIONAL = CAMBRIDGE_URL + "/spellcheck/english-chinese-traditional/?q="
 
 
+# ----------Selectors----------
+# The parser was written against BeautifulSoup, whose `find("div", "def-block ddef_block")`
+# matches the whole class attribute when given several classes, and one of the classes when given one.
+# The selectors keep those semantics in XPath, compiled once, as lxml is several times faster.
+
+
+def selector(tag, *classes, axis="descendant", first=False):
+    """Compile the XPath of the `tag` elements having any of the `classes` on the `axis`, only the nearest one if `first`."""
+
+    predicates = []
+    for c in classes:
+        if " " in c:
+            predicates.append(f'normalize-space(@class)="{c}"')
+        else:
+            predicates.append(f'contains(concat(" ", normalize-space(@class), " "), " {c} ")')
+
+    path = f"{axis}::{tag}"
+    if predicates:
+        path += f"[{' or '.join(predicates)}]"
+    if first:
+        path += "[1]"
+    return etree.XPath(path)
+
+
+def find(element, selector):
+    """Return the first element selected, or None, like `find` of BeautifulSoup."""
+
+    found = selector(element)
+    return found[0] if found else None
+
+
+def text(element):
+    """Return all the text within the element, like `text` of BeautifulSoup."""
+
+    return "".join(element.itertext())
+
+
+def get_classes(element):
+    """Return the classes of the element as a list, like `attrs["class"]` of BeautifulSoup."""
+
+    return element.attrib["class"].split()
+
+
+TITLE = selector("title", first=True)
+SUPERENTRY = selector("div", "pr di superentry", first=True)
+SMALL = selector("small", first=True)
+STRONG = selector("strong", first=True)
+ANCHOR = selector("a", first=True)
+H3 = selector("h3", first=True)
+H5 = selector("h5", first=True)
+
+SPELLCHECK = selector("div", "hfl-s lt2b lmt-10 lmb-25 lp-s_r-20", first=True)
+SPELLCHECK_LIST = selector("ul", "hul-u")
+SPELLCHECK_ITEM = selector("li")
+PREVIOUS = selector("*", axis="preceding-sibling", first=True)
+
+BLOCKS = selector("div", "pr entry-body__el", "entry-body__el clrd js-share-holder", "pr idiom-block")
+IS_BLOCK = selector("div", "pr entry-body__el", "entry-body__el clrd js-share-holder", "pr idiom-block", axis="self")
+
+HEAD = selector("div", "pos-header dpos-h", first=True)
+HEAD_TITLE = selector("div", "di-title", first=True)
+HEAD_INFO = selector("span", "pos dpos", "lab dlab", "v dv lmr-0")
+HEAD_ANC_INFO = selector("span", "anc-info-head danc-info-head", first=True)
+HEAD_ANC_TITLE = etree.XPath('descendant::span[@title="A word that describes an action, condition or experience."][1]')
+HEAD_POSGRAM = selector("div", "posgram dpos-g hdib lmr-5", first=True)
+PRON_UK = selector("span", "uk dpron-i", first=True)
+PRON_US = selector("span", "us dpron-i", first=True)
+PRON = selector("span", "pron dpron", first=True)
+INFLECTIONS = selector("span", "irreg-infls dinfls", first=True)
+FORMS = selector("b", "inf dinf")
+DOMAIN = selector("span", "domain ddomain", first=True)
+LABEL = selector("span", "lab dlab", first=True)
+NEXT_LABEL = selector("span", "lab dlab", axis="following-sibling", first=True)
+VARIANT = selector("span", "var dvar", first=True)
+NEXT_VARIANT = selector("span", "var dvar", axis="following-sibling", first=True)
+SPELLVAR = selector("span", "spellvar dspellvar", first=True)
+SPELLVARS = selector("span", "spellvar dspellvar")
+
+SENSES = selector("div", "pr dsense", "pr dsense dsense-noh")
+IS_SENSE = selector("div", "pr dsense", "pr dsense dsense-noh", axis="self")
+SENSE_TITLE = selector("h3", "dsense_h", first=True)
+SENSE_BODY = selector("div", "sense-body dsense_b", first=True)
+PHRASE_TITLE = selector("span", "phrase-title dphrase-title", first=True)
+PHRASE_INFO = selector("span", "phrase-info dphrase-info", first=True)
+DEF_BLOCKS = selector("div", "def-block ddef_block")
+DEF_INFO = selector("span", "def-info ddef-info", first=True)
+MEANING = selector("div", "def ddef_d db", first=True)
+MEANING_TRANSLATION = selector("span", "trans dtrans dtrans-se break-cj", first=True)
+EXAMPLES = selector("div", "examp dexamp")
+EXAMPLE = selector("span", "eg deg", first=True)
+EXAMPLE_TRANSLATION = selector("span", "trans dtrans dtrans-se hdb break-cj", first=True)
+GRAM = selector("span", "gram dgram", first=True)
+LU = selector("span", "lu dlu", first=True)
+
+XREF_ITEMS = selector("div", "item lc lc1 lpb-10 lpr-10", "item lc lc1 lc-xs6-12 lpb-10 lpr-10")
+SYNONYM = selector("div", "xref synonym hax dxref-w lmt-25", first=True)
+SYNONYMS = selector("div", "xref synonyms hax dxref-w lmt-25", first=True)
+SEE_ALSO = selector("div", "xref see_also hax dxref-w", first=True)
+SEE_ALSO_LMT = selector("div", "xref see_also hax dxref-w lmt-25", first=True)
+SEE_ALSO_ITEMS = selector("span", "x-h dx-h", "x-p dx-p")
+SEE_ALSO_MODIFIERS = selector("span", "x-pos dx-pos")
+COMPARE_LMT = selector("div", "xref compare hax dxref-w lmt-25", first=True)
+COMPARE = selector("div", "xref compare hax dxref-w", first=True)
+COMPARE_LABEL = selector("span", "x-lab dx-lab", first=True)
+USAGE_NOTE = selector("div", "usagenote dusagenote daccord", first=True)
+USAGE_NOTE_ITEMS = selector("li", "text")
+SOLE_IDIOM = selector("div", "idiom-block", first=True)
+IDIOM = selector("div", "xref idiom hax dxref-w lmt-25 lmb-25", first=True)
+IDIOMS = selector("div", "xref idioms hax dxref-w lmt-25 lmb-25", first=True)
+PHRASAL_VERBS = selector("div", "xref phrasal_verbs hax dxref-w lmt-25 lmb-25", first=True)
+PHRASAL_VERB = selector("div", "xref phrasal_verb hax dxref-w lmt-25 lmb-25", first=True)
+
+
 # ----------Request Web Resource----------
 def search_cambridge(con, cur, input_word, is_fresh=False, is_ch=False, no_suggestions=False):
-    if is_ch:
-        req_url = get_request_url(CAMBRIDGE_DICT_BASE_URL_CN, input_word, DICTS.CAMBRIDGE.name)
-    else:
-        req_url = get_request_url(CAMBRIDGE_DICT_BASE_URL, input_word, DICTS.CAMBRIDGE.name)
+    req_url = get_request_url(get_dict_url(is_ch), input_word, DICTS.CAMBRIDGE.name)
 
     if not is_fresh:
-        cached = dict.cache_run(con, cur, input_word, req_url, DICTS.CAMBRIDGE.name)
-        if not cached:
-            fresh_run(con, cur, req_url, input_word, is_ch, no_suggestions)
+        cached = dict.cache_run(con, cur, input_word, get_dict_url(is_ch), DICTS.CAMBRIDGE.name)
+        if not cached and dict.is_miss(cur, input_word, get_dict_url(is_ch)):
+            not_found(con, cur, input_word, is_ch, no_suggestions)
+        elif not cached:
+            try:
+                fresh_run(con, cur, req_url, input_word, is_ch, no_suggestions)
+            except FetchError:
+                # Serve the page expired in cache, if any, rather than nothing when offline
+                if not dict.cache_run(con, cur, input_word, get_dict_url(is_ch), DICTS.CAMBRIDGE.name, expire=False):
+                    raise
     else:
         fresh_run(con, cur, req_url, input_word, is_ch, no_suggestions)
 
 
-def fetch_cambridge(req_url, input_word, is_ch):
-    """Get response url and response text for later parsing."""
+def get_dict_url(is_ch):
+    if is_ch:
+        return CAMBRIDGE_DICT_BASE_URL_CN
+    return CAMBRIDGE_DICT_BASE_URL
 
-    with requests.Session() as session:
-        session.trust_env = False   # not to use proxy
-        res = dict.fetch(req_url, session)
 
-        if res.url == CAMBRIDGE_DICT_BASE_URL or res.url == CAMBRIDGE_DICT_BASE_URL_CN:
-            logger.debug(f'{OP.NOT_FOUND.name} "{input_word}" in {DICTS.CAMBRIDGE.name}')
-            if is_ch:
-                spell_req_url = get_request_url_spellcheck(CAMBRIDGE_SPELLCHECK_URL_CN, input_word)
-            else:
-                spell_req_url = get_request_url_spellcheck(CAMBRIDGE_SPELLCHECK_URL, input_word)
+def fetch_cambridge(req_url, input_word, is_ch, headers=None, stream=False, printer=None):
+    """
+    Get response url, response text and its validators for later parsing.
+    The response text is None if the page cached is revalidated by the conditional `headers`.
+    With `stream`, the page is parsed as it downloads, only as far as its superentry,
+    and the tree of it is returned instead of the text; the `printer` given, if any, prints the senses meanwhile.
+    """
 
-            spell_res = dict.fetch(spell_req_url, session)
-            spell_res_url = spell_res.url
-            spell_res_text = spell_res.text
-            return False, (spell_res_url, spell_res_text)
+    session = dict.get_session()
+    make_parser = None
+    if printer is not None:
+        make_parser = lambda: SubtreeParser(is_superentry, on_event=printer.restart())  # noqa: E731
+    elif stream:
+        make_parser = lambda: SubtreeParser(is_superentry)  # noqa: E731
+    res = dict.fetch(req_url, session, headers=headers, make_parser=make_parser)
 
-        else:
-            res_url = parse_response_url(res.url)
-            res_text = res.text
+    if res.url == CAMBRIDGE_DICT_BASE_URL or res.url == CAMBRIDGE_DICT_BASE_URL_CN:
+        logger.debug(f'{OP.NOT_FOUND.name} "{input_word}" in {DICTS.CAMBRIDGE.name}')
+        return False, None
 
-            logger.debug(f'{OP.FOUND.name} "{input_word}" in {DICTS.CAMBRIDGE.name} at {res_url}')
-            return True, (res_url, res_text)
+    elif res.status_code == 304:
+        return True, (parse_response_url(res.url), None, dict.get_response_validators(res))
+
+    else:
+        res_url = parse_response_url(res.url)
+        res_text = res.tree if stream else res.text
+
+        logger.debug(f'{OP.FOUND.name} "{input_word}" in {DICTS.CAMBRIDGE.name} at {res_url}')
+        return True, (res_url, res_text, dict.get_response_validators(res))
 
 
 def fresh_run(con, cur, req_url, input_word, is_ch, no_suggestions=False):
     """Print the result without cache."""
 
-    result = fetch_cambridge(req_url, input_word, is_ch)
+    # Refetch the page cached, if any, only if it has changed
+    headers = dict.conditional_headers(cur, input_word, get_dict_url(is_ch))
+    printer = ProgressivePrinter(req_url)
+    result = fetch_cambridge(req_url, input_word, is_ch, headers, stream=True, printer=printer)
     found = result[0]
 
     if found:
-        res_url, res_text = result[1]
-        soup = make_a_soup(res_text)
-        response_word = parse_response_word(soup)
+        res_url, tree, validators = result[1]
+        if tree is None:
+            dict.revalidated(con, cur, input_word, res_url, validators, get_dict_url(is_ch), DICTS.CAMBRIDGE.name)
+            return
+
+        response_word = parse_response_word(tree)
 
-        first_dict = parse_first_dict(res_url, soup)
+        try:
+            first_dict = parse_first_dict(res_url, tree)
+            entry = parse_entry(first_dict, res_url, response_word)
+        except (ParsedNoneError, NoResultError) as error:
+            print(error)
+            sys.exit()
 
-        parse_thread = threading.Thread(target=parse_and_print, args=(first_dict, res_url))
-        parse_thread.start()
-        # parse_thread.join()
+        print_thread = threading.Thread(target=printer.finish, args=(entry,))
+        print_thread.start()
 
-        dict.save(con, cur, input_word, response_word, res_url, str(first_dict))
+        dict.save(con, cur, input_word, response_word, res_url, dump_first_dict(first_dict), entry, get_dict_url(is_ch), validators)
+        print_thread.join()
 
     else:
-        if no_suggestions:
-            sys.exit(-1)
-        else:
-            spell_res_url, spell_res_text = result[1]
+        dict.insert_miss(con, cur, input_word, get_dict_url(is_ch))
+        not_found(con, cur, input_word, is_ch, no_suggestions)
+
 
-            logger.debug(f"{OP.PARSING.name} {spell_res_url}")
-            soup = make_a_soup(spell_res_text)
-            nodes = soup.find("div", "hfl-s lt2b lmt-10 lmb-25 lp-s_r-20")
-            suggestions = []
+def not_found(con, cur, input_word, is_ch, no_suggestions=False):
+    """Print the spelling suggestions for the word not found."""
 
-            if not nodes:
-                print(NoResultError(DICTS.CAMBRIDGE.name))
-                sys.exit()
+    if no_suggestions:
+        sys.exit(-1)
 
-            for ul in nodes.find_all("ul", "hul-u"):
-                if "We have these words with similar spellings or pronunciations:" in ul.find_previous_sibling().text:
-                    for i in ul.find_all("li"):
-                        sug = replace_all(i.text)
-                        suggestions.append(sug)
+    # Offline suggestions are shown at once; those of the spellcheck page are fetched only on demand, and cached
+    suggestions, fetch = dict.cached_suggestions(
+        con, cur, input_word, get_dict_url(is_ch), lambda: fetch_suggestions(input_word, is_ch)
+    )
+    dict.print_spellcheck(con, cur, input_word, suggestions, DICTS.CAMBRIDGE.name, is_ch, fetch_suggestions=fetch)
+
+
+def fetch_suggestions(input_word, is_ch):
+    """Fetch and parse the spelling suggestions on the spellcheck page."""
+
+    if is_ch:
+        spell_req_url = get_request_url_spellcheck(CAMBRIDGE_SPELLCHECK_URL_CN, input_word)
+    else:
+        spell_req_url = get_request_url_spellcheck(CAMBRIDGE_SPELLCHECK_URL, input_word)
 
-            logger.debug(f"{OP.PRINTING.name} the parsed result of {spell_res_url}")
-            dict.print_spellcheck(con, cur, input_word, suggestions, DICTS.CAMBRIDGE.name, is_ch)
+    spell_res = dict.fetch(spell_req_url, dict.get_session())
+    return parse_spellcheck(spell_res.url, spell_res.text)
+
+
+def parse_spellcheck(spell_res_url, spell_res_text):
+    """Parse the spelling suggestions out of the spellcheck page."""
+
+    logger.debug(f"{OP.PARSING.name} {spell_res_url}")
+    tree = make_a_tree(spell_res_text)
+    nodes = find(tree, SPELLCHECK)
+    suggestions = []
+
+    if nodes is None:
+        return suggestions
+
+    for ul in SPELLCHECK_LIST(nodes):
+        if "We have these words with similar spellings or pronunciations:" in text(find(ul, PREVIOUS)):
+            for i in SPELLCHECK_ITEM(ul):
+                sug = replace_all(text(i))
+                suggestions.append(sug)
+
+    logger.debug(f"{OP.PRINTING.name} the parsed result of {spell_res_url}")
+    return suggestions
 
 
 # ----------The Entry Point For Parse And Print----------
 
-def parse_and_print(first_dict, res_url):
-    """Parse and print different sections for the word."""
+@timed(OP.PARSING.name, "entry")
+def parse_entry(first_dict, res_url, response_word=""):
+    """Parse different sections for the word into an entry. Raise `NoResultError` if there is none."""
+
+    blocks = BLOCKS(first_dict)
+    if not blocks:
+        raise NoResultError(DICTS.CAMBRIDGE.name)
+
+    entry = CambridgeEntry(response_word)
+    for block in blocks:
+        b = Block(parse_dict_head(block))
+        entry.blocks.append(b)
+        parse_dict_body(block, b)
+    entry.dict_name = parse_dict_name(first_dict)
+    return entry
+
+
+@timed(OP.PRINTING.name)
+def print_entry(entry, res_url):
+    """Print different sections for the word from its entry."""
 
     logger.debug(f"{OP.PRINTING.name} the parsed result of {res_url}")
 
-    attempt = 0
-    while True:
-        try:
-            blocks = first_dict.find_all(
-                "div", ["pr entry-body__el", "entry-body__el clrd js-share-holder", "pr idiom-block"]
-            )
-        except AttributeError as e:
-            attempt = call_on_error(e, res_url, attempt, OP.RETRY_PARSING.name)
-            continue
-        else:
-            if blocks:
-                for block in blocks:
-                    parse_dict_head(block)
-                    parse_dict_body(block)
-                parse_dict_name(first_dict)
+    console.print(render(entry))
+
+
+class ProgressivePrinter:
+    """
+    Print the entry as its page downloads: the head of a block along with its first sense,
+    then each sense as soon as it's parsed, and what follows the senses once the block closes,
+    so that the first sense shows up without waiting for the rest of the page.
+
+    The events come from `SubtreeParser`, and each part is parsed and rendered just as `print_entry` would,
+    so the parts printed add up to the entry; `finish` prints the rest of it once it's parsed in whole.
+    Blocks or senses nested in one another aren't told apart here, so printing waits for `finish` after one.
+    """
+
+    def __init__(self, res_url):
+        self.res_url = res_url
+        self.out = Text(end="")
+        self.printed = ""  # The plain text printed, kept over the attempts of a fetch
+        self.block = None
+        self.sense = None
+        self.senses = 0
+        self.stalled = False
+
+    def restart(self):
+        """Start over on the page of a new attempt, not printing again what's printed; return the event handler."""
+
+        self.out = Text(end="")
+        self.block = None
+        self.sense = None
+        self.senses = 0
+        return self.on_event
+
+    def on_event(self, event, element):
+        if self.stalled:
+            return
+
+        if IS_BLOCK(element):
+            if event == "start":
+                if self.block is not None:
+                    self.stalled = True
+                    return
+                self.block = element
+                self.senses = 0
+            elif element is self.block:
+                self.end_block()
+
+        elif self.block is not None and IS_SENSE(element):
+            if event == "start":
+                if self.sense is not None:
+                    self.stalled = True
+                    return
+                self.sense = element
+            elif element is self.sense:
+                self.sense = None
+                self.end_sense(element)
+
+    def end_sense(self, element):
+        # Without its header or title, the head of a block is parsed from anywhere in it, known only once it closes
+        if self.senses < 0:
+            return
+        if self.senses == 0:
+            if find(self.block, HEAD) is None or find(self.block, HEAD_TITLE) is None:
+                self.senses = -1
                 return
-            else:
-                print(NoResultError(DICTS.CAMBRIDGE.name))
-                sys.exit()
+            render_dict_head(self.out, parse_dict_head(self.block))
+
+        render_sense(self.out, parse_sense(element))
+        self.senses += 1
+        self.flush()
+
+    def end_block(self):
+        block = self.block
+        subblocks = SENSES(block)
+        if self.senses <= 0:
+            render_dict_head(self.out, parse_dict_head(block))
+            self.senses = 0
+
+        b = Block()
+        for subblock in subblocks[self.senses:]:
+            render_sense(self.out, parse_sense(subblock))
+        parse_block_tail(block, b, has_senses=bool(subblocks))
+        render_block_tail(self.out, b)
+
+        self.block = None
+        self.flush()
+
+    def flush(self):
+        start = len(self.printed)
+        if len(self.out) <= start:
+            return
+        with span(OP.PRINTING.name, "progressive"):
+            console.print(self.out[start:], end="")
+        self.printed += self.out.plain[start:]
+
+    @timed(OP.PRINTING.name)
+    def finish(self, entry):
+        """Print what's left of the entry after the parts printed, or the whole entry if they don't match it."""
+
+        logger.debug(f"{OP.PRINTING.name} the parsed result of {self.res_url}")
+
+        out = render_cambridge_blocks(entry)
+        if out.plain.startswith(self.printed):
+            rest = out[len(self.printed):]
+            rest.end = ""
+            console.print(Group(rest, render_dict_name(entry.dict_name)))
+        else:
+            logger.debug(f"The parts printed of {self.res_url} don't match its entry, printing it in whole")
+            console.print(Group(out, render_dict_name(entry.dict_name)))
 
-def parse_first_dict(res_url, soup):
-    """Parse the dict section of the page for the word."""
 
-    attempt = 0
-    logger.debug(f"{OP.PARSING.name} {res_url}")
+@timed(OP.PARSING.name, "first dict")
+def parse_first_dict(res_url, tree):
+    """Parse the dict section of the page for the word. Raise `ParsedNoneError` if there is none."""
 
-    while True:
-        # first_dict = soup.find("div", "pr dictionary")
-        first_dict = soup.find("div", "pr di superentry")
-        if first_dict is None:
-            attempt = call_on_error(ParsedNoneError(DICTS.CAMBRIDGE.name, res_url), res_url, attempt, OP.RETRY_PARSING.name)
-            continue
-        else:
-            break
+    logger.debug(f"{OP.PARSING.name} {res_url}")
 
+    first_dict = find(tree, SUPERENTRY)
+    if first_dict is None:
+        raise ParsedNoneError(DICTS.CAMBRIDGE.name, res_url)
     return first_dict
 
 
+def is_superentry(element):
+    return element.get("class", "").split() == ["pr", "di", "superentry"]
+
+
+def make_an_entry_tree(res_text):
+    """Parse the page only as far as the first superentry, leaving out what's around it but the title."""
+
+    return make_a_subtree(res_text, is_superentry)
+
+
+def dump_first_dict(first_dict):
+    """Return the html of the dict section to cache, from which the entry can be parsed again."""
+
+    return etree.tostring(first_dict, encoding="unicode", method="html", with_tail=False)
+
+
 # ----------Parse Response Word----------
-def parse_response_word(soup):
+def parse_response_word(tree):
     "Parse the response word from html head title tag."
 
-    temp = soup.find("title").text.split("-")[0].strip()
+    temp = text(find(tree, TITLE)).split("-")[0].strip()
     if "|" in temp:
         response_word = temp.split("|")[0].strip().lower()
 
@@ -181,447 +483,340 @@ def parse_response_word(soup):
 
 
 def parse_head_title(block):
-    word = block.find("div", "di-title").text
+    word = text(find(block, HEAD_TITLE))
     return word
 
 
 def parse_head_info(block):
-    info = block.find_all("span", ["pos dpos", "lab dlab", "v dv lmr-0"])
+    info = HEAD_INFO(block)
     if info:
-        temp = [i.text for i in info]
+        temp = [text(i) for i in info]
         type = temp[0]
-        text = " ".join(temp[1:])
-        return (type, text)
-    return None
+        info_text = " ".join(temp[1:])
+        return [type, info_text]
+    return []
 
 
 def parse_head_type(head):
-    if head.find("span", "anc-info-head danc-info-head"):
-        w_type = (
-            head.find("span", "anc-info-head danc-info-head").text
-            + head.find(
-                "span",
-                attrs={
-                    "title": "A word that describes an action, condition or experience."
-                },
-            ).text
-        )
+    if find(head, HEAD_ANC_INFO) is not None:
+        w_type = text(find(head, HEAD_ANC_INFO)) + text(find(head, HEAD_ANC_TITLE))
         w_type = replace_all(w_type)
-    elif head.find("div", "posgram dpos-g hdib lmr-5"):
-        posgram = head.find("div", "posgram dpos-g hdib lmr-5")
-        w_type = replace_all(posgram.text)
+    elif find(head, HEAD_POSGRAM) is not None:
+        posgram = find(head, HEAD_POSGRAM)
+        w_type = replace_all(text(posgram))
     else:
         w_type = ""
     return w_type
 
 
 def parse_head_pron(head):
-    w_pron_uk = head.find("span", "uk dpron-i").find("span", "pron dpron")
-    if w_pron_uk:
-        w_pron_uk = replace_all(w_pron_uk.text)
-    # In bs4, not found element returns None, not raise error
-    if head.find("span", "us dpron-i"):
-        w_pron_us = head.find("span", "us dpron-i").find("span", "pron dpron")
-        if w_pron_us:
-            w_pron_us = replace_all(w_pron_us.text)
-            console.print(
-                "UK " + w_pron_uk + " US " + w_pron_us, end="  "
-            )
-        else:
-            console.print("UK " + w_pron_uk, end="  ")
+    # The pronunciations are only shown along with a US one, even if it has no "pron dpron" in it
+    pron_us = find(head, PRON_US)
+    if pron_us is None:
+        return "", ""
+
+    w_pron_uk = replace_all(text(find(find(head, PRON_UK), PRON)))
+    w_pron_us = ""
+    pron_us = find(pron_us, PRON)
+    if pron_us is not None:
+        w_pron_us = replace_all(text(pron_us))
+    return w_pron_uk, w_pron_us
 
 
 def parse_head_tense(head):
-    w_tense = replace_all(head.find("span", "irreg-infls dinfls").text)
-    console.print(w_tense, end="  ")
+    w_tense = replace_all(text(find(head, INFLECTIONS)))
+    return w_tense
+
+
+def parse_head_forms(head):
+    forms = FORMS(find(head, INFLECTIONS))
+    return [text(form).strip() for form in forms]
 
 
 def parse_head_domain(head):
-    domain = replace_all(head.find("span", "domain ddomain").text)
-    console.print(domain, end="  ")
+    domain = replace_all(text(find(head, DOMAIN)))
+    return domain
 
 
 def parse_head_usage(head):
-    head_usage = head.find("span", "lab dlab")
+    head_usage = find(head, LABEL)
 
-    # NOTE: <span class = "var dvar"> </span>, attrs["class"] returns a list
-    if head_usage is not None and head_usage.parent.attrs["class"] != ["var", "dvar"]:
-        w_usage = replace_all(head_usage.text)
+    # NOTE: <span class = "var dvar"> </span>
+    if head_usage is not None and get_classes(head_usage.getparent()) != ["var", "dvar"]:
+        w_usage = replace_all(text(head_usage))
         return w_usage
 
-    head_usage_next = head.find_next_sibling("span", "lab dlab")
-    if head_usage_next is not None and head_usage_next.parent.attrs["class"] != ["var", "dvar"]:
-        w_usage_next= replace_all(head_usage_next.text)
+    head_usage_next = find(head, NEXT_LABEL)
+    if head_usage_next is not None and get_classes(head_usage_next.getparent()) != ["var", "dvar"]:
+        w_usage_next= replace_all(text(head_usage_next))
         return w_usage_next
 
     return ""
 
 
 def parse_head_var(head):
-    if head.find("span", "var dvar"):
-        w_var = replace_all(head.find("span", "var dvar").text)
-        console.print(w_var, end="  ")
-    if head.find_next_sibling("span", "var dvar"):
-        w_var = replace_all(head.find_next_sibling("span", "var dvar").text)
-        console.print(w_var, end="  ")
+    w_vars = []
+    if find(head, VARIANT) is not None:
+        w_vars.append(replace_all(text(find(head, VARIANT))))
+    if find(head, NEXT_VARIANT) is not None:
+        w_vars.append(replace_all(text(find(head, NEXT_VARIANT))))
+    return w_vars
 
 
 def parse_head_spellvar(head):
-    for i in head.find_all("span", "spellvar dspellvar"):
-        spell_var = replace_all(i.text)
-        console.print(spell_var, end="  ")
+    return [replace_all(text(i)) for i in SPELLVARS(head)]
 
 
 def parse_dict_head(block):
-    head = block.find("div", "pos-header dpos-h")
+    head = find(block, HEAD)
     word = parse_head_title(block)
     info = parse_head_info(block)
 
-    if head:
-        head = block.find("div", "pos-header dpos-h")
-        w_type = parse_head_type(head)
-        usage = parse_head_usage(head)
+    if head is None:
+        return Head(word=word, info=info, has_header=False)
 
-        if not word:
-            word = parse_head_title(head)
-        if w_type:
-            console.print(
-                f"\n[bold #0A1B27 on #F4f4f4]{word}[/bold #0A1B27 on #F4f4f4]  {w_type} {usage}"
-            )
-        if head.find("span", "uk dpron-i"):
-            if head.find("span", "uk dpron-i").find("span", "pron dpron"):
-                parse_head_pron(head)
+    if not word:
+        word = parse_head_title(head)
 
-        if head.find("span", "irreg-infls dinfls"):
-            parse_head_tense(head)
+    dict_head = Head(word=word, pos=parse_head_type(head), usage=parse_head_usage(head))
 
-        if head.find("span", "domain ddomain"):
-            parse_head_domain(head)
+    pron_uk = find(head, PRON_UK)
+    if pron_uk is not None:
+        if find(pron_uk, PRON) is not None:
+            dict_head.pron_uk, dict_head.pron_us = parse_head_pron(head)
 
-        parse_head_var(head)
+    if find(head, INFLECTIONS) is not None:
+        dict_head.inflections = parse_head_tense(head)
+        dict_head.forms = parse_head_forms(head)
 
-        if head.find("span", "spellvar dspellvar"):
-            parse_head_spellvar(head)
+    if find(head, DOMAIN) is not None:
+        dict_head.domain = parse_head_domain(head)
 
-        print()
-    else:
-        console.print("[bold #0A1B27 on #F4F4F4]" + word)
-        if info:
-            console.print(f"{info[0]} {info[1]}")
+    dict_head.variants = parse_head_var(head)
+
+    if find(head, SPELLVAR) is not None:
+        dict_head.spellvars = parse_head_spellvar(head)
+
+    return dict_head
 
 
 # ----------Parse Dict Body----------
 def parse_def_title(block):
-    d_title = replace_all(block.find("h3", "dsense_h").text)
-    console.print("[#ff8c00]" + "\n" + d_title)
+    d_title = replace_all(text(find(block, SENSE_TITLE)))
+    return d_title
 
 
 def parse_ptitle(block):
-    p_title = block.find("span", "phrase-title dphrase-title").text
-    if block.find("span", "phrase-info dphrase-info"):
-        phrase_info = replace_all(
-            block.find("span", "phrase-info dphrase-info").text
-        )
-        print(f"\n\033[1m  {p_title}\33[0m {phrase_info}")
-    else:
-        print(f"\n\033[1m  {p_title}\033[0m")
+    p_title = text(find(block, PHRASE_TITLE))
+    phrase_info = ""
+    if find(block, PHRASE_INFO) is not None:
+        phrase_info = replace_all(text(find(block, PHRASE_INFO)))
+    return Phrase(p_title, phrase_info)
 
 
 def parse_def_info(def_block):
-    def_info = replace_all(def_block.find("span", "def-info ddef-info").text)
-    if def_info:
-        if "phrase-body" in def_block.parent.attrs["class"]:
-            print("  " + "\033[1m" + def_info + " " + "\033[0m", end="")
-        else:
-            print(def_info + " ", end="")
+    def_info = replace_all(text(find(def_block, DEF_INFO)))
+    return def_info
 
 
 def parse_meaning(def_block):
-    meaning_b = def_block.find("div", "def ddef_d db")
-    if meaning_b.find("span", "lab dlab"):
-        usage_b = meaning_b.find("span", "lab dlab")
-        usage = replace_all(usage_b.text)
-        meaning_words = replace_all(meaning_b.text).split(usage)[-1]
-        print(usage + "\033[34m" + meaning_words + "\033[0m")
+    meaning_b = find(def_block, MEANING)
+    if find(meaning_b, LABEL) is not None:
+        usage_b = find(meaning_b, LABEL)
+        usage = replace_all(text(usage_b))
+        meaning_words = replace_all(text(meaning_b)).split(usage)[-1]
     else:
-        meaning_words = replace_all(meaning_b.text)
-        print("\033[34m" + meaning_words + "\033[0m")
-
-    # Print the meaning's specific language translation if any
-    meaning_lan = def_block.find("span", "trans dtrans dtrans-se break-cj")
-    if meaning_lan:
-        meaning_lan_words = meaning_lan.text
-        print(meaning_lan_words)
-
-
-def parse_pmeaning(def_block):
-    meaning_b = def_block.find("div", "def ddef_d db")
-    if meaning_b.find("span", "lab dlab"):
-        usage_b = meaning_b.find("span", "lab dlab")
-        usage = replace_all(usage_b.text)
-        meaning_words = replace_all(meaning_b.text).split(usage)[-1]
-        print("  " + usage + "\033[34m" + meaning_words + "\033[0m")
-    else:
-        meaning_words = replace_all(meaning_b.text)
-        print("  " + "\033[34m" + meaning_words + "\033[0m")
-
-    # Print the meaning's specific language translation if any
-    meaning_lan = def_block.find("span", "trans dtrans dtrans-se break-cj")
-    if meaning_lan:
-        meaning_lan_words = meaning_lan.text
-        print("  " + meaning_lan_words)
-
-
-def parse_example(def_block):
-    # NOTE:
-    # suppose the first "if" has already run
-    # and, the second is also "if", rather than "elif"
-    # then, codes under "else" will also be run
-    # meaning two cases took effect at the same time, which is not wanted
-    # so, for exclusive cases, you can't write two "ifs" and one "else"
-    # it should be one "if", one "elif", and one "else"
-    # or three "ifs"
-    for e in def_block.find_all("div", "examp dexamp"):
-        if e is not None:
-            example = replace_all(e.find("span", "eg deg").text)
-
-            # Print the exmaple's specific language translation if any
-            example_lan = e.find("span", "trans dtrans dtrans-se hdb break-cj")
-            if example_lan is not None:
-                example_lan_sent = example_lan.text
-            else:
-                example_lan_sent = ""
-
-            if e.find("span", "lab dlab"):
-                lab = replace_all(e.find("span", "lab dlab").text)
-                console.print(
-                    "[#757575]"
-                    + "  • "
-                    + "[/#757575]"
-                    + lab
-                    + " "
-                    + "[#757575]"
-                    + example
-                    + " "
-                    + example_lan_sent
-                )
-            elif e.find("span", "gram dgram"):
-                gram = replace_all(e.find("span", "gram dgram").text)
-                console.print(
-                    "[#757575]"
-                    + "  • "
-                    + "[/#757575]"
-                    + gram
-                    + " "
-                    + "[#757575]"
-                    + example
-                    + " "
-                    + example_lan_sent
-                )
-            elif e.find("span", "lu dlu"):
-                lu = replace_all(e.find("span", "lu dlu").text)
-                console.print(
-                    "[#757575]"
-                    + "  • "
-                    + "[/#757575]"
-                    + lu
-                    + " "
-                    + "[#757575]"
-                    + example
-                    + " "
-                    + example_lan_sent
-                )
-            else:
-                console.print("[#757575]" + "  • " + example + " " + example_lan_sent)
+        usage = ""
+        meaning_words = replace_all(text(meaning_b))
+
+    # The meaning's specific language translation if any
+    meaning_lan = find(def_block, MEANING_TRANSLATION)
+    meaning_lan_words = text(meaning_lan) if meaning_lan is not None else ""
+
+    return usage, meaning_words, meaning_lan_words
+
+
+def parse_example(def_block, examples):
+    for e in EXAMPLES(def_block):
+        example = replace_all(text(find(e, EXAMPLE)))
+
+        # The exmaple's specific language translation if any
+        example_lan = find(e, EXAMPLE_TRANSLATION)
+        if example_lan is not None:
+            example_lan_sent = text(example_lan)
+        else:
+            example_lan_sent = ""
+
+        # NOTE: the label cases are exclusive, keep them one "if" and "elifs"
+        if find(e, LABEL) is not None:
+            label = replace_all(text(find(e, LABEL)))
+        elif find(e, GRAM) is not None:
+            label = replace_all(text(find(e, GRAM)))
+        elif find(e, LU) is not None:
+            label = replace_all(text(find(e, LU)))
+        else:
+            label = ""
+
+        examples.append(Example(example, label, example_lan_sent))
 
 
 def parse_synonym(def_block):
-    if def_block.find("div", "xref synonym hax dxref-w lmt-25"):
-        s_block = def_block.find("div", "xref synonym hax dxref-w lmt-25")
+    if find(def_block, SYNONYM) is not None:
+        s_block = find(def_block, SYNONYM)
     else:
-        s_block = def_block.find("div", "xref synonyms hax dxref-w lmt-25")
+        s_block = find(def_block, SYNONYMS)
 
     if s_block is not None:
-        s_title = s_block.strong.text.upper()
-        console.print("[bold #757575]" + "\n  " + s_title)
-        for s in s_block.find_all(
-                "div", ["item lc lc1 lpb-10 lpr-10", "item lc lc1 lc-xs6-12 lpb-10 lpr-10"]
-        ):
-            s = s.text
-            console.print("[#757575]" + "  • " + s)
+        s_title = text(find(s_block, STRONG)).upper()
+        synonyms = Xref(s_title)
+        for s in XREF_ITEMS(s_block):
+            synonyms.items.append(text(s))
+        return synonyms
 
 
 def parse_see_also(def_block):
-    if def_block.find("div", "xref see_also hax dxref-w"):
-        see_also_block = def_block.find("div", "xref see_also hax dxref-w")
-    elif def_block.find("div", "xref see_also hax dxref-w lmt-25"):
-        see_also_block = def_block.find("div", "xref see_also hax dxref-w lmt-25")
+    if find(def_block, SEE_ALSO) is not None:
+        see_also_block = find(def_block, SEE_ALSO)
+    elif find(def_block, SEE_ALSO_LMT) is not None:
+        see_also_block = find(def_block, SEE_ALSO_LMT)
     else:
-        return
-    see_also = see_also_block.strong.text.upper()
-    console.print("[bold]" + "\n  " + see_also)
-    items = see_also_block.find_all("span", ["x-h dx-h", "x-p dx-p"])
-    for item in items:
-        console.print("[#757575]  " + item.text, end = " ")
-    modifiers = see_also_block.find_all("span", "x-pos dx-pos")
-    for mod in modifiers:
-        console.print(mod.text, end = " ")
-
-    print()
+        return None
+    see_also = text(find(see_also_block, STRONG)).upper()
+    items = SEE_ALSO_ITEMS(see_also_block)
+    modifiers = SEE_ALSO_MODIFIERS(see_also_block)
+    return SeeAlso(see_also, [text(i) for i in items], [text(m) for m in modifiers])
 
 
 def parse_compare(def_block):
-    if def_block.find("div", "xref compare hax dxref-w lmt-25"):
-        compare_block = def_block.find("div", "xref compare hax dxref-w lmt-25")
+    if find(def_block, COMPARE_LMT) is not None:
+        compare_block = find(def_block, COMPARE_LMT)
     else:
-        compare_block = def_block.find("div", "xref compare hax dxref-w")
+        compare_block = find(def_block, COMPARE)
 
     if compare_block is not None:
-        compare = compare_block.strong.text.upper()
-        console.print("[bold #757575]" + "\n  " + compare)
-        for word in compare_block.find_all(
-            "div", ["item lc lc1 lpb-10 lpr-10", "item lc lc1 lc-xs6-12 lpb-10 lpr-10"]
-        ):
-            item = word.a.text
-            usage = word.find("span", "x-lab dx-lab")
-            if usage:
-                usage = usage.text
-                console.print("[#757575]" + "  • " + item + "[/#757575]" + usage)
-            else:
-                console.print("[#757575]" + "  • " + item)
+        compare = Compare(text(find(compare_block, STRONG)).upper())
+        for word in XREF_ITEMS(compare_block):
+            item = text(find(word, ANCHOR))
+            usage = find(word, COMPARE_LABEL)
+            compare.items.append(CompareItem(item, text(usage) if usage is not None else ""))
+        return compare
 
 
 def parse_usage_note(def_block):
-    usage_block = def_block.find("div", "usagenote dusagenote daccord")
-    usagenote = usage_block.h5.text
-    console.print("[bold #757575]" + "\n  " + usagenote)
-    for item in usage_block.find_all("li", "text"):
-        item = item.text
-        console.print("[#757575]" + "    " + item)
-
-
-def parse_def(def_block):
-    parse_def_info(def_block)
-    if "phrase-body" in def_block.parent.attrs["class"]:
-        parse_pmeaning(def_block)
-    else:
-        parse_meaning(def_block)
-    parse_example(def_block)
-
-    if def_block.find(
-        "div", ["xref synonym hax dxref-w lmt-25", "xref synonyms hax dxref-w lmt-25"]
-    ):
-        parse_synonym(def_block)
-    if def_block.find(
-        "div", ["xref see_also hax dxref-w", "xref see_also hax dxref-w lmt-25"]
-    ):
-        parse_see_also(def_block)
-    if def_block.find(
-        "div", ["xref compare hax dxref-w lmt-25", "xref compare hax dxref-w"]
-    ):
-        parse_compare(def_block)
-    if def_block.find("div", "usagenote dusagenote daccord"):
-        parse_usage_note(def_block)
+    usage_block = find(def_block, USAGE_NOTE)
+    usagenote = text(find(usage_block, H5))
+    return Xref(usagenote, [text(item) for item in USAGE_NOTE_ITEMS(usage_block)])
+
+
+def parse_def(def_block, definitions):
+    info = parse_def_info(def_block)
+    usage, meaning, translation = parse_meaning(def_block)
+    in_phrase = "phrase-body" in get_classes(def_block.getparent())
+
+    definition = Definition(info, usage, meaning, translation, in_phrase)
+    definitions.append(definition)
+
+    parse_example(def_block, definition.examples)
+
+    if find(def_block, SYNONYM) is not None or find(def_block, SYNONYMS) is not None:
+        definition.synonyms = parse_synonym(def_block)
+    if find(def_block, SEE_ALSO) is not None or find(def_block, SEE_ALSO_LMT) is not None:
+        definition.see_also = parse_see_also(def_block)
+    if find(def_block, COMPARE_LMT) is not None or find(def_block, COMPARE) is not None:
+        definition.compare = parse_compare(def_block)
+    if find(def_block, USAGE_NOTE) is not None:
+        definition.usage_note = parse_usage_note(def_block)
 
 
 def parse_idiom(block):
-    if block.find("div", "xref idiom hax dxref-w lmt-25 lmb-25"):
-        idiom_block = block.find("div", "xref idiom hax dxref-w lmt-25 lmb-25")
+    if find(block, IDIOM) is not None:
+        idiom_block = find(block, IDIOM)
     else:
-        idiom_block = block.find("div", "xref idioms hax dxref-w lmt-25 lmb-25")
+        idiom_block = find(block, IDIOMS)
 
     if idiom_block is not None:
-        idiom_title = idiom_block.h3.text.upper()
-        console.print("[bold #757575]" + "\n" + idiom_title)
-        for idiom in idiom_block.find_all(
-            "div",
-            [
-                "item lc lc1 lpb-10 lpr-10",
-                "item lc lc1 lc-xs6-12 lpb-10 lpr-10",
-            ],
-        ):
-            idiom = idiom.text
-            console.print("[#757575]" + "  • " + idiom)
+        idiom_title = text(find(idiom_block, H3)).upper()
+        idioms = XREF_ITEMS(idiom_block)
+        return Xref(idiom_title, [text(idiom) for idiom in idioms])
 
 
 def parse_sole_idiom(block):
-    idiom_sole_meaning = block.find("div", "def ddef_d db")
+    idiom = Idiom()
+    idiom_sole_meaning = find(block, MEANING)
     if idiom_sole_meaning is not None:
-        print("\033[34m" + idiom_sole_meaning.text + "\033[0m")
-    parse_example(block)
-    parse_see_also(block)
+        idiom.meaning = text(idiom_sole_meaning)
+    parse_example(block, idiom.examples)
+    idiom.see_also = parse_see_also(block)
+    return idiom
 
 
 def parse_phrasal_verb(block):
-    if block.find("div", "xref phrasal_verbs hax dxref-w lmt-25 lmb-25"):
-        pv_block = block.find("div", "xref phrasal_verbs hax dxref-w lmt-25 lmb-25")
+    if find(block, PHRASAL_VERBS) is not None:
+        pv_block = find(block, PHRASAL_VERBS)
     else:
-        pv_block = block.find("div", "xref phrasal_verb hax dxref-w lmt-25 lmb-25")
+        pv_block = find(block, PHRASAL_VERB)
 
     if pv_block is not None:
-        pv_title = pv_block.h3.text.upper()
-        console.print("[bold #757575]" + "\n" + pv_title)
-        for pv in pv_block.find_all(
-            "div",
-            ["item lc lc1 lc-xs6-12 lpb-10 lpr-10", "item lc lc1 lpb-10 lpr-10"],
-        ):
-            pv = pv.text
-            console.print("[#757575]" + "  • " + pv)
-
-
-def parse_dict_body(block):
-    subblocks = block.find_all("div", ["pr dsense", "pr dsense dsense-noh"])
-
-    if subblocks:
-        for subblock in subblocks:
-            if subblock.find("h3", "dsense_h"):
-                parse_def_title(subblock)
-
-            for child in subblock.find("div", "sense-body dsense_b").children:
-                try:
-                    if child.attrs["class"] == ["def-block", "ddef_block"]:
-                        parse_def(child)
-
-                    if child.attrs["class"] == [
-                        "pr",
-                        "phrase-block",
-                        "dphrase-block",
-                        "lmb-25",
-                    ] or child.attrs["class"] == ["pr", "phrase-block", "dphrase-block"]:
-                        parse_ptitle(child)
-
-                        for i in child.find_all("div", "def-block ddef_block"):
-                            parse_def(i)
-                except Exception:
-                    pass
+        pv_title = text(find(pv_block, H3)).upper()
+        pvs = XREF_ITEMS(pv_block)
+        return Xref(pv_title, [text(pv) for pv in pvs])
 
-    else:
-        if block.find("div", "idiom-block"):
-            idiom_sole_block = block.find("div", "idiom-block")
-            parse_sole_idiom(idiom_sole_block)
-
-    if block.find(
-        "div",
-        [
-            "xref idiom hax dxref-w lmt-25 lmb-25",
-            "xref idioms hax dxref-w lmt-25 lmb-25",
-        ],
-    ):
-        parse_idiom(block)
-
-    if block.find(
-        "div",
-        [
-            "xref phrasal_verbs hax dxref-w lmt-25 lmb-25",
-            "xref phrasal_verb hax dxref-w lmt-25 lmb-25",
-        ],
-    ):
-        parse_phrasal_verb(block)
+
+def parse_sense(subblock):
+    sense = Sense()
+
+    if find(subblock, SENSE_TITLE) is not None:
+        sense.title = parse_def_title(subblock)
+
+    for child in find(subblock, SENSE_BODY):
+        try:
+            if get_classes(child) == ["def-block", "ddef_block"]:
+                parse_def(child, sense.items)
+
+            if get_classes(child) == [
+                "pr",
+                "phrase-block",
+                "dphrase-block",
+                "lmb-25",
+            ] or get_classes(child) == ["pr", "phrase-block", "dphrase-block"]:
+                phrase = parse_ptitle(child)
+                sense.items.append(phrase)
+
+                for i in DEF_BLOCKS(child):
+                    parse_def(i, phrase.definitions)
+        except Exception:
+            pass
+
+    return sense
+
+
+def parse_dict_body(block, b):
+    subblocks = SENSES(block)
+
+    for subblock in subblocks:
+        b.senses.append(parse_sense(subblock))
+
+    parse_block_tail(block, b, has_senses=bool(subblocks))
+
+
+def parse_block_tail(block, b, has_senses):
+    """Parse what follows the senses of a block: the meaning of an idiom page without senses, idioms and phrasal verbs."""
+
+    if not has_senses:
+        if find(block, SOLE_IDIOM) is not None:
+            idiom_sole_block = find(block, SOLE_IDIOM)
+            b.idiom = parse_sole_idiom(idiom_sole_block)
+
+    if find(block, IDIOM) is not None or find(block, IDIOMS) is not None:
+        b.idioms = parse_idiom(block)
+
+    if find(block, PHRASAL_VERBS) is not None or find(block, PHRASAL_VERB) is not None:
+        b.phrasal_verbs = parse_phrasal_verb(block)
 
 
 # ----------Parse Dict Name----------
 def parse_dict_name(first_dict):
-    dict_info = replace_all(first_dict.small.text).strip("(").strip(")")
+    dict_info = replace_all(text(find(first_dict, SMALL))).strip("(").strip(")")
     dict_name = dict_info.split("©")[0]
     dict_name = dict_name.split("the")[-1]
-    console.print(f"[#757575]{dict_name}", justify="right")
+    return dict_name
@@ -1,134 +1,611 @@
-"""Shared functionality of all dictionaries."""
+"""
+Shared functionality of all dictionaries.
+The dictionaries and the networking libraries are imported where they are used,
+so that e.g. a Cambridge lookup from cache imports neither lxml for Webster nor requests.
+"""
 
+import io
 import sys
+import atexit
+import time
+import datetime
+import hashlib
 import sqlite3
-import requests
-from fake_user_agent import user_agent
+import contextlib
+import functools
+import threading
 
-from ..cache import insert_into_table, get_cache, delete_word
+from ..cache import (
+    insert_into_table,
+    insert_aliases,
+    insert_spell_words,
+    get_cache,
+    get_response_text,
+    get_spell_candidates,
+    get_validators,
+    get_content_hash,
+    update_entry,
+    update_validators,
+    content_hash,
+    insert_miss,
+    get_miss,
+    delete_misses,
+    insert_render,
+    get_render,
+)
 from ..log import logger
-from ..settings import OP, DICTS
-from ..errors import call_on_error
-from ..dicts import cambridge, webster
-from ..utils import make_a_soup
-from ..console import console
+from .. import settings
+from ..settings import OP, DICTS, VERSION
+from ..errors import NoResultError, FetchError, NotRecordedError
+from ..retry import RetryPolicy
+from ..utils import make_a_tree, get_request_url
+from ..console import console, make_batch_table
+from ..entry import ENTRY_VERSION, dumps, loads
+from ..timings import span, timed
+from .. import transport
 
 
-def fetch(url, session):
-    """Make a web request with retry mechanism."""
+# One session for the whole process, e.g. for the lookups of the daemon, the words of a batch
+# and the suggestion picked after a word not found, so that connections are kept alive and reused
+session = None
+user_agent = None
+lock = threading.Lock()
 
-    ua = user_agent()
-    headers = {"User-Agent": ua}
-    session.headers.update(headers)
+# The connections kept alive to each host, enough for the default jobs of a batch;
+# more fetching at the same time open connections that are closed after use
+POOL_HOSTS = 4
+POOL_MAXSIZE = 16
+
+# The seconds a process waits on exit for the pages refreshing in the background, which are dropped after that
+REFRESH_GRACE = 1.0
+
+
+def get_session():
+    """Return the session shared by all fetches, made once in a thread-safe way."""
+
+    global session
+    if session is None:
+        with lock:
+            if session is None:
+                import requests
+                from ..timings import timed_adapter
+
+                s = requests.Session()
+                s.trust_env = False   # not to use proxy
+                s.mount("http://", timed_adapter(pool_connections=POOL_HOSTS, pool_maxsize=POOL_MAXSIZE))
+                s.mount("https://", timed_adapter(pool_connections=POOL_HOSTS, pool_maxsize=POOL_MAXSIZE))
+                session = s
+    return session
+
+
+def get_user_agent():
+    """Return the user agent sent with every fetch of the session, picked once."""
+
+    global user_agent
+    if user_agent is None:
+        with lock:
+            if user_agent is None:
+                from fake_user_agent import user_agent as random_user_agent
+                user_agent = random_user_agent()
+    return user_agent
+
+
+@timed(OP.FETCHING.name)
+def fetch(url, session, policy=None, headers=None, make_parser=None):
+    """
+    Make a web request, live or from the fixture store as set in `transport`, with extra `headers` if any,
+    retrying as the policy decides. Raise FetchError if it can't be made.
+
+    With `make_parser`, e.g. returning a `utils.SubtreeParser`, the body of a page found is parsed as it downloads
+    by a parser made for each attempt, and only downloaded as far as the parser needs. The tree is set as `r.tree`.
+    What the parser raises, e.g. a bug in printing the senses as they're parsed, is raised as it is, not retried.
+    """
+
+    import requests
+
+    policy = policy or RetryPolicy()
+
+    # Passed along with each request rather than set on the session shared by threads.
+    # Replaying needs no network, not even to get a user agent.
+    headers = dict(headers or {})
+    if transport.mode != "replay":
+        headers["User-Agent"] = get_user_agent()
+    began = time.monotonic()
     attempt = 0
 
     logger.debug(f"{OP.FETCHING.name} {url}")
     while True:
+        attempt += 1
         try:
-            r = session.get(url, timeout=9.05)
-            # Only when calling raise_for_status, will requests raise HTTPError if any.
-            # See: https://blog.csdn.net/Odaokai/article/details/100133503
-            # for webster, only when status code is 404, can we know to redirect to spellcheck page, so you can't exit on 404
-            if r.status_code >= 500:
+            # Stream the body to tell the time to the first byte from that of downloading
+            with span("ttfb", url):
+                r = transport.get(session, url, headers, timeout=9.05)
+            with span("download"):
+                if make_parser is not None and r.status_code == 200:
+                    r.tree = stream_into(r, make_parser())
+                else:
+                    r.content
+            # for webster, only when status code is 404, can we know to redirect to spellcheck page, so you can't fail on 404
+            if r.status_code >= 500 or r.status_code == 429:
                 r.raise_for_status()
-
-        except requests.exceptions.HTTPError as e:
-            attempt = call_on_error(e, url, attempt, OP.RETRY_FETCHING.name)
-            continue
-        except requests.exceptions.ConnectTimeout as e:
-            attempt = call_on_error(e, url, attempt, OP.RETRY_FETCHING.name)
-            continue
-        except requests.exceptions.ConnectionError as e:
-            attempt = call_on_error(e, url, attempt, OP.RETRY_FETCHING.name)
-            continue
-        except requests.exceptions.ReadTimeout as e:
-            attempt = call_on_error(e, url, attempt, OP.RETRY_FETCHING.name)
-            continue
-        except Exception as e:
-            attempt = call_on_error(e, url, attempt, OP.RETRY_FETCHING.name)
-            continue
+        except (requests.exceptions.RequestException, NotRecordedError) as e:
+            delay = policy.backoff(e, attempt, time.monotonic() - began)
+            if delay is None:
+                raise FetchError(url, e, attempt) from e
+            logger.debug(f"{OP.RETRY_FETCHING.name} {url} in {delay:.2f}s after attempt {attempt}: {e}")
+            time.sleep(delay)
         else:
             return r
 
 
-def cache_run(con, cur, input_word, req_url, dict):
-    """Check the cache is from Cambridge or Merrian Webster."""
+def stream_into(r, parser, chunk_size=16384):
+    """Feed the body of the response to the parser chunk by chunk as it downloads, returning the tree parsed."""
+
+    for chunk in r.iter_content(chunk_size, decode_unicode=True):
+        if parser.feed(chunk):
+            # The parser has all it needs, so the rest of the page is left undownloaded,
+            # which closes the connection rather than returning it to the pool
+            r.close()
+            break
+    return parser.close()
+
+
+# Entries looked up again and again, e.g. by the daemon, are decoded only once
+@functools.lru_cache(maxsize=256)
+def load_entry(text):
+    return loads(text)
+
+
+def cache_words(input_word):
+    """Return the words to look the word up by in the cache."""
+
+    # Besides the word and the inflections known from cached pages, try regular plurals
+    words = [input_word]
+    if input_word[-1] == "s":
+        words.append(input_word[:-1])
+    if input_word[-2:] == "es":
+        words.append(input_word[:-2])
+    return words
 
-    # data is a tuple (response_url, response_text) if any
-    data = get_cache(con, cur, input_word, req_url)
 
+def find_cache(con, cur, input_word, dict_url):
+    """Find the cached page of the word in the dictionary if any."""
+
+    return get_cache(con, cur, cache_words(input_word), dict_url)
+
+
+def conditional_headers(cur, input_word, dict_url):
+    """Return the headers to fetch the page cached for the word only if it has changed since."""
+
+    data = get_validators(cur, cache_words(input_word), dict_url)
     if data is None:
-        if "s" != input_word[-1]:
-            return False
+        return {}
+
+    _, etag, last_modified, _ = data
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    return headers
+
+
+def get_response_validators(res):
+    """Return the validators of a response, i.e. (etag, last_modified)."""
+
+    return res.headers.get("ETag"), res.headers.get("Last-Modified")
+
+
+def revalidated(con, cur, input_word, res_url, validators, dict_url, dict):
+    """Print the page cached for the word, which the dictionary tells has not changed, i.e. 304 Not Modified."""
+
+    logger.debug(f'{OP.FOUND.name} "{input_word}" unchanged at {res_url}')
+    data = get_validators(cur, cache_words(input_word), dict_url)
+    if data is not None:
+        # A 304 may leave out the validators unchanged
+        etag, last_modified = validators
+        update_validators(con, cur, data[0], etag or data[1], last_modified or data[2])
+    return cache_run(con, cur, input_word, dict_url, dict, expire=False)
+
+
+def get_age(fetched_at):
+    """Return how the page fetched at the time is served from cache: "fresh", "stale" or "expired"."""
+
+    if fetched_at is None:
+        return "fresh"
+    days = (datetime.datetime.now() - fetched_at).total_seconds() / 86400
+    if days <= settings.MAX_AGE:
+        return "fresh"
+    if days <= settings.MAX_AGE + settings.STALE_WINDOW:
+        return "stale"
+    return "expired"
+
+
+def cache_run(con, cur, input_word, dict_url, dict, expire=True):
+    """
+    Check the cache is from Cambridge or Merrian Webster.
+    A page older than MAX_AGE is printed and then refreshed in the background;
+    one older than STALE_WINDOW after that counts as not cached, unless not to `expire`.
+    """
+
+    # data is a tuple (response_url, response_word, entry, entry_version, fetched_at) if any
+    with span("CACHE_LOOKUP", input_word):
+        data = find_cache(con, cur, input_word, dict_url)
+
+    if data is None:
+        return False
+
+    res_url, fetched_at = data[0], data[4]
+
+    age = get_age(fetched_at)
+    if age == "expired" and expire:
+        logger.debug(f'{OP.NOT_FOUND.name} "{input_word}" in cache, expired since fetched at {fetched_at}')
+        return False
+
+    if not settings.RENDER_CACHE:
+        print_cache(con, cur, data, dict_url, dict)
+    else:
+        theme, width = get_theme(), console.width
+        output = get_render(cur, res_url, theme, width)
+        if output is None:
+            buffer = io.StringIO()
+            try:
+                with contextlib.redirect_stdout(buffer):
+                    print_cache(con, cur, data, dict_url, dict)
+            finally:
+                output = buffer.getvalue()
+                sys.stdout.write(output)
+            insert_render(con, cur, res_url, theme, width, output)
         else:
-            data = get_cache(con, cur, input_word[:-1], req_url)
-            if data is None:
-                if "es" != input_word[-2:]:
-                    return False
-                else:
-                    data = get_cache(con, cur, input_word[:-2], req_url)
-                    if data is None:
-                        return False
+            logger.debug(f"{OP.PRINTING.name} the output cached of {res_url}")
+            with span(OP.PRINTING.name, "cached output"):
+                sys.stdout.write(output)
+        sys.stdout.flush()
+
+    if age == "stale":
+        refresh_in_background(input_word, dict_url, dict)
+    return True
+
+
+def print_cache(con, cur, data, dict_url, dict):
+    """Print the page cached from its entry."""
+
+    from ..dicts import cambridge, webster
+
+    res_url, res_word, res_entry, entry_version, _ = data
 
-    res_url, res_word, res_text = data
+    # Entries cached in an older shape, or before entries were cached at all,
+    # are parsed from the cached html once more and written back for later lookups.
+    entry = None
+    if entry_version == ENTRY_VERSION:
+        entry = load_entry(res_entry)
 
     if DICTS.CAMBRIDGE.name.lower() in res_url:
-        logger.debug(f"{OP.PARSING.name} {res_url}")
-        soup = make_a_soup(res_text)
-        cambridge.parse_and_print(soup, res_url)
+        if entry is None:
+            logger.debug(f"{OP.PARSING.name} {res_url}")
+            tree = make_a_tree(get_response_text(cur, res_url))
+            entry = cambridge.parse_entry(tree, res_url, res_word)
+            update_entry(con, cur, res_url, dumps(entry), ENTRY_VERSION)
+            insert_aliases(con, cur, dict_url, res_url, [], entry.forms())
+        cambridge.print_entry(entry, res_url)
         console.print(f'{OP.FOUND.name} "{res_word}" from {dict} in cache. You can add "-f -w" to fetch the {DICTS.MERRIAM_WEBSTER.name} dictionary', justify="left", style="#757575")
     else:
-        nodes = webster.parse_dict(res_text, True, res_url, False)
-        webster.parse_and_print(nodes, res_url)
+        if entry is None:
+            parsed = webster.parse_dict(get_response_text(cur, res_url), True, res_url, False)
+            entry = webster.parse_entry(parsed.nodes, res_url, res_word)
+            update_entry(con, cur, res_url, dumps(entry), ENTRY_VERSION)
+            insert_aliases(con, cur, dict_url, res_url, [], entry.forms())
+        webster.print_entry(entry, res_url)
         console.print(f'{OP.FOUND.name} "{res_word}" from {dict} in cache. You can add "-f" to fetch the {DICTS.CAMBRIDGE.name} dictionary', justify="left", style="#757575")
-    return True
 
 
-def save(con, cur, input_word, response_word, response_url, response_text):
-    """Save a word info into local DB for cache."""
+def get_theme():
+    """Return what the output of a page depends on besides the page and the terminal width, i.e. the colors and the code."""
+
+    # The console is set up for each command run by the daemon, e.g. by NO_COLOR, so it's read every time
+    return f"{VERSION}:{ENTRY_VERSION}:{console.color_system}:{console.no_color}:{get_colors_digest()}"
+
+
+@functools.lru_cache(maxsize=None)
+def get_colors_digest():
+    from ..colorschemes import webster_color
+
+    colors = sorted((k, v) for k, v in vars(webster_color).items() if not k.startswith("_"))
+    return hashlib.blake2b(repr(colors).encode("utf-8"), digest_size=8).hexdigest()
+
+
+def refresh_in_background(input_word, dict_url, dict):
+    """
+    Refresh the page cached for the word in another thread, not to keep the lookup waiting.
+    The thread doesn't keep the process from exiting either, but for REFRESH_GRACE seconds, see `join_refreshes`.
+    """
+
+    logger.debug(f'{OP.FETCHING.name} "{input_word}" in the background, stale since fetched')
+    thread = threading.Thread(target=refresh, args=(input_word, dict_url, dict), name=f"refresh {input_word}", daemon=True)
+    thread.start()
+
+
+def join_refreshes():
+    """Give the pages refreshing in the background a moment to finish on exit, e.g. those only revalidated."""
+
+    deadline = time.monotonic() + REFRESH_GRACE
+    for thread in threading.enumerate():
+        if thread.name.startswith("refresh "):
+            thread.join(max(0, deadline - time.monotonic()))
+
+
+atexit.register(join_refreshes)
+
+
+def refresh(input_word, dict_url, dict):
+    """Fetch the page of the word again, revalidating the one cached, and update the cache without printing."""
 
     try:
-        insert_into_table(con, cur, input_word, response_word, response_url, response_text)
-    except sqlite3.IntegrityError as error:
-        error_str = str(error)
-        if "UNIQUE constraint" in error_str:
-            # For version v3.6.3 and prior, whose cache db has `response_word` column being UNIQUE
-            # in this case, update the record with the new search result
-            if "response_word" in error_str:
-                delete_word(con, cur, response_word)
-                insert_into_table(con, cur, input_word, response_word, response_url, response_text)
-                logger.debug(f'{OP.UPDATED.name} cache for "{input_word}" with the new search result\n')
-            else:
-                logger.debug(f'{OP.CANCELLED.name} caching "{input_word}", because it has been already cached before\n')
+        refresh_page(input_word, dict_url, dict)
+    except Exception as error:
+        # Not to print it amid or after the output of the lookup
+        logger.debug(f'{OP.FAILED.name} refreshing "{input_word}" - {error!r}')
+
+
+def refresh_page(input_word, dict_url, dict):
+    from ..cache import connect
+    from ..dicts import cambridge
+
+    is_webster = dict == DICTS.MERRIAM_WEBSTER.name
+    is_ch = dict_url == cambridge.CAMBRIDGE_DICT_BASE_URL_CN
+
+    # A connection of its own, as sqlite connections can't be shared by threads
+    con = connect()
+    cur = con.cursor()
+    try:
+        headers = conditional_headers(cur, input_word, dict_url)
+        fetched = fetch_word(input_word, is_webster, is_ch, headers)
+        if fetched is None or not fetched[0]:
+            return
+
+        res_url, res_text, validators = fetched[1]
+        if res_text is None:
+            data = get_validators(cur, cache_words(input_word), dict_url)
+            if data is not None:
+                update_validators(con, cur, data[0], validators[0] or data[1], validators[1] or data[2])
+            logger.debug(f'{OP.UPDATED.name} "{input_word}", unchanged since cached')
+            return
+
+        parsed = parse_page(input_word, res_url, res_text, is_webster)
+        if parsed is not None:
+            response_word, response_text, entry = parsed
+            save(con, cur, input_word, response_word, res_url, response_text, entry, dict_url, validators)
+    finally:
+        cur.close()
+        con.close()
+
+
+@timed(OP.CACHED.name)
+def save(con, cur, input_word, response_word, response_url, response_text, entry, dict_url, validators=(None, None)):
+    """
+    Save a word info and its parsed entry into local DB for cache, along with the words leading to it.
+    A page cached before is replaced only if it has changed; otherwise only its validators are.
+    """
+
+    try:
+        if get_content_hash(cur, response_url) == content_hash(response_text):
+            update_validators(con, cur, response_url, *validators, commit=False)
+            logger.debug(f'{OP.UPDATED.name} the validators of "{response_url}", unchanged since cached')
         else:
-            logger.debug(f'{OP.CANCELLED.name} caching "{input_word}" - {error}\n')
-    except sqlite3.InterfaceError as error:
+            insert_into_table(con, cur, input_word, response_word, response_url, response_text, dumps(entry), ENTRY_VERSION, *validators, commit=False)
+        insert_spell_words(con, cur, [response_word], commit=False)
+        delete_misses(con, cur, [input_word, response_word], dict_url, commit=False)
+        insert_aliases(con, cur, dict_url, response_url, [input_word, response_word], entry.forms())
+    except (sqlite3.IntegrityError, sqlite3.InterfaceError) as error:
+        con.rollback()
         logger.debug(f'{OP.CANCELLED.name} caching "{input_word}" - {error}\n')
 
     else:
         logger.debug(f'{OP.CACHED.name} the search result of "{input_word}"')
 
 
-def print_spellcheck(con, cur, input_word, suggestions, dict, is_ch=False):
-    """Parse and print spellcheck info."""
+def save_all(con, cur, results):
+    """Save the results of words looked up at once into local DB for cache in one transaction."""
+
+    for input_word, response_word, response_url, response_text, entry, dict_url, validators in results:
+        # Several words in the batch, or a word and a page cached before, may lead to the same page, which is replaced
+        insert_into_table(con, cur, input_word, response_word, response_url, response_text, dumps(entry), ENTRY_VERSION, *validators, commit=False)
+        insert_spell_words(con, cur, [response_word], commit=False)
+        delete_misses(con, cur, [input_word, response_word], dict_url, commit=False)
+        insert_aliases(con, cur, dict_url, response_url, [input_word, response_word], entry.forms(), commit=False)
+    con.commit()
+
 
-    if dict == DICTS.MERRIAM_WEBSTER.name:
-        console.print("[red bold]" + input_word.upper() + "[/red bold]" + " you've entered isn't in the " + "[#4A7D95]" + dict + "[/#4A7D95]" + " dictionary.\n")
+def fetch_word(input_word, is_webster, is_ch, headers=None):
+    """Fetch the page of the word for a batch, returning (found, (response_url, response_text, validators)), or None on failure."""
+
+    from ..dicts import cambridge, webster
+
+    try:
+        if is_webster:
+            req_url = get_request_url(webster.WEBSTER_DICT_BASE_URL, input_word, DICTS.MERRIAM_WEBSTER.name)
+            return webster.fetch_webster(req_url, input_word, headers)
+        req_url = get_request_url(cambridge.get_dict_url(is_ch), input_word, DICTS.CAMBRIDGE.name)
+        return cambridge.fetch_cambridge(req_url, input_word, is_ch, headers)
+    except FetchError as error:
+        logger.debug(f'{OP.FAILED.name} fetching "{input_word}" - {error}')
+        return None
+
+
+def parse_page(input_word, res_url, res_text, is_webster):
+    """Parse the fetched page of the word for a batch, returning (response_word, response_text, entry), or None if no result."""
+
+    from ..dicts import cambridge, webster
+
+    try:
+        if is_webster:
+            parsed = webster.parse_dict(res_text, True, res_url, True)
+            if not parsed.response_word:
+                return None
+            entry = webster.parse_entry(parsed.nodes, res_url, parsed.response_word)
+            return parsed.response_word, parsed.sub_text, entry
+
+        tree = cambridge.make_an_entry_tree(res_text)
+        response_word = cambridge.parse_response_word(tree)
+        first_dict = cambridge.parse_first_dict(res_url, tree)
+        entry = cambridge.parse_entry(first_dict, res_url, response_word)
+        return response_word, cambridge.dump_first_dict(first_dict), entry
+    except Exception as error:
+        logger.debug(f'{OP.FAILED.name} parsing "{input_word}" - {error}')
+        return None
+
+
+def batch_run(con, cur, input_words, is_webster=False, is_ch=False, jobs=8):
+    """
+    Look up many words at once. The words not cached are fetched concurrently by at most `jobs` workers,
+    parsed one after another as they arrive, and cached in one transaction. Then prints the status of each word.
+    """
+
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+    from ..dicts import cambridge, webster
+
+    if is_webster:
+        dict_url = webster.WEBSTER_DICT_BASE_URL
     else:
-        console.print("[red bold]" + input_word.upper() + "[/red bold]" + " you've entered isn't in the " + "\033[34m" + dict + "\033[0m" + " dictionary.\n")
+        dict_url = cambridge.get_dict_url(is_ch)
+
+    # status is a tuple (status, response_word) for each word
+    status = {}
+    to_fetch = []
+    for input_word in input_words:
+        data = find_cache(con, cur, input_word, dict_url)
+        if data is not None and get_age(data[5]) != "expired":
+            status[input_word] = (OP.FOUND.name, data[1])
+        elif get_miss(cur, input_word, dict_url) is not None:
+            status[input_word] = (OP.NOT_FOUND.name, "")
+        else:
+            to_fetch.append(input_word)
+
+    results = []
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        futures = {executor.submit(fetch_word, w, is_webster, is_ch): w for w in to_fetch}
+        for future in as_completed(futures):
+            input_word = futures[future]
+            fetched = future.result()
+
+            if fetched is None:
+                status[input_word] = (OP.FAILED.name, "")
+                continue
 
-    for count, sug in enumerate(suggestions):
-        console.print("[bold]%2d" % (count+1), end="")
+            found, page = fetched
+            parsed = None
+            if found:
+                res_url, res_text, validators = page
+                parsed = parse_page(input_word, res_url, res_text, is_webster)
+            else:
+                insert_miss(con, cur, input_word, dict_url, commit=False)
+
+            if parsed is None:
+                status[input_word] = (OP.NOT_FOUND.name, "")
+                continue
+
+            response_word, response_text, entry = parsed
+            results.append((input_word, response_word, res_url, response_text, entry, dict_url, validators))
+            status[input_word] = (OP.CACHED.name, response_word)
+
+    save_all(con, cur, results)
+
+    table = make_batch_table()
+    for index, input_word in enumerate(input_words):
+        op, response_word = status[input_word]
+        table.add_row(str(index + 1), input_word, response_word, op)
+    console.print(table)
+
+    counts = {}
+    for op, _ in status.values():
+        counts[op] = counts.get(op, 0) + 1
+    console.print(", ".join(f"{op} {count}" for op, count in counts.items()))
+
+
+def suggest(cur, input_word):
+    """Suggest the spellings of the word offline, out of the words cached before and the word list, see spell.py."""
+
+    from ..spell import rank
+
+    return rank(input_word, get_spell_candidates(cur, input_word))
+
+
+def is_miss(cur, input_word, dict_url):
+    """Whether the word is cached as not found in the dictionary, within MISS_TTL."""
+
+    if get_miss(cur, input_word, dict_url) is None:
+        return False
+    logger.debug(f'{OP.NOT_FOUND.name} "{input_word}" in cache of the words not found')
+    return True
+
+
+def cached_suggestions(con, cur, input_word, dict_url, fetch_suggestions):
+    """
+    Return the arguments (suggestions, fetch_suggestions) for `print_spellcheck` of the word not found:
+    the suggestions from the dictionary cached for the word, or a function to fetch and cache them.
+    """
+
+    miss = get_miss(cur, input_word, dict_url)
+    if miss is not None and miss[0] is not None:
+        return miss[0], None
+
+    def fetch():
+        suggestions = fetch_suggestions()
+        insert_miss(con, cur, input_word, dict_url, suggestions)
+        return suggestions
+
+    return [], fetch
+
+
+def merge_suggestions(suggestions, more):
+    seen = {sug.lower() for sug in suggestions}
+    return suggestions + [sug for sug in more if sug.lower() not in seen]
+
+
+def print_spellcheck(con, cur, input_word, suggestions, dict, is_ch=False, fetch_suggestions=None):
+    """
+    Print the spelling suggestions for the word not found, the offline ones first, merged with `suggestions` from the dictionary.
+    If there are more to fetch from the dictionary by `fetch_suggestions`, it's done when there are no offline ones, or the user asks.
+    """
+
+    from ..dicts import cambridge, webster
+
+    suggestions = merge_suggestions(suggest(cur, input_word), suggestions)
+
+    if not suggestions and fetch_suggestions is not None:
+        suggestions = fetch_suggestions()
+        fetch_suggestions = None
+
+    if not suggestions:
+        print(NoResultError(dict))
+        sys.exit()
+
+    while True:
         if dict == DICTS.MERRIAM_WEBSTER.name:
-            console.print("[#4A7D95] %s" % sug)
+            console.print("[red bold]" + input_word.upper() + "[/red bold]" + " you've entered isn't in the " + "[#4A7D95]" + dict + "[/#4A7D95]" + " dictionary.\n")
         else:
-            console.print("\033[34m" + " " + sug + "\033[0m")
+            console.print("[red bold]" + input_word.upper() + "[/red bold]" + " you've entered isn't in the " + "[blue]" + dict + "[/blue]" + " dictionary.\n")
 
+        for count, sug in enumerate(suggestions):
+            console.print("[bold]%2d" % (count+1), end="")
+            if dict == DICTS.MERRIAM_WEBSTER.name:
+                console.print("[#4A7D95] %s" % sug)
+            else:
+                console.print("[blue] %s" % sug)
+
+        if fetch_suggestions is not None:
+            console.print(f"\nEnter [bold][NUMBER][/bold] above to look up the word suggestion, [bold][R][/bold] to add suggestions from the {dict} website, press [bold][ENTER][/bold] to toggle dictionary, or [bold][ANY OTHER KEY][/bold] to exit:")
+        else:
+            console.print("\nEnter [bold][NUMBER][/bold] above to look up the word suggestion, press [bold][ENTER][/bold] to toggle dictionary, or [bold][ANY OTHER KEY][/bold] to exit:")
 
-    console.print("\nEnter [bold][NUMBER][/bold] above to look up the word suggestion, press [bold][ENTER][/bold] to toggle dictionary, or [bold][ANY OTHER KEY][/bold] to exit:")
+        key = input("You typed: ")
+        print()
 
-    key = input("You typed: ")
-    print()
+        if key.lower() == "r" and fetch_suggestions is not None:
+            suggestions = merge_suggestions(suggestions, fetch_suggestions())
+            fetch_suggestions = None
+            continue
+        break
 
     if key.isnumeric() and (1 <= int(key) <= len(suggestions)):
         if dict == DICTS.MERRIAM_WEBSTER.name:
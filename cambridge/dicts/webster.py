@@ -1,27 +1,37 @@
 """Fetch, parse, print, and save Webster dictionary."""
 
-import requests
 import threading
 import sys
+from dataclasses import dataclass
+from typing import Any
 from lxml import etree
+from rich.text import Text
 
 from ..console import console
 from ..settings import OP, DICTS
-from ..utils import get_request_url, decode_url
+from ..utils import get_request_url, decode_url, SubtreeParser
 from ..log import logger
 from ..dicts import dict
 from ..colorschemes import webster_color as w_col
-from ..errors import NoResultError
+from ..errors import NoResultError, FetchError
+from ..entry import WebsterEntry, slotted
+from ..render import render
+from ..timings import timed
 
 WEBSTER_BASE_URL = "https://www.merriam-webster.com"
 WEBSTER_DICT_BASE_URL = WEBSTER_BASE_URL + "/dictionary/"
 WEBSTER_WORD_OF_THE_DAY_URL = WEBSTER_BASE_URL + "/word-of-the-day"
 
-sub_text = ""
-res_word = ""
-word_entries = [] # A page may have multiple word entries, e.g. "give away", "giveaway"
-word_forms = [] # A word may have multiple word forms, e.g. "ran", "running", "run", "flies"
-word_types = [] # A word's word types, e.g. "preposition", "adjective"
+
+@slotted
+@dataclass
+class WebsterPage:
+    """What `parse_dict` parses out of a page, kept apart for each page so that pages can be parsed concurrently."""
+
+    nodes: Any = None  # The sections of the entry, the entries including the word, or the spelling suggestions of a word not found
+    response_word: str = ""  # Empty for a page redirected to the entries including the word
+    is_redirect: bool = False  # Whether the page is redirected to the entries including the word, see `parse_redirect`
+    sub_text: str = ""  # The html of the dict section to cache, only for a fresh page
 
 
 def search_webster(con, cur, input_word, is_fresh=False, no_suggestions=False):
@@ -36,94 +46,151 @@ def search_webster(con, cur, input_word, is_fresh=False, no_suggestions=False):
     req_url = get_request_url(WEBSTER_DICT_BASE_URL, input_word, DICTS.MERRIAM_WEBSTER.name)
 
     if not is_fresh:
-        cached = dict.cache_run(con, cur, input_word, req_url, DICTS.MERRIAM_WEBSTER.name)
-        if not cached:
-            fresh_run(con, cur, req_url, input_word, no_suggestions)
+        cached = dict.cache_run(con, cur, input_word, WEBSTER_DICT_BASE_URL, DICTS.MERRIAM_WEBSTER.name)
+        if not cached and dict.is_miss(cur, input_word, WEBSTER_DICT_BASE_URL):
+            # Misses cached by a batch have no suggestions from the page
+            suggestions = dict.get_miss(cur, input_word, WEBSTER_DICT_BASE_URL)[0] or []
+            not_found(con, cur, input_word, suggestions, no_suggestions)
+        elif not cached:
+            try:
+                fresh_run(con, cur, req_url, input_word, no_suggestions)
+            except FetchError:
+                # Serve the page expired in cache, if any, rather than nothing when offline
+                if not dict.cache_run(con, cur, input_word, WEBSTER_DICT_BASE_URL, DICTS.MERRIAM_WEBSTER.name, expire=False):
+                    raise
     else:
         fresh_run(con, cur, req_url, input_word, no_suggestions)
 
 
-def fetch_webster(request_url, input_word):
-    """Get response url and response text for future parsing."""
+def fetch_webster(request_url, input_word, headers=None, stream=False):
+    """
+    Get response url, response text and its validators for future parsing.
+    The response text is None if the page cached is revalidated by the conditional `headers`.
+    With `stream`, a page found is parsed as it downloads, only as far as its "left-content",
+    and the tree of it is returned instead of the text.
+    """
 
-    with requests.Session() as session:
-        session.trust_env = False
-        res = dict.fetch(request_url, session)
+    session = dict.get_session()
+    make_parser = (lambda: SubtreeParser(is_left_content)) if stream else None
+    res = dict.fetch(request_url, session, headers=headers, make_parser=make_parser)
 
-        res_url = res.url
-        res_text = res.text
-        status = res.status_code
+    res_url = res.url
+    status = res.status_code
 
-        if status == 200:
-            logger.debug(f'{OP.FOUND.name} "{input_word}" in {DICTS.MERRIAM_WEBSTER.name} at {res_url}')
-            return True, (res_url, res_text)
+    if status == 200:
+        logger.debug(f'{OP.FOUND.name} "{input_word}" in {DICTS.MERRIAM_WEBSTER.name} at {res_url}')
+        res_text = res.tree if stream else res.text
+        return True, (res_url, res_text, dict.get_response_validators(res))
 
-        # By default Requests will perform location redirection for all verbs except HEAD.
-        # https://requests.readthedocs.io/en/latest/user/quickstart/#redirection-and-history
-        # You don't need to deal with redirection yourself.
-        # if status == 301:
-        #     loc = res.headers["location"]
-        #     new_url = WEBSTER_BASE_URL + loc
-        #     new_res = dict.fetch(new_url, session)
+    elif status == 304:
+        return True, (res_url, None, dict.get_response_validators(res))
 
-        elif status == 404:
-            logger.debug(f'{OP.NOT_FOUND.name} "{input_word}" in {DICTS.MERRIAM_WEBSTER.name}')
-            return False, (res_url, res_text)
+    # By default Requests will perform location redirection for all verbs except HEAD.
+    # https://requests.readthedocs.io/en/latest/user/quickstart/#redirection-and-history
+    # You don't need to deal with redirection yourself.
+    # if status == 301:
+    #     loc = res.headers["location"]
+    #     new_url = WEBSTER_BASE_URL + loc
+    #     new_res = dict.fetch(new_url, session)
 
-        else:
-            logger.error(f'Something went wrong when fetching {request_url} with STATUS: {status}')
-            sys.exit()
+    elif status == 404:
+        logger.debug(f'{OP.NOT_FOUND.name} "{input_word}" in {DICTS.MERRIAM_WEBSTER.name}')
+        return False, (res_url, res.text, dict.get_response_validators(res))
+
+    else:
+        raise FetchError(request_url, f"STATUS {status}", 1)
 
 
 def fresh_run(con, cur, req_url, input_word, no_suggestions=False):
     """Print the result without cache."""
 
-    result = fetch_webster(req_url, input_word)
+    # Refetch the page cached, if any, only if it has changed
+    headers = dict.conditional_headers(cur, input_word, WEBSTER_DICT_BASE_URL)
+    result = fetch_webster(req_url, input_word, headers, stream=True)
     found = result[0]
-    res_url, res_text = result[1]
-    nodes = parse_dict(res_text, found, res_url, True)
+    res_url, page, validators = result[1]
+
+    if page is None:
+        dict.revalidated(con, cur, input_word, res_url, validators, WEBSTER_DICT_BASE_URL, DICTS.MERRIAM_WEBSTER.name)
+        return
+
+    # A page found comes parsed already, that of a word not found as text
+    try:
+        if found:
+            parsed = parse_dict(None, found, res_url, True, tree=page)
+        else:
+            parsed = parse_dict(page, found, res_url, True)
+    except NoResultError as error:
+        print(error)
+        sys.exit()
 
     if found:
-        if res_word:
-            parse_thread = threading.Thread(
-                target=parse_and_print, args=(nodes, res_url,)
+        if parsed.is_redirect:
+            print_entry(parse_redirect(parsed.nodes, res_url), res_url)
+        elif parsed.response_word:
+            entry = parse_entry(parsed.nodes, res_url, parsed.response_word)
+            print_thread = threading.Thread(
+                target=print_entry, args=(entry, res_url,)
             )
-            parse_thread.start()
+            print_thread.start()
 
-            dict.save(con, cur, input_word, res_word, res_url, sub_text)
+            dict.save(con, cur, input_word, parsed.response_word, res_url, parsed.sub_text, entry, WEBSTER_DICT_BASE_URL, validators)
+            print_thread.join()
 
     else:
-        if no_suggestions:
-            sys.exit(-1)
-        else:
-            logger.debug(f"{OP.PRINTING.name} the parsed result of {res_url}")
-            suggestions = []
-            for node in nodes:
-                if node.tag != "h1":
-                    for word in node.itertext():
-                        w = word.strip()
-                        if w.startswith("The"):
-                            continue
-                        else:
-                            sug = w.strip()
-                            suggestions.append(sug)
+        suggestions = parse_suggestions(parsed.nodes, res_url)
+        dict.insert_miss(con, cur, input_word, WEBSTER_DICT_BASE_URL, suggestions)
+        not_found(con, cur, input_word, suggestions, no_suggestions)
+
+
+def not_found(con, cur, input_word, suggestions, no_suggestions=False):
+    """Print the spelling suggestions for the word not found."""
+
+    if no_suggestions:
+        sys.exit(-1)
+    dict.print_spellcheck(con, cur, input_word, suggestions, DICTS.MERRIAM_WEBSTER.name)
+
 
-            dict.print_spellcheck(con, cur, input_word, suggestions, DICTS.MERRIAM_WEBSTER.name)
+def parse_suggestions(nodes, res_url):
+    """Parse the spelling suggestions out of the page for a word not found."""
+
+    logger.debug(f"{OP.PRINTING.name} the parsed result of {res_url}")
+    suggestions = []
+    for node in nodes:
+        if node.tag != "h1":
+            for word in node.itertext():
+                w = word.strip()
+                if w.startswith("The"):
+                    continue
+                else:
+                    sug = w.strip()
+                    suggestions.append(sug)
+    return suggestions
 
 
 def get_wod():
     result = fetch_webster(WEBSTER_WORD_OF_THE_DAY_URL, "")
     found = result[0]
     if found:
-        res_url, res_text = result[1]
+        res_url, res_text, _ = result[1]
         parse_and_print_wod(res_url, res_text)
 
 
 def parse_redirect(nodes, res_url):
+    """Parse the entries including the word, of a page redirected to them, into an entry to print."""
+
     input_word = decode_url(res_url).split("/")[-1]
     count = len(nodes)
-    print("No exact result found.")
-    console.print(f"The following [#4A7D95 bold italic]{count}[/#4A7D95 bold italic] entries include the term [#b22222 bold italic]{input_word}[/#b22222 bold italic].")
+
+    # Redirected pages are printed but not cached, so there is no response word for the entry
+    entry = WebsterEntry()
+    entry.start("redirect")
+    entry.add("No exact result found.", end="\n")
+    entry.add("The following ")
+    entry.add(str(count), "#4A7D95 bold italic")
+    entry.add(" entries include the term ")
+    entry.add(input_word, "#b22222 bold italic")
+    entry.add(".", end="\n")
 
     words = []
     for node in nodes:
@@ -141,26 +208,36 @@ def parse_redirect(nodes, res_url):
         href = elms_in_order["a"].attrib["href"]
         word = href.split("/")[-1]
         words.append(word)
-        print()
-        print_word(word)
-        print()
+        entry.add("\n")
+        print_word(entry, word)
+        entry.add("\n")
 
         # print the definition
-        dtText(elms_in_order["span"], "", 1, "")
-        print()
+        dtText(entry, elms_in_order["span"], "", 1, "")
+        entry.add("\n")
+
+    entry.add(f'\nYou can try "camb -w {words[0]}" for example to get the full definition from the {DICTS.MERRIAM_WEBSTER.name} dictionary', "#757575")
+    return entry
 
-    console.print(f'\nYou can try "camb -w {words[0]}" for example to get the full definition from the {DICTS.MERRIAM_WEBSTER.name} dictionary', \
-                  justify="left", style="#757575", end="")
-    print_dict_name()
 
+def is_left_content(element):
+    return element.get("id") == "left-content"
 
-def parse_dict(res_text, found, res_url, is_fresh):
-    """Parse the dict section of the page for the word."""
+
+@timed(OP.PARSING.name, "tree")
+def parse_dict(res_text, found, res_url, is_fresh, tree=None):
+    """
+    Parse the dict section of the page for the word, or of its `tree` if parsed already, into a `WebsterPage`.
+    Raise `NoResultError` if there is neither an entry nor a spelling suggestion.
+    """
 
     logger.debug(f"{OP.PARSING.name} {res_url}")
 
-    parser = etree.HTMLParser(remove_comments=True)
-    tree = etree.HTML(res_text, parser)
+    page = WebsterPage()
+
+    if tree is None:
+        parser = etree.HTMLParser(remove_comments=True)
+        tree = etree.HTML(res_text, parser)
 
     if found:
         sub_tree = tree.xpath('//*[@id="left-content"]')[0]
@@ -177,24 +254,21 @@ def parse_dict(res_text, found, res_url, is_fresh):
         nodes = sub_tree.xpath(s)
 
         if is_fresh:
-            global sub_text
-            sub_text = etree.tostring(sub_tree).decode('utf-8')
+            page.sub_text = etree.tostring(sub_tree, with_tail=False).decode('utf-8')
 
         if len(nodes) == 0:
-            print(NoResultError(DICTS.MERRIAM_WEBSTER.name))
-            sys.exit()
+            raise NoResultError(DICTS.MERRIAM_WEBSTER.name)
 
-        global res_word
         result = tree.xpath("//*[@id='dictionary-entry-1']/div[1]/div/div[1]/h1/text()")
 
         if result:
-            res_word = result[0]
+            page.response_word = result[0]
         else:
             result = tree.xpath("//*[@id='dictionary-entry-1']/div[1]/div/div/h1/span/text()")
             if not result:
-                parse_redirect(nodes, res_url)
+                page.is_redirect = True
             else:
-                res_word = result[0]
+                page.response_word = result[0]
 
         ## NOTE: [only for debug]
         # for node in nodes:
@@ -210,19 +284,20 @@ def parse_dict(res_text, found, res_url, is_fresh):
         if result:
             nodes = result[0]
         else:
-            print(NoResultError(DICTS.MERRIAM_WEBSTER.name))
-            sys.exit()
-    return nodes
+            raise NoResultError(DICTS.MERRIAM_WEBSTER.name)
+
+    page.nodes = nodes
+    return page
 
 
 ###########################################
 # parse and print nearby entries
 ###########################################
 
-def nearby_entries(node):
+def nearby_entries(entry, node):
     """Print entries near value."""
 
-    print()
+    entry.add("\n")
     for elm in node.iterdescendants():
         try:
             has_title = (elm.tag == "h2")
@@ -233,27 +308,27 @@ def nearby_entries(node):
             continue
         else:
             if has_title:
-                console.print(f"[{w_col.bold} {w_col.nearby_title}]{elm.text}", end="")
+                entry.add(elm.text, f"{w_col.bold} {w_col.nearby_title}")
 
             if has_em:
                 word = "".join(list(elm.itertext()))
-                console.print(f"[{w_col.bold} {w_col.italic} {w_col.nearby_em}]{word}", end="\n")
+                entry.add(word, f"{w_col.bold} {w_col.italic} {w_col.nearby_em}", end="\n")
 
             if has_word:
-                console.print(f"[{w_col.nearby_word}]{elm.text}", end="\n")
+                entry.add(elm.text, w_col.nearby_word, end="\n")
 
             if has_nearby:
-                console.print(f"[{w_col.nearby_item}]{elm.text}", end="\n")
+                entry.add(elm.text, w_col.nearby_item, end="\n")
 
 
 ###########################################
 # parse and print synonyms
 ###########################################
 
-def synonyms(node):
+def synonyms(entry, node):
     """Print synonyms."""
 
-    print()
+    entry.add("\n")
 
     for elm in node.iterdescendants():
         try:
@@ -264,10 +339,11 @@ def synonyms(node):
             continue
         else:
             if has_title:
-                console.print(f"[{w_col.bold} {w_col.syn_title}]{elm.text}", end=" ")
+                entry.add(elm.text, f"{w_col.bold} {w_col.syn_title}", end=" ")
 
             if has_label:
-                console.print(f"\n[{w_col.syn_label}]{elm.text}")
+                entry.add("\n")
+                entry.add(elm.text, w_col.syn_label, end="\n")
 
             if has_syn:
                 children = elm.getchildren()
@@ -276,9 +352,9 @@ def synonyms(node):
                 for index, child in enumerate(children):
                     syn = "".join(list(child.itertext())).strip()
                     if index != (total_num - 1):
-                        console.print(f"[{w_col.syn_item}]{syn},", end=" ")
+                        entry.add(f"{syn},", w_col.syn_item, end=" ")
                     else:
-                        console.print(f"[{w_col.syn_item}]{syn}", end=" ")
+                        entry.add(syn, w_col.syn_item, end=" ")
 
 
 ###########################################
@@ -288,7 +364,7 @@ def synonyms(node):
 # NOTE:
 # Wester scrapes the web for examples in the way that it only finds the exact match of the word.
 # If the word is a verb, only gets the word without tenses; if the word is a noun, only its single form.
-def examples(node):
+def examples(entry, node):
     """Print recent examples on the web."""
 
     time = 0
@@ -301,20 +377,22 @@ def examples(node):
             continue
         else:
             if is_title:
-                console.print(f"\n[{w_col.eg_title} {w_col.bold}]{elm.text}", end="")
+                entry.add("\n")
+                entry.add(elm.text, f"{w_col.eg_title} {w_col.bold}")
             if has_aq:
                 texts = list(elm.itertext())
 
                 for index, t in enumerate(texts):
                     if time in [0, 1, 8, 9, 16, 17, 24, 25]:
                         if index == 0:
-                            console.print(f"\n[{w_col.accessory} {w_col.bold}]|", end="")
-                            console.print(f"[{w_col.eg_sentence}]{t}", end="")
+                            entry.add("\n")
+                            entry.add("|", f"{w_col.accessory} {w_col.bold}")
+                            entry.add(t, w_col.eg_sentence)
                         else:
                             hit = False
-                            global word_entries, word_forms
-                            words = set(word_entries)
-                            forms = set(word_forms)
+                            words = set(entry.word_entries)
+                            forms = set(entry.word_forms)
+                            word_types = entry.word_types
                             text = t.strip().lower()
                             for w in words:
                                 if "preposition" in word_types or "adverb" in word_types or "conjuction" in word_types and ("noun" in word_types and text[-1] !="s"):
@@ -331,9 +409,9 @@ def examples(node):
                                     break
 
                             if hit:
-                                console.print(f"[{w_col.eg_sentence} {w_col.bold}]{t}", end="")
+                                entry.add(t, f"{w_col.eg_sentence} {w_col.bold}")
                             else:
-                                console.print(f"[{w_col.eg_sentence}]{t}", end="")
+                                entry.add(t, w_col.eg_sentence)
                     else:
                         continue
                 time = time + 1
@@ -343,52 +421,51 @@ def examples(node):
 # parse and print phrases
 ###########################################
 
-def phrases(node):
+def phrases(entry, node):
     """Print phrases."""
 
-    print()
+    entry.add("\n")
     children = node.getchildren()[1]
     for child in children:
         try:
             if child.attrib["class"] == "drp":
                 if child.getnext().tag == "span":
-                    console.print(f"[{w_col.ph_item} {w_col.bold}]{child.text}", end = "")
+                    entry.add(child.text, f"{w_col.ph_item} {w_col.bold}")
                 else:
-                    console.print(f"[{w_col.ph_item} {w_col.bold}]{child.text}", end = "\n")
+                    entry.add(child.text, f"{w_col.ph_item} {w_col.bold}", end="\n")
 
             if child.attrib["class"] == "vg":
-                vg(child)
+                vg(entry, child)
 
         except KeyError:
             for i in child.getchildren():
                 if i.attrib["class"] == "vl":
-                    print_or_badge(i.text)
+                    print_or_badge(entry, i.text)
                 else:
-                    console.print(f"[{w_col.ph_item} {w_col.bold}]{i.text}", end = "\n")
+                    entry.add(i.text, f"{w_col.ph_item} {w_col.bold}", end="\n")
 
 
 ###########################################
 # parse and print related phrases
 ###########################################
 
-def related_phrases(node):
+def related_phrases(entry, node):
     """Print related phrases."""
 
-    print()
+    entry.add("\n")
 
     children = node.getchildren()
 
     title = children[1]
     texts = list(title.itertext())
-    global word_entries
-    words = set(word_entries)
+    words = set(entry.word_entries)
 
     for t in texts:
         if t.strip():
             if t.lower() in words:
-                console.print(f"[{w_col.rph_em} {w_col.bold} {w_col.italic}]{t}", end="\n")
+                entry.add(t, f"{w_col.rph_em} {w_col.bold} {w_col.italic}", end="\n")
             else:
-                console.print(f"[{w_col.rph_title} {w_col.bold}]{t}", end="")
+                entry.add(t, f"{w_col.rph_title} {w_col.bold}")
 
     pr_sec = children[2]
     sub_ps = pr_sec.getchildren()[1]  # divs: related-phrases-list-container-xs
@@ -406,12 +483,12 @@ def related_phrases(node):
         for t in ts:
             t = t.strip("\n").strip()
             if t != ts[-1]:
-                console.print(f"[{w_col.rph_item}]{t}", end="")
+                entry.add(t, w_col.rph_item)
             else:
                 if phrase != phrases[-1]:
-                    console.print(f"[{w_col.rph_item}]{t},", end=" ")
+                    entry.add(f"{t},", w_col.rph_item, end=" ")
                 else:
-                    console.print(f"[{w_col.rph_item}]{t}", end="\n")
+                    entry.add(t, w_col.rph_item, end="\n")
 
 
 ###########################################
@@ -431,10 +508,10 @@ def get_word_cases(node):
                 u_words.append(i.text)
     return l_words, u_words
 
-def dtText(node, ancestor_attr, count, root_attr=""):
+def dtText(entry, node, ancestor_attr, count, root_attr=""):
     texts = list(node.itertext())
     if count != 1:
-        format_basedon_ancestor(ancestor_attr, prefix="\n", root_attr=root_attr)
+        format_basedon_ancestor(entry, ancestor_attr, prefix="\n", root_attr=root_attr)
 
     l_words = get_word_cases(node)[0]
     u_words = get_word_cases(node)[1]
@@ -443,46 +520,46 @@ def dtText(node, ancestor_attr, count, root_attr=""):
         if text == " " and index == 0:
             continue
         if text == ": ":
-            print_meaning_content(text, end="")
+            print_meaning_content(entry, text, end="")
         elif text == " see also ":
-            print_meaning_keyword(text.strip())
+            print_meaning_keyword(entry, text.strip())
         elif text == " see " or text == " compare ":
-            print_meaning_keyword("->" + text.strip())
+            print_meaning_keyword(entry, "->" + text.strip())
         elif u_words and text in u_words:
             text_new = text.upper()
-            print_meaning_content(text_new, end="")
+            print_meaning_content(entry, text_new, end="")
         elif l_words and text in l_words:
             text_new = (" " + text)
-            print_meaning_content(text_new, end="")
+            print_meaning_content(entry, text_new, end="")
         else:
-            print_meaning_content(text, end="")
+            print_meaning_content(entry, text, end="")
 
-    console.print("", end = " ")
+    entry.add(" ")
 
 
-def print_mw(text, has_tail, tag):
+def print_mw(entry, text, has_tail, tag):
     if tag == "hl":
         if has_tail is True:
-            console.print(f"[{w_col.meaning_sentence} {w_col.bold}]{text}", end = "")
+            entry.add(text, f"{w_col.meaning_sentence} {w_col.bold}")
         else:
-            console.print(f"[{w_col.meaning_sentence} {w_col.bold}]{text}", end = " ")
+            entry.add(text, f"{w_col.meaning_sentence} {w_col.bold}", end=" ")
     if tag == "normal":
         if has_tail is True:
-            console.print(f"[{w_col.meaning_sentence}]{text}", end = "")
+            entry.add(text, w_col.meaning_sentence)
         else:
-            console.print(f"[{w_col.meaning_sentence}]{text}", end = " ")
+            entry.add(text, w_col.meaning_sentence, end=" ")
 
 
-def ex_sent(node, ancestor_attr, root_attr="", num_label_count=1):
+def ex_sent(entry, node, ancestor_attr, root_attr="", num_label_count=1):
     if ancestor_attr:
-        format_basedon_ancestor(ancestor_attr, prefix="\n", root_attr=root_attr)
+        format_basedon_ancestor(entry, ancestor_attr, prefix="\n", root_attr=root_attr)
     else:
-        print("")
+        entry.add("\n")
 
     if num_label_count == 2:
-        print(" ", end="")
+        entry.add(" ")
 
-    console.print(f"[{w_col.accessory} {w_col.bold}]|", end="")
+    entry.add("|", f"{w_col.accessory} {w_col.bold}")
 
     hl_words = []
     ems = []
@@ -503,25 +580,25 @@ def ex_sent(node, ancestor_attr, root_attr="", num_label_count=1):
         if text:
             if t in hl_words:
                 hl_has_tail = ((index != (count - 1)) and (texts[index + 1].strip("\n").strip()) and (not texts[index + 1].strip("\n").strip()[0].isalpha()))
-                print_mw(text, hl_has_tail, "hl")
+                print_mw(entry, text, hl_has_tail, "hl")
             elif t in ems:
                 if index != 0 and texts[index - 1].endswith(" "):
-                    print("", end = " ")
-                console.print(f"[{w_col.meaning_sentence} {w_col.bold}]{text}", end = "")
+                    entry.add(" ")
+                entry.add(text, f"{w_col.meaning_sentence} {w_col.bold}")
                 if index != (count - 1) and texts[index + 1].startswith(" "):
-                    print("", end = " ")
+                    entry.add(" ")
             else:
                 normal_has_tail = (index != (count - 1) and (texts[index + 1] in ems))
-                print_mw(text, normal_has_tail, "normal")
+                print_mw(entry, text, normal_has_tail, "normal")
 
 
-def sub_content_thread(node, ancestor_attr, root_attr="", num_label_count=1):
+def sub_content_thread(entry, node, ancestor_attr, root_attr="", num_label_count=1):
     children = node.getchildren()
     for child in children:
         attr = child.attrib["class"]
 
         if ("ex-sent" in attr) and ("aq has-aq" not in attr):
-            ex_sent(child, ancestor_attr, root_attr, num_label_count)
+            ex_sent(entry, child, ancestor_attr, root_attr, num_label_count)
 
         if "vis" in attr:
             elms = child.getchildren()
@@ -529,13 +606,13 @@ def sub_content_thread(node, ancestor_attr, root_attr="", num_label_count=1):
                 elm = e.getchildren()[0]
                 elm_attr = elm.attrib["class"]
                 if ("ex-sent" in elm_attr) and ("aq has-aq" not in elm_attr):
-                    ex_sent(elm, ancestor_attr, root_attr, num_label_count)
+                    ex_sent(entry, elm, ancestor_attr, root_attr, num_label_count)
 
 
-def extra(node, ancestor_attr, count, root_attr=""):
+def extra(entry, node, ancestor_attr, count, root_attr=""):
     texts = list(node.itertext())
     if count != 1:
-        format_basedon_ancestor(ancestor_attr, prefix="\n", root_attr=root_attr)
+        format_basedon_ancestor(entry, ancestor_attr, prefix="\n", root_attr=root_attr)
 
     l_words = get_word_cases(node)[0]
     u_words = get_word_cases(node)[1]
@@ -544,33 +621,33 @@ def extra(node, ancestor_attr, count, root_attr=""):
         text_new = text.strip("\n").strip()
         if text_new:
             if text_new == "called also" or text_new == "compare":
-                print_meaning_badge("->" + text_new)
+                print_meaning_badge(entry, "->" + text_new)
             elif u_words and text in u_words:
                 text_new = text_new.upper()
-                print_meaning_content(text_new, end="")
+                print_meaning_content(entry, text_new, end="")
             elif l_words and text in l_words:
                 text_new = (" " + text_new)
-                print_meaning_content(text_new, end="")
+                print_meaning_content(entry, text_new, end="")
             elif text_new == ",":
-                print_meaning_content(text_new, end=" ")
+                print_meaning_content(entry, text_new, end=" ")
             else:
-                print_meaning_content(text_new, end="")
+                print_meaning_content(entry, text_new, end="")
 
-    console.print("", end = " ")
+    entry.add(" ")
 
 
-def vi(node, ancestor_attr, root_attr, num_label_count=1):
+def vi(entry, node, ancestor_attr, root_attr, num_label_count=1):
     children = node.getchildren()
     for child in children:
         child_attr = child.get("class")
         if child_attr == "sub-content-thread":
-            sub_content_thread(child, ancestor_attr, root_attr, num_label_count)
+            sub_content_thread(entry, child, ancestor_attr, root_attr, num_label_count)
 
 
-def uns(node, ancestor_attr, root_attr, num_label_count=1):
+def uns(entry, node, ancestor_attr, root_attr, num_label_count=1):
     node_pre = node.getprevious()
     if node_pre is not None and node_pre.get("class") == "sub-content-thread":
-        print()
+        entry.add("\n")
 
     # elms = node.getchildren()[0].getchildren()
     for child in node.iterchildren():
@@ -582,46 +659,46 @@ def uns(node, ancestor_attr, root_attr, num_label_count=1):
                 elm_attr = elm.get("class")
                 if elm_attr == "unText":
                     if num_label_count == 2:
-                        print(" ", end="")
+                        entry.add(" ")
 
                     text = "".join(list(elm.itertext())).strip()
                     if "mdash" in elm.getprevious().attrib["class"]:
                         if node_pre is not None and node_pre.get("class") == "sub-content-thread":
-                            format_basedon_ancestor(ancestor_attr, prefix="", root_attr=root_attr)
-                        print_meaning_arrow("->" + text)
+                            format_basedon_ancestor(entry, ancestor_attr, prefix="", root_attr=root_attr)
+                        print_meaning_arrow(entry, "->" + text)
                     else:
-                        format_basedon_ancestor(ancestor_attr, prefix="", root_attr=root_attr)
-                        print_meaning_badge(text)
+                        format_basedon_ancestor(entry, ancestor_attr, prefix="", root_attr=root_attr)
+                        print_meaning_badge(entry, text)
 
                 if elm_attr == "sub-content-thread":
-                    sub_content_thread(elm, ancestor_attr, root_attr, num_label_count)
+                    sub_content_thread(entry, elm, ancestor_attr, root_attr, num_label_count)
 
                 if elm_attr == "vi":
-                    vi(elm, ancestor_attr, root_attr, num_label_count)
+                    vi(entry, elm, ancestor_attr, root_attr, num_label_count)
 
         if child_attr == "unText":
-            unText_simple(child, ancestor_attr, ancestor_attr, num_label_count)
+            unText_simple(entry, child, ancestor_attr, ancestor_attr, num_label_count)
 
         if child_attr == "vi":
-            format_basedon_ancestor(ancestor_attr, prefix="", root_attr=root_attr)
-            vi(child, ancestor_attr, root_attr, num_label_count)
+            format_basedon_ancestor(entry, ancestor_attr, prefix="", root_attr=root_attr)
+            vi(entry, child, ancestor_attr, root_attr, num_label_count)
 
 
-def unText_simple(node, ancestor_attr, root_attr, num_label_count=1):
+def unText_simple(entry, node, ancestor_attr, root_attr, num_label_count=1):
     node_pre = node.getprevious()
     if node_pre is not None and (node_pre.get("class") == "un" or node_pre.get("class") == "uns"):
-        print()
+        entry.add("\n")
 
     if num_label_count == 2:
-        print(" ", end="")
+        entry.add(" ")
 
     text = list(node.itertext())
-    format_basedon_ancestor(ancestor_attr, prefix="", root_attr=root_attr)
+    format_basedon_ancestor(entry, ancestor_attr, prefix="", root_attr=root_attr)
     for t in text:
-        print_meaning_content(t, end="")
+        print_meaning_content(entry, t, end="")
 
 
-def dt(node, ancestor_attr, self_attr, root_attr="", num_label_count=1):
+def dt(entry, node, ancestor_attr, self_attr, root_attr="", num_label_count=1):
     children = node.getchildren()
     dtText_count = 1
 
@@ -630,31 +707,31 @@ def dt(node, ancestor_attr, self_attr, root_attr="", num_label_count=1):
         if child_attr is not None:
             if child_attr == "sd": # label before meaning content
                 if self_attr == "sdsense":
-                    format_basedon_ancestor(ancestor_attr, prefix="")
+                    format_basedon_ancestor(entry, ancestor_attr, prefix="")
                     if num_label_count == 2:
-                        print(" ", end="")
-                    print_meaning_badge(child.text)
+                        entry.add(" ")
+                    print_meaning_badge(entry, child.text)
                 else:
-                    print_meaning_badge(child.text)
+                    print_meaning_badge(entry, child.text)
             if child_attr == "dtText":
-                dtText(child, ancestor_attr, dtText_count, root_attr)   # only meaning text
+                dtText(entry, child, ancestor_attr, dtText_count, root_attr)   # only meaning text
                 dtText_count += 1
             if child_attr == "uns":
-                uns(child, ancestor_attr, root_attr, num_label_count)
+                uns(entry, child, ancestor_attr, root_attr, num_label_count)
             if child_attr == "sub-content-thread":
-                sub_content_thread(child, ancestor_attr, root_attr, num_label_count)  # example under the meaning
+                sub_content_thread(entry, child, ancestor_attr, root_attr, num_label_count)  # example under the meaning
             if child_attr == "ca" or child_attr == "dx-jump":
-                extra(child, ancestor_attr, dtText_count, root_attr)
+                extra(entry, child, ancestor_attr, dtText_count, root_attr)
             if child_attr == "unText":
-                unText_simple(child, ancestor_attr, root_attr, num_label_count)
+                unText_simple(entry, child, ancestor_attr, root_attr, num_label_count)
             if child_attr == "vi":
-                vi(child, ancestor_attr, root_attr, num_label_count)
+                vi(entry, child, ancestor_attr, root_attr, num_label_count)
 
-    print()
+    entry.add("\n")
 
 
-### sense(node, "sense has-sn", "sb-0 sb-entry, "sb has-num has-let ms-lg-4 ms-3 w-100", 1)
-def sense(node, attr, parent_attr, ancestor_attr, num_label_count=1):
+### sense(entry, node, "sense has-sn", "sb-0 sb-entry, "sb has-num has-let ms-lg-4 ms-3 w-100", 1)
+def sense(entry, node, attr, parent_attr, ancestor_attr, num_label_count=1):
     children = node.getchildren()
 
     # meaning without any sign
@@ -667,37 +744,39 @@ def sense(node, attr, parent_attr, ancestor_attr, num_label_count=1):
 
         if "has-subnum" in ancestor_attr and "sb-0" not in parent_attr:
             if num_label_count == 2:
-                print(" ", end="")
-            console.print(f"  [{w_col.bold} {w_col.meaning_letter}]{sn}", end = " ")
+                entry.add(" ")
+            entry.add("  ")
+            entry.add(sn, f"{w_col.bold} {w_col.meaning_letter}", end=" ")
         else:
-            console.print(f"[{w_col.bold} {w_col.meaning_letter}]{sn}", end = " ")
+            entry.add(sn, f"{w_col.bold} {w_col.meaning_letter}", end=" ")
 
         sense_content = children[1] # class "sense-content w-100"
 
     # meaing with only "b" or "1" + "a" + "(1)", or "1" + "a"
     elif attr == "sense has-sn" or attr == "sen has-sn":
         if num_label_count == 2:
-            print(" ", end="")
+            entry.add(" ")
 
         sn = children[0].getchildren()[0].text
 
         if "has-subnum" in ancestor_attr and "sb-0" in parent_attr:
-            console.print(f"[{w_col.bold} {w_col.meaning_letter}]{sn}", end = " ")
+            entry.add(sn, f"{w_col.bold} {w_col.meaning_letter}", end=" ")
         elif "letter-only" in ancestor_attr:
-            console.print(f"[{w_col.bold} {w_col.meaning_letter}]{sn}", end = " ")
+            entry.add(sn, f"{w_col.bold} {w_col.meaning_letter}", end=" ")
         else:
-            console.print(f"  [{w_col.bold} {w_col.meaning_letter}]{sn}", end = " ")
+            entry.add("  ")
+            entry.add(sn, f"{w_col.bold} {w_col.meaning_letter}", end=" ")
 
         sense_content = children[1] # class "sense-content w-100"
 
     # meaning with only (2)
     elif attr == "sense has-num-only has-subnum-only":
         if num_label_count == 2:
-            print(" ", end="")
+            entry.add(" ")
         if "letter-only" in ancestor_attr:
-            console.print("  ", end="")
+            entry.add("  ")
         else:
-            console.print("    ", end = "")
+            entry.add("    ")
         sense_content = children[1] # class "sense-content w-100"
 
     # meaning with only number
@@ -709,9 +788,9 @@ def sense(node, attr, parent_attr, ancestor_attr, num_label_count=1):
 
     for c in children:
         if c.attrib["class"] == "if":
-            print_class_if(c.text.strip())
+            print_class_if(entry, c.text.strip())
         if "badge mw-badge-gray-100" in c.attrib["class"]:
-            print_meaning_badge(c.text.strip(), end="\n")
+            print_meaning_badge(entry, c.text.strip(), end="\n")
 
     # "sense-content w-100"
     elms = sense_content.getchildren()
@@ -720,43 +799,43 @@ def sense(node, attr, parent_attr, ancestor_attr, num_label_count=1):
         if elm_attr is not None:
             if "badge" in elm_attr:
                 text = "".join(list(elm.itertext())).strip()
-                print_meaning_badge(text)
+                print_meaning_badge(entry, text)
 
             if elm_attr == "dt " or elm_attr == "dt hasSdSense" or elm_attr == "sdsense":
-                dt(elm, attr, elm_attr, ancestor_attr, num_label_count)
+                dt(entry, elm, attr, elm_attr, ancestor_attr, num_label_count)
 
             if elm_attr == "et":
-                et(elm)
+                et(entry, elm)
 
             if elm_attr == "il ":
-                print_meaning_badge(elm.text.strip(), end=" ")
+                print_meaning_badge(entry, elm.text.strip(), end=" ")
 
             if elm_attr == "if":
-                print_class_if(elm.text)
+                print_class_if(entry, elm.text)
 
             if elm_attr == "sgram":
-                print_class_sgram(elm)
+                print_class_sgram(entry, elm)
 
             if elm_attr == "unText":
-                unText_simple(elm, attr, ancestor_attr, num_label_count)
+                unText_simple(entry, elm, attr, ancestor_attr, num_label_count)
 
             if elm_attr == "vi":
-                vi(elm, attr, ancestor_attr, num_label_count)
+                vi(entry, elm, attr, ancestor_attr, num_label_count)
 
         else:
             for i in elm.iterchildren():
                 if i.get("class") == "vl":
-                    print_meaning_badge(i.text.strip())
+                    print_meaning_badge(entry, i.text.strip())
                 elif i.get("class") == "va":
-                    print_class_va(i.text.strip())
+                    print_class_va(entry, i.text.strip())
                 elif "prons-entries-list" in i.get("class"):
                     continue
-                    # print_pron(i)
+                    # print_pron(entry, i)
                 else:
-                    print_meaning_content(i.text, end=" ")
+                    print_meaning_content(entry, i.text, end=" ")
 
 
-def sb_entry(node, parent_attr, num_label_count=1):
+def sb_entry(entry, node, parent_attr, num_label_count=1):
     child = node.getchildren()[0]
     attr = node.attrib["class"]         # "sb-0 sb-entry"
     child_attr = child.attrib["class"]  # "sense has-sn" or "pseq no-subnum"
@@ -764,12 +843,12 @@ def sb_entry(node, parent_attr, num_label_count=1):
         elms = child.getchildren()[0].getchildren()
         for e in elms:
             e_attr = e.attrib["class"]  # "sense has-sn"
-            sense(e, e_attr, attr, parent_attr, num_label_count)        # e.g. sense(child, "sense has-sn", "sb-0 sb-entry", "....", 1)
+            sense(entry, e, e_attr, attr, parent_attr, num_label_count)        # e.g. sense(entry, child, "sense has-sn", "sb-0 sb-entry", "....", 1)
     else:
-        sense(child, child_attr, attr, parent_attr, num_label_count)    # e.g. sense(child, "sense has-sn", "sb-0 sb-entry, "sb has-num has-let ms-lg-4 ms-3 w-100", 1)
+        sense(entry, child, child_attr, attr, parent_attr, num_label_count)    # e.g. sense(entry, child, "sense has-sn", "sb-0 sb-entry, "sb has-num has-let ms-lg-4 ms-3 w-100", 1)
 
 
-def vg_sseq_entry_item(node):
+def vg_sseq_entry_item(entry, node):
     """Print one meaning of one entry(noun entry, adjective entry, or verb entry and so forth). e.g. 1: the monetary worth of something."""
 
     num_label_count = 0
@@ -778,7 +857,7 @@ def vg_sseq_entry_item(node):
         attr = child.attrib["class"]
         # print number label if any
         if attr == "vg-sseq-entry-item-label":
-            console.print(f"[{w_col.bold} {w_col.meaning_num}]{child.text}", end=" ")
+            entry.add(child.text, f"{w_col.bold} {w_col.meaning_num}", end=" ")
             num_label_count = len(child.text)
 
         # print meaning content
@@ -793,80 +872,80 @@ def vg_sseq_entry_item(node):
                             i_attr = i.get("class")
                             if i_attr is not None:
                                 if ("badge mw-badge" in i_attr) or ("il" in i_attr):
-                                    print_meaning_badge(i.text.strip())
+                                    print_meaning_badge(entry, i.text.strip())
                                 if "if" in i_attr:
-                                    print_class_if(i.text)
+                                    print_class_if(entry, i.text)
                                 if i_attr == "et":
-                                    et(i)
-                        print()
+                                    et(entry, i)
+                        entry.add("\n")
                     elif cc_0.tag == "span" and cc_1.tag == "span" and cc_1.attrib["class"] == "sgram":
-                        print_class_sgram(cc_1)
-                        print()
+                        print_class_sgram(entry, cc_1)
+                        entry.add("\n")
                     elif cc_0.tag == "span" and cc_1.tag == "span" and "sl badge mw-badge" in cc_1.attrib["class"]:
-                        print_meaning_badge(cc_1.text, end="\n")
+                        print_meaning_badge(entry, cc_1.text, end="\n")
                     elif cc_0.tag == "span" and cc_1.tag == "span" and cc_1.attrib["class"] == "et":
-                        et(cc_1)
+                        et(entry, cc_1)
                     continue
 
                 # print class "sb-0 sb-entry", "sb-1 sb-entry" ...
-                sb_entry(c, attr, num_label_count)
+                sb_entry(entry, c, attr, num_label_count)
 
-def et(node):
+def et(entry, node):
     for t in node.itertext():
-        print(t.strip("\n"), end= "")
+        entry.add(t.strip("\n"))
 
     if node.getnext() is None:
-        print()
+        entry.add("\n")
     else:
-        print("", end=" ")
+        entry.add(" ")
 
-def vg(node):
+def vg(entry, node):
     """Print one entry(e.g. 1 of 3)'s all meanings. e.g. 1 :the monetary worth of somethng 2 :a fair return... 3 :..."""
 
     children = node.getchildren()
     for child in children:
         # print one meaning of one entry
         if "vg-sseq-entry-item" in child.attrib["class"]:
-            vg_sseq_entry_item(child)
+            vg_sseq_entry_item(entry, child)
 
         # print transitive or intransitive
         if child.attrib["class"] == "vd firstVd" or child.attrib["class"] == "vd":
             e = child.getchildren()[0]
-            console.print(f"[{w_col.bold}]{e.text}")
+            entry.add(e.text, w_col.bold, end="\n")
 
         # print tags like "informal" and the tags at the same livel with transitives
         if "sls" in child.attrib["class"]:
              e = child.getchildren()[0]
-             console.print(f"[{w_col.bold}]{e.text}")
+             entry.add(e.text, w_col.bold, end="\n")
 
 
 # --- parse class "row entry-header" --- #
-def print_word(text):
-    console.print(f"[{w_col.eh_h1_word} {w_col.bold}]{text}", end=" ")
+def print_word(entry, text):
+    entry.add(text, f"{w_col.eh_h1_word} {w_col.bold}", end=" ")
 
 
-def entry_header_content(node):
+def entry_header_content(entry, node):
     """Print entry header content. e.g. value 1 of 3 noun"""
 
     for elm in node.iterchildren():
         if elm.tag == "h1" or elm.tag == "p":
             word = "".join(list(elm.itertext()))
-            global word_entries
-            word_entries.append(word.strip().lower())
-            print_word(word)
+            # A page may have multiple word entries, e.g. "give away", "giveaway"
+            entry.word_entries.append(word.strip().lower())
+            print_word(entry, word)
 
         if elm.tag == "span":
             num = " ".join(list(elm.itertext()))
-            console.print(f"[{w_col.eh_entry_num}]{num}", end=" ")
+            entry.add(num, w_col.eh_entry_num, end=" ")
 
         if elm.tag == "h2":
             type = " ".join(list(elm.itertext()))
-            console.print(f"[{w_col.bold} {w_col.eh_word_type}]{type}", end="\n")
-            global word_types
-            word_types.append(type.strip().lower())
+            entry.add(type, f"{w_col.bold} {w_col.eh_word_type}", end="\n")
+            # A word's word types, e.g. "preposition", "adjective"
+            entry.word_types.append(type.strip().lower())
 
 
-def entry_attr(node):
+def entry_attr(entry, node):
     """Print the pronounciation. e.g. val·​ue |ˈval-(ˌ)yü|"""
 
     for elm in node.iterchildren():
@@ -874,113 +953,112 @@ def entry_attr(node):
             for i in elm.iterchildren():
                 if i.tag == "span" and i.attrib["class"] == "word-syllables-entry":
                     syllables = i.text
-                    console.print(f"{syllables}", end=" ")
+                    entry.add(syllables, end=" ")
 
                 if i.tag == "span" and "prons-entries-list-inline" in i.attrib["class"]:
-                    print_pron(i)
+                    print_pron(entry, i)
 
 
-def row_entry_header(node):
-    """Print class row entry-header, the parent and caller of entry_header_content() and entry_attr()."""
+def row_entry_header(entry, node):
+    """Print class row entry-header, the parent and caller of entry_header_content(entry) and entry_attr(entry)."""
 
     for elm in node.iterchildren():
         if elm.attrib["class"] == "col-12":
             for i in elm.iterchildren():
                 if "entry-header-content" in i.attrib["class"]:
-                    entry_header_content(i)
+                    entry_header_content(entry, i)
                 if "row entry-attr" in i.attrib["class"]:
-                    entry_attr(i)
+                    entry_attr(entry, i)
 
 
 # --- parse class "entry-uros" --- #
-def entry_uros(node):
+def entry_uros(entry, node):
     """Print other word forms. e.g. valueless, valuelessness"""
 
     for elm in node.iterdescendants():
         attr = elm.get("class")
         if attr is not None:
             if elm.tag == "span" and "fw-bold ure" in attr:
-                console.print(f"[{w_col.bold} {w_col.wf}]{elm.text}", end = " ")
+                entry.add(elm.text, f"{w_col.bold} {w_col.wf}", end=" ")
             if elm.tag == "span" and "fw-bold fl" in attr:
                 next_sibling = elm.getnext()
                 if next_sibling is not None and next_sibling.get("class") == "utxt":
-                    console.print(f"[{w_col.bold} {w_col.wf_type}]{elm.text}", end = "")
+                    entry.add(elm.text, f"{w_col.bold} {w_col.wf_type}")
                 else:
-                    console.print(f"[{w_col.bold} {w_col.wf_type}]{elm.text}", end = "\n")
+                    entry.add(elm.text, f"{w_col.bold} {w_col.wf_type}", end="\n")
             if "ins" in attr:
-                print("", end="")
-                print_class_ins(elm)
+                print_class_ins(entry, elm)
             if "utxt" in attr:
                 for i in elm.iterchildren():
                     sub_attr = i.get("class")
                     if sub_attr is not None and sub_attr == "sub-content-thread":
-                        sub_content_thread(i, "", "")
-                print()
+                        sub_content_thread(entry, i, "", "")
+                entry.add("\n")
             if "prons-entries-list" in attr:
-                print_pron(elm)
+                print_pron(entry, elm)
             if "vrs" in attr:
                 # can't get css element ::before.content like "variants" in the word "duel"
                 child = elm.getchildren()[0]
                 for c in child.iterchildren():
                     attr_c = c.get("class")
                     if attr_c == "il " or attr_c == "vl":
-                        print_or_badge(c.text)
+                        print_or_badge(entry, c.text)
                     if attr_c == "va":
                         if c.text is None:
                             for i in child:
-                                print_class_va(i.text)
+                                print_class_va(entry, i.text)
                         else:
-                            print_class_va(c.text)
+                            print_class_va(entry, c.text)
 
                         if c.getnext() is None:
-                            print()
+                            entry.add("\n")
                     if "prons-entries-list" in attr_c:
                         continue
 
 
 # --- parse class "row headword-row header-ins" --- #
-def row_headword_row_header_ins(node):
+def row_headword_row_header_ins(entry, node):
     """Print verb types. e.g. valued; valuing"""
 
     children = node.getchildren()[0].getchildren()[0]
     if "ins" in children.attrib["class"]:
-        print_class_ins(children)
-        print()
+        print_class_ins(entry, children)
+        entry.add("\n")
 
 
 # --- parse class "row headword-row header-vrs" --- #
-def print_vrs(node):
+def print_vrs(entry, node):
     for child in node.iterdescendants():
         attr = child.get("class")
         if attr is not None:
             if "badge mw-badge-gray-100 text-start text-wrap d-inline" in attr:
-                console.print(f"[{w_col.bold} {w_col.italic}]{child.text.strip()}", end="")
+                entry.add(child.text.strip(), f"{w_col.bold} {w_col.italic}")
             elif attr == "il " or attr == "vl":
-                print_or_badge(child.text)
+                print_or_badge(entry, child.text)
             elif attr == "va":
                 if child.text is None:
                     for i in child:
-                        print_class_va(i.text)
+                        print_class_va(entry, i.text)
                 else:
-                    print_class_va(child.text)
+                    print_class_va(entry, child.text)
             elif "prons-entries-list" in attr:
-                print_pron(child)
+                print_pron(entry, child)
             else:
                 continue
-                # console.print(f"{child.text}", end="")
+                # entry.add(child.text)
 
 
-def row_headword_row_header_vrs(node):
+def row_headword_row_header_vrs(entry, node):
     """Print word variants. e.g. premise variants or less commonly premiss"""
 
     children = node.getchildren()[0].getchildren()[0] # class "entry-attr vrs"
-    print_vrs(children)
+    print_vrs(entry, children)
     if not node.getnext().get("class") == "row headword-row header-ins":
-        print()
+        entry.add("\n")
 
 
 # --- parse class "dxnls" --- #
-def dxnls(node):
+def dxnls(entry, node):
     """Print dxnls section, such as 'see also', 'compare' etc."""
 
     texts = list(node.itertext())
@@ -989,56 +1067,58 @@ def dxnls(node):
         if not text:
             continue
         if text == "see also":
-            console.print(f"\n[{w_col.bold} {w_col.dxnls_content}]{text.upper()}", end = " ")
+            entry.add("\n")
+            entry.add(text.upper(), f"{w_col.bold} {w_col.dxnls_content}", end=" ")
         elif text == "compare":
-            console.print(f"\n[{w_col.bold} {w_col.dxnls_content}]{text.upper()}", end = " ")
+            entry.add("\n")
+            entry.add(text.upper(), f"{w_col.bold} {w_col.dxnls_content}", end=" ")
         elif text == ",":
-            console.print(f"[{w_col.dxnls_content}]{text}", end = " ")
+            entry.add(text, w_col.dxnls_content, end=" ")
         else:
-            console.print(f"[{w_col.dxnls_content}]{text}", end = "")
+            entry.add(text, w_col.dxnls_content)
 
-    print()
+    entry.add("\n")
 
 
 # --- parse class "dictionary-entry-[number]" --- #
-def dictionary_entry(node):
+def dictionary_entry(entry, node):
     """Print one entry of the word and its attributes like plural types, pronounciations, tenses, etc."""
 
-    print()
+    entry.add("\n")
 
     for elm in node.iterchildren():
         try:
             if elm.attrib["class"]:
                 if "row entry-header" in elm.attrib["class"]:
-                    row_entry_header(elm)
+                    row_entry_header(entry, elm)
 
                 if elm.attrib["class"] == "row headword-row header-ins":
-                    row_headword_row_header_ins(elm)
+                    row_headword_row_header_ins(entry, elm)
 
                 if elm.attrib["class"] == "row headword-row header-vrs":
-                    row_headword_row_header_vrs(elm)
+                    row_headword_row_header_vrs(entry, elm)
 
                 if elm.attrib["class"] == "vg":
-                    vg(elm)
+                    vg(entry, elm)
 
                 if "entry-uros" in elm.attrib["class"]:
-                    entry_uros(elm)
+                    entry_uros(entry, elm)
 
                 if elm.attrib["class"] == "dxnls":
-                    dxnls(elm)
+                    dxnls(entry, elm)
 
                 if elm.attrib["class"] == "mt-3":
                     badge = elm.getchildren()[0]  # class "lbs badge mw-badge-gray-100 text-start text-wrap d-inline"
-                    print_header_badge(badge.text, end="\n")
+                    print_header_badge(entry, badge.text, end="\n")
 
                 if elm.attrib["class"] == "cxl-ref":
                     text = list(elm.itertext())
-                    print_meaning_content(":", end="")
+                    print_meaning_content(entry, ":", end="")
                     for t in text:
                         t = t.strip()
                         if t:
-                            print_meaning_content(t, end=" ")
-                    print()
+                            print_meaning_content(entry, t, end=" ")
+                    entry.add("\n")
 
         except:
             continue
@@ -1048,47 +1128,47 @@ def dictionary_entry(node):
 # --- print abstractions --- #
 ##############################
 
-def print_meaning_badge(text, end=" "):
-    console.print(f"[{w_col.italic} {w_col.meaning_badge}]{text}", end=end)
+def print_meaning_badge(entry, text, end=" "):
+    entry.add(text, f"{w_col.italic} {w_col.meaning_badge}", end=end)
 
 
-def print_header_badge(text, end=" "):
-    console.print(f"[{w_col.italic} {w_col.meaning_badge}]{text}", end=end)
+def print_header_badge(entry, text, end=" "):
+    entry.add(text, f"{w_col.italic} {w_col.meaning_badge}", end=end)
 
 
-def print_meaning_arrow(text, end=" "):
-    console.print(f"[{w_col.meaning_arrow}]{text}", end=end)
+def print_meaning_arrow(entry, text, end=" "):
+    entry.add(text, w_col.meaning_arrow, end=end)
 
 
-def print_meaning_keyword(text, end=" "):
-    console.print(f"[{w_col.meaning_keyword} {w_col.bold}]{text}", end=end)
+def print_meaning_keyword(entry, text, end=" "):
+    entry.add(text, f"{w_col.meaning_keyword} {w_col.bold}", end=end)
 
 
-def print_meaning_content(text, end=""):
+def print_meaning_content(entry, text, end=""):
     if text == ": ":
-        console.print(f"[{w_col.meaning_content} {w_col.bold}]{text}", end=end)
+        entry.add(text, f"{w_col.meaning_content} {w_col.bold}", end=end)
     else:
-        console.print(f"[{w_col.meaning_content}]{text}", end=end)
+        entry.add(text, w_col.meaning_content, end=end)
 
 
-def format_basedon_ancestor(ancestor_attr, prefix="", suffix="", root_attr=""):
-    console.print(prefix, end="")
+def format_basedon_ancestor(entry, ancestor_attr, prefix="", suffix="", root_attr=""):
+    entry.add(prefix)
     if ancestor_attr == "sense has-sn has-num-only":
-        console.print("  ", end=suffix)
+        entry.add("  ", end=suffix)
     if ancestor_attr == "sense has-sn has-num":
-        console.print("    ", end=suffix)
+        entry.add("    ", end=suffix)
     if ancestor_attr == "sense has-sn":
         if "no-sn letter-only" in root_attr:
-            console.print("  ", end=suffix)
+            entry.add("  ", end=suffix)
         else:
-            console.print("    ", end=suffix)
+            entry.add("    ", end=suffix)
     if ancestor_attr == "sense  no-subnum":
-        console.print("", end=suffix)
+        entry.add("", end=suffix)
     if ancestor_attr == "sense has-num-only has-subnum-only":
-        console.print("    ", end=suffix)
+        entry.add("    ", end=suffix)
 
 
-def print_pron(node):
+def print_pron(entry, node):
     sibling = node.getnext()
     before_semicolon = ((sibling is not None) and (sibling.get("class") == "sep-semicolon"))
     before_or = ((sibling is not None) and (sibling.get("class") == "il "))
@@ -1102,97 +1182,96 @@ def print_pron(node):
     count = len(prons)
     if count == 1:
         if sibling is None:
-            console.print(f"|{prons[0]}|", end="\n")
+            entry.add(f"|{prons[0]}|", end="\n")
         else:
             if before_semicolon or before_or:
-                console.print(f"|{prons[0]}|", end="")
+                entry.add(f"|{prons[0]}|")
             else:
-                console.print(f"|{prons[0]}|", end=" ")
+                entry.add(f"|{prons[0]}|", end=" ")
     if count > 1:
         for index, pron in enumerate(prons):
             if index == 0:
                 if before_semicolon or before_or:
-                    console.print(f"|{pron}|", end="")
+                    entry.add(f"|{pron}|")
                 else:
-                    console.print(f"|{pron}|", end="  ")
+                    entry.add(f"|{pron}|", end="  ")
             elif index == count - 1:
                 if sibling is not None:
-                    console.print(f"[{w_col.eh_word_syllables}]{pron}", end=" ")
+                    entry.add(pron, w_col.eh_word_syllables, end=" ")
                 else:
-                    console.print(f"[{w_col.eh_word_syllables}]{pron}", end="\n")
+                    entry.add(pron, w_col.eh_word_syllables, end="\n")
             elif pron == "," or pron == ";":
                 continue
             else:
                 text = pron + ", "
-                console.print(f"[{w_col.eh_word_syllables}]{text}", end="")
+                entry.add(text, w_col.eh_word_syllables)
 
 
-def print_or_badge(text):
-    console.print(f"[{w_col.or_badge} {w_col.bold}]{text}", end = "")
+def print_or_badge(entry, text):
+    entry.add(text, f"{w_col.or_badge} {w_col.bold}")
 
 
-def print_class_if(text, before_semicolon=False, before_il=False):
+def print_class_if(entry, text, before_semicolon=False, before_il=False):
     if before_semicolon or before_il:
-        console.print(f"[{w_col.bold}]{text}", end="")
+        entry.add(text, w_col.bold)
     else:
-        console.print(f"[{w_col.bold}]{text}", end=" ")
+        entry.add(text, w_col.bold, end=" ")
 
 
-def print_class_va(text):
-    console.print(f"[{w_col.bold}]{text}", end=" ")
+def print_class_va(entry, text):
+    entry.add(text, w_col.bold, end=" ")
 
 
-def print_class_sgram(node):
+def print_class_sgram(entry, node):
     for t in node.itertext():
         text = t.strip("\n").strip()
         if text and text.isalpha():
-            console.print(f"[{w_col.bold}]{t}", end=" ")
+            entry.add(t, w_col.bold, end=" ")
 
 
-def print_class_ins(node):
+def print_class_ins(entry, node):
     """print node whose class name includes ins, such as 'ins', 'vg-ins'."""
     for child in node:
         attr = child.get("class")
         if attr is not None:
             if attr == "il  il-badge badge mw-badge-gray-100":
-                print_header_badge(child.text.strip(), end=" ")
+                print_header_badge(entry, child.text.strip(), end=" ")
             elif attr == "prt-a":
-                print_pron(child)
+                print_pron(entry, child)
             elif attr == "il ":
-                print_or_badge(child.text)
+                print_or_badge(entry, child.text)
             elif attr == "sep-semicolon":
-                console.print(f"{child.text}", end="")
+                entry.add(child.text)
             elif attr == "if":
                 next_sibling = child.getnext()
                 if next_sibling is None:
-                    print_class_if(child.text, before_semicolon=False)
+                    print_class_if(entry, child.text, before_semicolon=False)
                 else:
                     sub_attr = next_sibling.get("class")
                     if sub_attr == "sep-semicolon":
-                        print_class_if(child.text, before_semicolon=True)
+                        print_class_if(entry, child.text, before_semicolon=True)
                     elif sub_attr == "il ":
-                        print_class_if(child.text, before_il=True)
+                        print_class_if(entry, child.text, before_il=True)
                     else:
-                        print_class_if(child.text, before_semicolon=False)
-                global word_forms
-                word_forms.append(child.text.strip().lower())
+                        print_class_if(entry, child.text, before_semicolon=False)
+                # A word may have multiple word forms, e.g. "ran", "running", "run", "flies"
+                entry.word_forms.append(child.text.strip().lower())
             else:
-                console.print(f"{child.text}", end="")
-
-
-def print_dict_name():
-    dict_name = "The Merriam-Webster Dictionary"
-    console.print(f"[{w_col.dict_name}]{dict_name}", justify="right")
+                entry.add(child.text)
 
 
 ###########################################################
-# --- entry point for printing all entries of a word --- #
+# --- entry point for parsing all entries of a word --- #
 ###########################################################
 
-def parse_and_print(nodes, res_url):
-    """Parse and print different sections for the word."""
+@timed(OP.PARSING.name, "entry")
+def parse_entry(nodes, res_url, response_word=""):
+    """Parse different sections for the word into an entry."""
 
-    logger.debug(f"{OP.PRINTING.name} the parsed result of {res_url}")
+    logger.debug(f"{OP.PARSING.name} the sections of {res_url}")
+
+    # The words collected while parsing, e.g. to highlight them in the examples, go into the entry itself
+    entry = WebsterEntry(response_word)
 
     for node in nodes:
         try:
@@ -1201,56 +1280,73 @@ def parse_and_print(nodes, res_url):
             attr = node.attrib["class"]
 
         if "dictionary-entry" in attr:
-            dictionary_entry(node)
+            entry.start(attr)
+            dictionary_entry(entry, node)
 
         if attr == "phrases":
-            phrases(node)
+            entry.start(attr)
+            phrases(entry, node)
 
         if attr == "nearby-entries":
-            nearby_entries(node)
+            entry.start(attr)
+            nearby_entries(entry, node)
 
         if attr == "synonyms":
-            synonyms(node)
+            entry.start(attr)
+            synonyms(entry, node)
 
         if "on-web" in attr:
-            examples(node)
+            entry.start("examples")
+            examples(entry, node)
 
         if attr == "related-phrases":
-            related_phrases(node)
+            entry.start(attr)
+            related_phrases(entry, node)
+
+    return entry
 
-    print_dict_name()
+
+@timed(OP.PRINTING.name)
+def print_entry(entry, res_url):
+    """Print different sections for the word from its entry."""
+
+    logger.debug(f"{OP.PRINTING.name} the parsed result of {res_url}")
+
+    console.print(render(entry))
 
 ######################################################
 # --- printing 'Word of the Day' --- #
 ######################################################
 
-def print_wod_header(node):
+def print_wod_header(out, node):
     for elm in node.iterdescendants():
         attr = elm.get("class")
         if attr == "w-a-title":
             for c in elm.iterchildren():
-                console.print(f"[{w_col.wod_title} {w_col.bold}]{c.text}", end="")
-            print()
+                out.append(f"{c.text}", f"{w_col.wod_title} {w_col.bold}")
+            out.append("\n")
 
         if attr == "word-header-txt":
-            console.print(f"[{w_col.bold}]{elm.text}")
+            out.append(f"{elm.text}", w_col.bold)
+            out.append("\n")
 
         if attr == "main-attr":
-            console.print(f"[{w_col.wod_type}]{elm.text}", end="")
-            print(" | ", end="")
+            out.append(f"{elm.text}", w_col.wod_type)
+            out.append(" | ")
 
         if attr == "word-syllables":
-            console.print(f"[{w_col.wod_syllables}]{elm.text}")
+            out.append(f"{elm.text}", w_col.wod_syllables)
+            out.append("\n")
 
 
-def print_wod_p(node):
+def print_wod_p(out, node):
     text = node.text
     if text:
-        console.print(f"{text}", end="")
+        out.append(f"{text}")
     for child in node.iterchildren():
         if child is not None and child.tag == "em":
-            console.print(f"[{w_col.bold}]{child.text}", end="")
-            console.print(f"{child.tail}", end="")
+            out.append(f"{child.text}", w_col.bold)
+            out.append(f"{child.tail}")
         if child is not None and child.tag == "a":
             child_text = child.text
             child_tail = child.tail
@@ -1258,48 +1354,54 @@ def print_wod_p(node):
                 continue
             else:
                 if child_text is not None:
-                    console.print(f"{child_text}", end="")
+                    out.append(f"{child_text}")
                 for c in child.iterchildren():
                     if c is not None and c.tag == "em":
-                        console.print(f"[{w_col.bold}]{c.text}", end="")
+                        out.append(f"{c.text}", w_col.bold)
 
             if child_tail is not None:
-                console.print(f"{child_tail}", end="")
-    print()
+                out.append(f"{child_tail}")
+    out.append("\n")
 
 
-def print_wod_def(node):
+def print_wod_def(out, node):
     for elm in node.iterchildren():
         tag = elm.tag
 
         if tag == "h2":
             text = elm.text.strip("\n").strip()
             if text:
-                console.print(f"\n[{w_col.wod_subtitle} {w_col.bold}]{text}")
+                out.append("\n")
+                out.append(text, f"{w_col.wod_subtitle} {w_col.bold}")
+                out.append("\n")
             children = list(elm.iterchildren())
             if children:
                 child = children[0]
                 tail = child.tail.strip("\n").strip()
-                console.print(f"[{w_col.wod_subtitle} {w_col.bold}]{child.text}", end=" ")
-                console.print(f"[{w_col.wod_subtitle} {w_col.bold}]{tail}", end="\n")
+                out.append(f"{child.text}", f"{w_col.wod_subtitle} {w_col.bold}")
+                out.append(" ")
+                out.append(tail, f"{w_col.wod_subtitle} {w_col.bold}")
+                out.append("\n")
 
         if tag == "p":
-            print_wod_p(elm)
+            print_wod_p(out, elm)
 
         if tag == "div" and elm.attrib["class"] == "wotd-examples":
             child = elm.getchildren()[0].getchildren()[0]
-            print_wod_p(child)
+            print_wod_p(out, child)
 
 
-def print_wod_dyk(node):
+def print_wod_dyk(out, node):
     for elm in node.iterchildren():
         tag = elm.tag
 
         if tag == "h2":
-            console.print(f"\n[{w_col.wod_subtitle} {w_col.bold}]{elm.text}")
+            out.append("\n")
+            out.append(f"{elm.text}", f"{w_col.wod_subtitle} {w_col.bold}")
+            out.append("\n")
 
         if tag == "p":
-            print_wod_p(elm)
+            print_wod_p(out, elm)
 
 
 def parse_and_print_wod(res_url, res_text):
@@ -1317,14 +1419,17 @@ def parse_and_print_wod(res_url, res_text):
 
     logger.debug(f"{OP.PRINTING.name} the parsed result of {res_url}")
 
+    out = Text(end="")
     for node in nodes:
         attr = node.attrib["class"]
 
         if "header" in attr:
-            print_wod_header(node)
+            print_wod_header(out, node)
 
         if "definition" in attr:
-            print_wod_def(node)
+            print_wod_def(out, node)
 
         if "did-you-know" in attr:
-            print_wod_dyk(node)
+            print_wod_dyk(out, node)
+
+    console.print(out, end="")
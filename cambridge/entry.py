@@ -0,0 +1,223 @@
+"""
+This script defines the structured entries parsed out of dictionary pages.
+An entry is parsed once from the fetched html, cached next to it in JSON, and printed from then on.
+"""
+
+import json
+import typing
+from dataclasses import dataclass, field, fields, is_dataclass, asdict
+from typing import List, Optional, Union
+
+# Bump it whenever the models below or what the parsers put into them change,
+# so that entries cached in an older shape are re-derived from their html.
+ENTRY_VERSION = 3
+
+
+def slotted(cls):
+    """
+    Rebuild a dataclass with `__slots__`, as `dataclass(slots=True)` does on Python 3.10+,
+    so that its instances have no `__dict__`: an entry holds thousands of them.
+    """
+
+    names = tuple(f.name for f in fields(cls))
+    namespace = {k: v for k, v in cls.__dict__.items() if k not in names + ("__dict__", "__weakref__")}
+    namespace["__slots__"] = names
+    new_cls = type(cls)(cls.__name__, cls.__bases__, namespace)
+    new_cls.__qualname__ = cls.__qualname__
+    return new_cls
+
+
+# ----------Cambridge----------
+@slotted
+@dataclass
+class Xref:
+    """A titled list of words, e.g. synonyms, idioms, phrasal verbs, usage notes."""
+
+    title: str = ""
+    items: List[str] = field(default_factory=list)
+
+
+@slotted
+@dataclass
+class SeeAlso:
+    title: str = ""
+    items: List[str] = field(default_factory=list)
+    modifiers: List[str] = field(default_factory=list)
+
+
+@slotted
+@dataclass
+class CompareItem:
+    word: str = ""
+    usage: str = ""
+
+
+@slotted
+@dataclass
+class Compare:
+    title: str = ""
+    items: List[CompareItem] = field(default_factory=list)
+
+
+@slotted
+@dataclass
+class Example:
+    text: str = ""
+    label: str = ""
+    translation: str = ""
+
+
+@slotted
+@dataclass
+class Definition:
+    info: str = ""
+    usage: str = ""
+    meaning: str = ""
+    translation: str = ""
+    in_phrase: bool = False
+    examples: List[Example] = field(default_factory=list)
+    synonyms: Optional[Xref] = None
+    see_also: Optional[SeeAlso] = None
+    compare: Optional[Compare] = None
+    usage_note: Optional[Xref] = None
+
+
+@slotted
+@dataclass
+class Phrase:
+    title: str = ""
+    info: str = ""
+    definitions: List[Definition] = field(default_factory=list)
+
+
+@slotted
+@dataclass
+class Sense:
+    title: str = ""
+    items: List[Union[Definition, Phrase]] = field(default_factory=list)
+
+
+@slotted
+@dataclass
+class Idiom:
+    """An idiom page's sole meaning, which has no senses."""
+
+    meaning: str = ""
+    examples: List[Example] = field(default_factory=list)
+    see_also: Optional[SeeAlso] = None
+
+
+@slotted
+@dataclass
+class Head:
+    word: str = ""
+    pos: str = ""
+    usage: str = ""
+    pron_uk: str = ""
+    pron_us: str = ""
+    inflections: str = ""
+    forms: List[str] = field(default_factory=list)
+    domain: str = ""
+    variants: List[str] = field(default_factory=list)
+    spellvars: List[str] = field(default_factory=list)
+    info: List[str] = field(default_factory=list)
+    has_header: bool = True
+
+
+@slotted
+@dataclass
+class Block:
+    head: Head = field(default_factory=Head)
+    senses: List[Sense] = field(default_factory=list)
+    idiom: Optional[Idiom] = None
+    idioms: Optional[Xref] = None
+    phrasal_verbs: Optional[Xref] = None
+
+
+@slotted
+@dataclass
+class CambridgeEntry:
+    response_word: str = ""
+    blocks: List[Block] = field(default_factory=list)
+    dict_name: str = ""
+
+    def forms(self):
+        """The words and inflections the entry is headed by."""
+
+        return [b.head.word for b in self.blocks] + [f for b in self.blocks for f in b.head.forms]
+
+
+# ----------Webster----------
+@slotted
+@dataclass
+class Section:
+    """
+    A section of a Webster page, e.g. one dictionary entry, synonyms, examples.
+    Webster lays meanings out by deeply nested class names, so a section keeps
+    what the parser made of them as styled runs of text, i.e. [text, style].
+    """
+
+    name: str = ""
+    runs: List[List[str]] = field(default_factory=list)
+
+
+@slotted
+@dataclass
+class WebsterEntry:
+    response_word: str = ""
+    word_entries: List[str] = field(default_factory=list)
+    word_types: List[str] = field(default_factory=list)
+    word_forms: List[str] = field(default_factory=list)
+    sections: List[Section] = field(default_factory=list)
+
+    def forms(self):
+        """The words and inflections the entry is headed by."""
+
+        return self.word_entries + self.word_forms
+
+    def start(self, name):
+        self.sections.append(Section(name))
+
+    def add(self, text, style="", end=""):
+        runs = self.sections[-1].runs
+        for t, s in ((text, style), (end, "")):
+            if not t:
+                continue
+            if runs and runs[-1][1] == s:
+                runs[-1][0] += t
+            else:
+                runs.append([t, s])
+
+
+# ----------Serialization----------
+def dumps(entry):
+    return json.dumps(asdict(entry), ensure_ascii=False, separators=(",", ":"))
+
+
+def loads(text):
+    return _decode(Union[CambridgeEntry, WebsterEntry], json.loads(text))
+
+
+def _decode(tp, data):
+    if data is None:
+        return None
+
+    origin = typing.get_origin(tp)
+    args = typing.get_args(tp)
+
+    if origin is list:
+        return [_decode(args[0], i) for i in data]
+
+    if origin is Union:
+        # Optional[X], or a union of models told apart by their field names
+        models = [a for a in args if a is not type(None)]
+        if len(models) > 1:
+            keys = set(data)
+            models = [m for m in models if keys == {f.name for f in fields(m)}]
+        return _decode(models[0], data)
+
+    if is_dataclass(tp):
+        hints = typing.get_type_hints(tp)
+        return tp(**{k: _decode(hints[k], v) for k, v in data.items()})
+
+    return data
@@ -2,10 +2,6 @@
 This script sets up self-defined errors.
 """
 
-import sys
-
-from .log import logger
-
 
 class ParsedNoneError(Exception):
     def __init__(self, dict_name, response_url):
@@ -23,10 +19,21 @@ class NoResultError(Exception):
         return self.message
 
 
-def call_on_error(error, url, attempt, op):
-    attempt += 1
-    logger.debug(f"{op} {url} {attempt} times")
-    if attempt == 3:
-        print(f"Maximum {op} reached: {error}")
-        sys.exit()
-    return attempt
+class FetchError(Exception):
+    def __init__(self, url, error, attempts):
+        self.url = url
+        self.error = error
+        self.attempts = attempts
+        self.message = f"Failed fetching {url} after {attempts} attempt{'s' if attempts > 1 else ''}: {error}"
+
+    def __str__(self):
+        return self.message
+
+
+class NotRecordedError(Exception):
+    def __init__(self, url, store):
+        self.message = f"No response recorded for {url} in {store}"
+
+    def __str__(self):
+        return self.message
+
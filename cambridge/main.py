@@ -4,13 +4,21 @@ The dictionary data comes from https://dictionary.cambridge.org
 If you're not satisfied with the result, you can try with "-w" flag to look up the word in Merriam-Webster Dictionary.
 """
 
-import sqlite3
+import sys
 
 def main():
+    # Let the daemon run the command if it's running
+    if len(sys.argv) > 1 and sys.argv[1] != "daemon":
+        code = forward(sys.argv[1:])
+        if code is not None:
+            sys.exit(code)
+
+    from cambridge.args import parse_args
+    from cambridge.cache import connect, migrate
+
     try:
-        con = sqlite3.connect(
-            DB, detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES
-        )
+        con = connect()
+        migrate(con)
         cur = con.cursor()
 
         args = parse_args()
@@ -26,15 +34,12 @@ def main():
 
 if __name__ == "__main__":
     import os
-    import sys
 
     sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-    from cambridge.args import parse_args
-    from cambridge.cache import DB
+    from cambridge.daemon import forward
 
     main()
 
 else:
-    from .args import parse_args
-    from .cache import DB
+    from .daemon import forward
@@ -0,0 +1,205 @@
+"""
+This script renders the entries parsed out of dictionary pages for the terminal.
+The parsers only build the entries, see entry.py, and printing them is up to `render`:
+an entry is rendered into one rich renderable, so that it's printed in one write, not line by line.
+"""
+
+from rich.console import Group
+from rich.text import Text
+
+from .entry import CambridgeEntry, Phrase
+
+
+def render(entry):
+    """Return the rich renderable of a Cambridge or Webster entry."""
+
+    if isinstance(entry, CambridgeEntry):
+        return render_cambridge(entry)
+    return render_webster(entry)
+
+
+# ----------Cambridge----------
+def render_dict_head(out, head):
+    if not head.has_header:
+        out.append(head.word, "bold #0A1B27 on #F4F4F4")
+        out.append("\n")
+        if head.info:
+            out.append(f"{head.info[0]} {head.info[1]}\n")
+        return
+
+    if head.pos:
+        out.append("\n")
+        out.append(head.word, "bold #0A1B27 on #F4f4f4")
+        out.append(f"  {head.pos} {head.usage}\n")
+
+    if head.pron_uk:
+        if head.pron_us:
+            out.append("UK " + head.pron_uk + " US " + head.pron_us + "  ")
+        else:
+            out.append("UK " + head.pron_uk + "  ")
+
+    if head.inflections:
+        out.append(head.inflections + "  ")
+
+    if head.domain:
+        out.append(head.domain + "  ")
+
+    for w_var in head.variants:
+        out.append(w_var + "  ")
+
+    for spell_var in head.spellvars:
+        out.append(spell_var + "  ")
+
+    out.append("\n")
+
+
+def render_def_title(out, d_title):
+    out.append("\n" + d_title + "\n", "#ff8c00")
+
+
+def render_ptitle(out, phrase):
+    out.append("\n")
+    out.append("  " + phrase.title, "bold")
+    if phrase.info:
+        out.append(" " + phrase.info)
+    out.append("\n")
+
+
+def render_meaning(out, definition):
+    indent = "  " if definition.in_phrase else ""
+
+    if definition.info:
+        if definition.in_phrase:
+            out.append("  ")
+            out.append(definition.info + " ", "bold")
+        else:
+            out.append(definition.info + " ")
+
+    out.append(indent + definition.usage)
+    out.append(definition.meaning, "blue")
+    out.append("\n")
+
+    # Render the meaning's specific language translation if any
+    if definition.translation:
+        out.append(indent + definition.translation + "\n")
+
+
+def render_example(out, examples):
+    for e in examples:
+        if e.label:
+            out.append("  • ", "#757575")
+            out.append(e.label + " ")
+            out.append(e.text + " " + e.translation + "\n", "#757575")
+        else:
+            out.append("  • " + e.text + " " + e.translation + "\n", "#757575")
+
+
+def render_xref(out, xref, indent="  "):
+    out.append("\n" + indent + xref.title + "\n", "bold #757575")
+    for item in xref.items:
+        out.append("  • " + item + "\n", "#757575")
+
+
+def render_see_also(out, see_also):
+    out.append("\n  " + see_also.title + "\n", "bold")
+    for item in see_also.items:
+        out.append("  " + item, "#757575")
+        out.append(" ")
+    for mod in see_also.modifiers:
+        out.append(mod + " ")
+
+    out.append("\n")
+
+
+def render_compare(out, compare):
+    out.append("\n  " + compare.title + "\n", "bold #757575")
+    for item in compare.items:
+        out.append("  • " + item.word, "#757575")
+        out.append(item.usage + "\n")
+
+
+def render_usage_note(out, usage_note):
+    out.append("\n  " + usage_note.title + "\n", "bold #757575")
+    for item in usage_note.items:
+        out.append("    " + item + "\n", "#757575")
+
+
+def render_def(out, definition):
+    render_meaning(out, definition)
+    render_example(out, definition.examples)
+
+    if definition.synonyms:
+        render_xref(out, definition.synonyms)
+    if definition.see_also:
+        render_see_also(out, definition.see_also)
+    if definition.compare:
+        render_compare(out, definition.compare)
+    if definition.usage_note:
+        render_usage_note(out, definition.usage_note)
+
+
+def render_sole_idiom(out, idiom):
+    if idiom.meaning:
+        out.append(idiom.meaning + "\n", "blue")
+    render_example(out, idiom.examples)
+    if idiom.see_also:
+        render_see_also(out, idiom.see_also)
+
+
+def render_sense(out, sense):
+    if sense.title:
+        render_def_title(out, sense.title)
+
+    for item in sense.items:
+        if isinstance(item, Phrase):
+            render_ptitle(out, item)
+            for definition in item.definitions:
+                render_def(out, definition)
+        else:
+            render_def(out, item)
+
+
+def render_dict_body(out, block):
+    for sense in block.senses:
+        render_sense(out, sense)
+    render_block_tail(out, block)
+
+
+def render_block_tail(out, block):
+    """Render what follows the senses of a block."""
+
+    if block.idiom:
+        render_sole_idiom(out, block.idiom)
+
+    if block.idioms:
+        render_xref(out, block.idioms, indent="")
+
+    if block.phrasal_verbs:
+        render_xref(out, block.phrasal_verbs, indent="")
+
+
+def render_cambridge(entry):
+    return Group(render_cambridge_blocks(entry), render_dict_name(entry.dict_name))
+
+
+def render_cambridge_blocks(entry):
+    out = Text(end="")
+    for block in entry.blocks:
+        render_dict_head(out, block.head)
+        render_dict_body(out, block)
+    return out
+
+
+def render_dict_name(dict_name):
+    return Text.assemble((dict_name, "#757575"), justify="right")
+
+
+# ----------Webster----------
+def render_webster(entry):
+    from .colorschemes import webster_color as w_col
+
+    out = Text(end="")
+    for section in entry.sections:
+        for text, style in section.runs:
+            out.append(text, style)
+    return Group(out, Text.assemble(("The Merriam-Webster Dictionary", w_col.dict_name), justify="right"))
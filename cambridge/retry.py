@@ -0,0 +1,75 @@
+"""
+This script decides whether and when to retry a failed web request.
+Retries back off exponentially with full jitter, wait as long as "Retry-After" asks on 429/503,
+and stop once the deadline of the whole fetch would be passed.
+"""
+
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+# Statuses worth another try; others, e.g. 404 meaning not found, are left to the dictionaries
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+class RetryPolicy:
+    def __init__(self, attempts=4, base=0.5, cap=8.0, deadline=30.0):
+        self.attempts = attempts  # at most, including the first one
+        self.base = base  # seconds to back off after the first attempt, doubled after each one
+        self.cap = cap  # seconds to back off at most
+        self.deadline = deadline  # seconds for all the attempts of a fetch
+
+    def is_retryable(self, error):
+        """Whether the error may go away by trying again, e.g. a timeout, but not e.g. an invalid url or a bad certificate."""
+
+        import requests
+
+        if isinstance(error, requests.exceptions.HTTPError):
+            return error.response is not None and error.response.status_code in RETRY_STATUSES
+        if isinstance(error, requests.exceptions.SSLError):
+            return False
+        return isinstance(
+            error,
+            (
+                requests.exceptions.ConnectionError,
+                requests.exceptions.Timeout,
+                requests.exceptions.ChunkedEncodingError,
+                requests.exceptions.ContentDecodingError,
+            ),
+        )
+
+    def backoff(self, error, attempt, elapsed):
+        """Return the seconds to wait before the next attempt, or None to give up."""
+
+        if attempt >= self.attempts or not self.is_retryable(error):
+            return None
+
+        delay = random.uniform(0, min(self.cap, self.base * 2 ** (attempt - 1)))
+
+        response = getattr(error, "response", None)
+        if response is not None and response.status_code in (429, 503):
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                delay = retry_after
+
+        if elapsed + delay > self.deadline:
+            return None
+        return delay
+
+
+def parse_retry_after(value):
+    """Return the seconds asked to wait by a "Retry-After" header, given either in seconds or as a date."""
+
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return max(0.0, (date - datetime.now(timezone.utc)).total_seconds())
@@ -1,9 +1,52 @@
 """This script contains static data."""
 
+import os
 from enum import Enum
 
 VERSION = "3.8.0"
 
+# A cached page is served as it is for MAX_AGE days since fetched, then served and refreshed in the background
+# for STALE_WINDOW days more, and fetched again before serving after that.
+# Set by the environment variables CAMB_MAX_AGE and CAMB_STALE_WINDOW, e.g. "inf" to never refresh.
+MAX_AGE = 30.0
+STALE_WINDOW = 335.0
+
+# A word not found, along with its spelling suggestions from the dictionary, isn't fetched again for MISS_TTL days.
+# Set by the environment variable CAMB_MISS_TTL.
+MISS_TTL = 1.0
+
+# The output of a page printed from cache is kept as it is, for the latest color scheme and terminal width it was printed at, to be printed at once next time.
+# Set the environment variable CAMB_RENDER_CACHE to 0 not to.
+RENDER_CACHE = True
+
+
+def load():
+    """Read the settings above from the environment, once at import and again for each command run by the daemon."""
+
+    global MAX_AGE, STALE_WINDOW, MISS_TTL, RENDER_CACHE
+    MAX_AGE = get_days("CAMB_MAX_AGE", 30.0)
+    STALE_WINDOW = get_days("CAMB_STALE_WINDOW", 335.0)
+    MISS_TTL = get_days("CAMB_MISS_TTL", 1.0)
+    RENDER_CACHE = os.environ.get("CAMB_RENDER_CACHE", "1") != "0"
+
+
+def get_days(name, default):
+    """Read a number of days from the environment variable, or the default if it isn't set or isn't a number."""
+
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        from .log import logger
+
+        logger.warning(f'{name}="{value}" isn\'t a number of days, using {default:g} instead')
+        return default
+
+
+load()
+
 class OP(Enum):
     FETCHING = 1,
     PARSING = 2,
@@ -15,7 +58,8 @@ class OP(Enum):
     CACHED= 8,
     CANCELLED = 9,
     DELETED = 10,
-    UPDATED = 11
+    UPDATED = 11,
+    FAILED = 12
 
 class DICTS(Enum):
     CAMBRIDGE = 1,
@@ -0,0 +1,56 @@
+"""
+This script suggests spellings for a word not found, offline, out of the words cached before and an optional word list.
+It works like SymSpell: each word is indexed under the strings made by deleting up to MAX_DISTANCE characters
+from its prefix, so the candidates of a misspelled word are the words sharing any of its own deletes.
+"""
+
+MAX_DISTANCE = 2
+PREFIX_LENGTH = 7
+
+
+def deletes(word):
+    """Return the prefix of the word and the strings made by deleting up to MAX_DISTANCE characters from it."""
+
+    prefix = word.lower()[:PREFIX_LENGTH]
+    result = {prefix}
+    edges = {prefix}
+    for _ in range(MAX_DISTANCE):
+        edges = {w[:i] + w[i + 1:] for w in edges for i in range(len(w))}
+        result |= edges
+    return result
+
+
+def distance(a, b):
+    """Damerau-Levenshtein distance between two strings, i.e. counting transposing two adjacent characters as one edit."""
+
+    if a == b:
+        return 0
+
+    prev2 = None
+    prev = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        curr = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = a[i - 1] != b[j - 1]
+            curr[j] = min(prev[j] + 1, curr[j - 1] + 1, prev[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                curr[j] = min(curr[j], prev2[j - 2] + 1)
+        prev2, prev = prev, curr
+    return prev[-1]
+
+
+def rank(word, candidates, limit=10):
+    """
+    Return up to `limit` candidates within MAX_DISTANCE edits of the word, the closest first,
+    preferring the words looked up before to the ones only in the word list.
+    `candidates` are tuples (word, cached).
+    """
+
+    word = word.lower()
+    ranked = []
+    for candidate, cached in candidates:
+        d = distance(word, candidate)
+        if 0 < d <= MAX_DISTANCE:
+            ranked.append((d, not cached, abs(len(candidate) - len(word)), candidate))
+    ranked.sort()
+    return [candidate for *_, candidate in ranked[:limit]]
@@ -0,0 +1,137 @@
+"""
+This script records how long each phase of a lookup takes, e.g. FETCHING, PARSING, PRINTING, CACHED.
+Spans are only recorded after `start()`, i.e. with the "--timings" flag; otherwise `span` costs next to nothing.
+"""
+
+import json
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+
+enabled = False
+spans = []  # A list of (name, detail, start, duration, depth, thread name), in the order they end
+began = 0.0
+local = threading.local()
+
+
+def start():
+    global enabled, began
+    enabled = True
+    began = time.perf_counter()
+    spans.clear()
+
+
+def stop():
+    global enabled
+    enabled = False
+
+
+@contextmanager
+def span(name, detail=""):
+    """Record the time taken by the block as a span, nested in the span it's run within on the same thread."""
+
+    if not enabled:
+        yield
+        return
+
+    depth = getattr(local, "depth", 0)
+    local.depth = depth + 1
+    start_at = time.perf_counter()
+    try:
+        yield
+    finally:
+        end_at = time.perf_counter()
+        local.depth = depth
+        spans.append((name, detail, start_at - began, end_at - start_at, depth, threading.current_thread().name))
+
+
+def timed(name, detail=""):
+    """Record each call of the decorated function as a span."""
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(name, detail):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def report(file=None):
+    """Print the spans in the order they started, then the total time of each top-level phase, to stderr."""
+
+    file = file or sys.stderr
+    ordered = sorted(spans, key=lambda s: s[2])
+
+    print("\nTIMINGS", file=file)
+    for name, detail, start_at, duration, depth, thread in ordered:
+        label = "  " * depth + name + (" " + detail if detail else "")
+        print(f"  {start_at * 1000:8.1f} ms  {duration * 1000:8.1f} ms  {label}  [{thread}]", file=file)
+
+    totals = {}
+    for name, _, _, duration, depth, _ in ordered:
+        if depth == 0:
+            totals[name] = totals.get(name, 0) + duration
+    print("  " + ", ".join(f"{name} {total * 1000:.1f} ms" for name, total in totals.items()), file=file)
+    print(f"  TOTAL {(time.perf_counter() - began) * 1000:.1f} ms", file=file)
+
+
+def dump(path):
+    """Append the spans to a file as JSON lines."""
+
+    with open(path, "a", encoding="utf-8") as f:
+        for name, detail, start_at, duration, depth, thread in sorted(spans, key=lambda s: s[2]):
+            record = {
+                "name": name,
+                "detail": detail,
+                "start_ms": round(start_at * 1000, 3),
+                "duration_ms": round(duration * 1000, 3),
+                "depth": depth,
+                "thread": thread,
+            }
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+def timed_adapter(**kwargs):
+    """
+    Return a requests adapter recording the new connections it makes, i.e. DNS lookup with TCP connect
+    (urllib3 does both in one call), and TLS handshake, which are otherwise hidden in the time to first byte.
+    """
+
+    from requests.adapters import HTTPAdapter
+    from urllib3.connection import HTTPConnection, HTTPSConnection
+    from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+    class TimedHTTPConnection(HTTPConnection):
+        def _new_conn(self):
+            with span("connect", self.host):
+                return super()._new_conn()
+
+    class TimedHTTPSConnection(HTTPSConnection):
+        def _new_conn(self):
+            with span("connect", self.host):
+                return super()._new_conn()
+
+        def connect(self):
+            with span("connect+tls", self.host):
+                return super().connect()
+
+    class TimedHTTPConnectionPool(HTTPConnectionPool):
+        ConnectionCls = TimedHTTPConnection
+
+    class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+        ConnectionCls = TimedHTTPSConnection
+
+    class TimedHTTPAdapter(HTTPAdapter):
+        def init_poolmanager(self, *args, **kwargs):
+            super().init_poolmanager(*args, **kwargs)
+            self.poolmanager.pool_classes_by_scheme = {
+                "http": TimedHTTPConnectionPool,
+                "https": TimedHTTPSConnectionPool,
+            }
+
+    return TimedHTTPAdapter(**kwargs)
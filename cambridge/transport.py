@@ -0,0 +1,122 @@
+"""
+This script makes the web requests of `dict.fetch` in one of three modes:
+"live" requests the web as usual;
+"record" requests the web and saves each response into a fixture store;
+"replay" serves the responses from the fixture store, without network, optionally as slow as a real network.
+
+The mode is "live" by default, and is chosen by the "--record" or "--replay" flag, or by the environment variables:
+CAMB_TRANSPORT      live, record or replay
+CAMB_FIXTURES       the directory of the fixture store, ~/.cache/cambridge/fixtures by default
+CAMB_REPLAY_LATENCY the milliseconds to wait before replaying a response
+CAMB_REPLAY_BANDWIDTH   the KiB per second to replay the body of a response at
+"""
+
+import io
+import json
+import os
+import re
+import threading
+import time
+from pathlib import Path
+
+MODES = ("live", "record", "replay")
+INDEX = "index.json"
+
+mode = "live"
+lock = threading.Lock()
+
+
+def use(new_mode=None):
+    """Set the mode for the following requests, falling back to the environment variable."""
+
+    global mode
+    mode = new_mode or os.environ.get("CAMB_TRANSPORT", "live")
+    if mode not in MODES:
+        raise ValueError(f"Unknown transport {mode!r}, expected one of {', '.join(MODES)}")
+
+
+def get_store():
+    return Path(os.environ.get("CAMB_FIXTURES", Path.home() / ".cache" / "cambridge" / "fixtures"))
+
+
+def load_index(store):
+    """Return the records of the store as {request url: record}."""
+
+    path = store / INDEX
+    if not path.exists():
+        return {}
+    return {record["url"]: record for record in json.loads(path.read_text(encoding="utf-8"))}
+
+
+def get(session, url, headers, timeout):
+    """Request the url in the current mode, returning a `requests.Response`."""
+
+    if mode == "replay":
+        return replay(url)
+
+    r = session.get(url, headers=headers, timeout=timeout, stream=True)
+    if mode == "record":
+        record(url, r)
+    return r
+
+
+def record(url, r):
+    """Save the request url, the final url after redirects, the status and the body of the response into the store."""
+
+    store = get_store()
+    body = r.content
+    name = re.sub(r"[^A-Za-z0-9]+", "_", url.split("://", 1)[-1]).strip("_")[:120] + ".html"
+
+    with lock:
+        store.mkdir(parents=True, exist_ok=True)
+        (store / name).write_bytes(body)
+
+        records = load_index(store)
+        records[url] = {"url": url, "final_url": r.url, "status": r.status_code, "body": name, "encoding": r.encoding}
+
+        # Replace the index at once, not to leave it half written
+        tmp = store / (INDEX + ".tmp")
+        tmp.write_text(json.dumps(list(records.values()), indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+        os.replace(tmp, store / INDEX)
+
+
+class Trickle(io.BytesIO):
+    """A body read no faster than `bandwidth` bytes per second, as if downloaded over a slow network."""
+
+    def __init__(self, body, bandwidth):
+        super().__init__(body)
+        self.bandwidth = bandwidth
+
+    def read(self, size=-1):
+        data = super().read(size)
+        if self.bandwidth:
+            time.sleep(len(data) / self.bandwidth)
+        return data
+
+
+def replay(url):
+    """
+    Build the response recorded for the url, as slow as set by CAMB_REPLAY_LATENCY and CAMB_REPLAY_BANDWIDTH:
+    the response comes after the latency, and its body is streamed at the bandwidth, as it's read.
+    """
+
+    import requests
+    from .errors import NotRecordedError
+
+    store = get_store()
+    rec = load_index(store).get(url)
+    if rec is None:
+        raise NotRecordedError(url, store)
+
+    body = (store / rec["body"]).read_bytes()
+
+    latency = float(os.environ.get("CAMB_REPLAY_LATENCY", 0)) / 1000
+    bandwidth = float(os.environ.get("CAMB_REPLAY_BANDWIDTH", 0)) * 1024
+    time.sleep(latency)
+
+    r = requests.Response()
+    r.url = rec["final_url"]
+    r.status_code = rec["status"]
+    r.encoding = rec.get("encoding") or "utf-8"
+    r.raw = Trickle(body, bandwidth)
+    return r
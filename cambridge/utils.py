@@ -6,14 +6,82 @@ import pstats
 import io
 from urllib import parse
 from functools import wraps
-from bs4 import BeautifulSoup
 
-from .settings import DICTS
+from .settings import DICTS, OP
+from .timings import timed
 
 
-def make_a_soup(text):
-    soup = BeautifulSoup(text, "lxml")
-    return soup
+@timed(OP.PARSING.name, "tree")
+def make_a_tree(text):
+    """Parse the html into an lxml tree, leaving out the comments, which aren't text of the page."""
+
+    from lxml import etree
+
+    return etree.HTML(text, etree.HTMLParser(remove_comments=True))
+
+
+class SubtreeParser:
+    """
+    Parse html fed chunk by chunk only as far as the first `tag` element `match`ed has closed,
+    e.g. the superentry of a Cambridge page, leaving out the rest of the page but the <head>.
+
+    lxml builds the tree in C, and only the events of the `tag` elements are seen here, to find the element.
+    Once it starts, what comes before it is dropped, and once it closes, `feed` returns True:
+    whatever is fed afterwards, e.g. the scripts and footers at the end of the page, needn't be parsed at all.
+    The events of the `tag` elements inside it are passed on to `on_event(event, element)` as they come, if given.
+    """
+
+    def __init__(self, match, tag="div", on_event=None):
+        from lxml import etree
+
+        self.parser = etree.HTMLPullParser(events=("start", "end"), tag=tag, remove_comments=True)
+        self.match = match
+        self.on_event = on_event
+        self.element = None
+        self.done = False
+
+    def feed(self, chunk):
+        """Parse the chunk, returning whether the element matched has closed."""
+
+        self.parser.feed(chunk)
+        for event, element in self.parser.read_events():
+            if self.element is None:
+                if event == "start" and self.match(element):
+                    self.element = element
+                    drop_preceding(element)
+            elif event == "end" and element is self.element:
+                self.done = True
+                break
+            elif self.on_event is not None:
+                self.on_event(event, element)
+        return self.done
+
+    def close(self):
+        """Return the root of the tree, which is the whole page if no element matched."""
+
+        return self.parser.close()
+
+
+def drop_preceding(element):
+    """Remove what comes before the element in its tree, keeping the ancestors and the <head>."""
+
+    while element.getparent() is not None:
+        parent = element.getparent()
+        for sibling in list(element.itersiblings(preceding=True)):
+            if sibling.tag != "head":
+                parent.remove(sibling)
+        element = parent
+
+
+@timed(OP.PARSING.name, "subtree")
+def make_a_subtree(text, match, tag="div", chunk_size=16384):
+    """Parse the html into an lxml tree of only the first `tag` element `match`ed and the <head>, see `SubtreeParser`."""
+
+    parser = SubtreeParser(match, tag)
+    for i in range(0, len(text), chunk_size):
+        if parser.feed(text[i:i + chunk_size]):
+            break
+    return parser.close()
 
 
 def replace_all(string):